@@ -0,0 +1,37 @@
+"""
+Authentication for the Yoruba Language API's admin endpoints.
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import HTTPException, Security
+from fastapi.security import APIKeyHeader
+
+from app.config import settings
+
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+async def require_api_key(
+    api_key: Optional[str] = Security(api_key_header)
+) -> None:
+    """
+    Only let requests carrying the configured ``API_KEY`` through.
+
+    Admin endpoints rewrite data or rebuild in-memory state, so they stay
+    closed when no key is configured.
+    """
+    if not settings.api_key:
+        raise HTTPException(
+            status_code=403,
+            detail="Admin endpoints are disabled; set API_KEY to enable them"
+        )
+    if not api_key or not secrets.compare_digest(
+        api_key.encode(), settings.api_key.encode()
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Missing or invalid X-API-Key header",
+            headers={"WWW-Authenticate": "API-Key"}
+        )
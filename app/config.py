@@ -5,6 +5,8 @@ from typing import Optional, List
 class Settings(BaseSettings):
     # Database settings
     database_url: str = "sqlite:///./yoruba.db"
+    # Defaults to database_url with its async driver (aiosqlite/asyncpg)
+    async_database_url: Optional[str] = None
     
     # API settings
     api_key: Optional[str] = None
@@ -16,11 +18,101 @@ class Settings(BaseSettings):
     # OpenAI settings (for future AI features)
     openai_api_key: Optional[str] = None
     ai_model: str = "gpt-4o"
+    ai_timeout_seconds: float = 20.0
+    # Retries are handled by the resilience layer below, not the SDK
+    ai_max_retries: int = 0
+    ai_max_concurrency: int = 8
+    # Words sent to the AI within this window share one prompt (1 disables)
+    ai_batch_max_size: int = 16
+    ai_batch_window_ms: int = 20
+    # Resilience policies around the AI service (hedge delay 0 disables)
+    ai_deadline_seconds: float = 15.0
+    ai_max_attempts: int = 3
+    ai_retry_backoff_ms: int = 200
+    ai_hedge_delay_ms: int = 0
+    ai_breaker_failure_rate: float = 0.5
+    ai_breaker_window: int = 20
+    ai_breaker_min_calls: int = 5
+    ai_breaker_open_seconds: float = 30.0
+    # Background enrichment queue for translate requests with mode=queue
+    ai_queue_workers: int = 4
+    ai_queue_max_size: int = 1000
+    ai_job_ttl_seconds: int = 3600
     
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
     
+    # Translation index and proverb pool (0 disables the periodic refresh)
+    translation_index_refresh_seconds: int = 60
+    proverb_cache_size: int = 1000
+    
+    # Caches live in Redis when redis_url is set, so every replica shares
+    # them; otherwise each process keeps its own. Replicas notice
+    # invalidations within cache_version_check_seconds.
+    redis_url: Optional[str] = None
+    cache_prefix: str = "yoruba"
+    cache_version_check_seconds: float = 1.0
+    cache_redis_timeout_seconds: float = 0.5
+    
+    # Translation cache
+    translation_cache_size: int = 10000
+    translation_cache_ttl_seconds: int = 3600
+    translation_cache_negative_ttl_seconds: int = 60
+    
+    # ETag/Last-Modified validators remembered per resource, so repeat
+    # conditional GETs get a 304 without a database query
+    validator_cache_size: int = 10000
+    validator_cache_ttl_seconds: int = 300
+    
+    # How long page envelopes reuse a row count
+    count_cache_ttl_seconds: int = 30
+    
+    # Rows written per batch by the bulk importer
+    import_chunk_size: int = 1000
+    export_chunk_size: int = 1000
+    
+    # Tone lexicon: "file" reads tone_lexicon_path (the bundled lexicon
+    # by default), "db" derives it from translations.yoruba_word
+    tone_lexicon_source: str = "file"
+    tone_lexicon_path: Optional[str] = None
+    tone_lexicon_max_entries: int = 200000
+    
+    # Tone marking engines: "lexicon", or "ngram" with a trained model
+    # (see scripts/train_tone_model.py); the budget caps ngram decoding
+    tone_default_engine: str = "lexicon"
+    tone_model_path: Optional[str] = None
+    tone_budget_ms: int = 50
+    
+    # Large texts are marked in a process pool (0 workers uses a thread)
+    # and only stored in the history up to tone_store_max_chars
+    tone_pool_workers: int = 2
+    tone_inline_max_chars: int = 10000
+    tone_text_max_chars: int = 1000000
+    tone_store_max_chars: int = 65536
+    tone_document_chunk_chars: int = 16384
+    tone_document_max_bytes: int = 50000000
+    
+    # /tone-mark/batch limits and its cache of marked texts
+    tone_batch_max_texts: int = 10000
+    tone_cache_size: int = 100000
+    
+    # Tone marking history is buffered and written in bulk; rows beyond
+    # the buffer size are dropped (see /metrics)
+    tone_history_buffer_size: int = 10000
+    tone_history_batch_size: int = 500
+    tone_history_flush_seconds: float = 1.0
+    
+    # History keeps one row per distinct input; the compaction job drops
+    # rows unseen for the retention period and the least recently seen
+    # beyond the row cap (0 disables either)
+    tone_history_retention_days: int = 0
+    tone_history_max_rows: int = 0
+    tone_history_compact_seconds: int = 3600
+    
+    # Maximum number of words accepted by /translate/batch
+    batch_translate_max_words: int = 100
+    
     # Rate limiting (for future implementation)
     rate_limit_per_minute: int = 60
     
@@ -1,8 +1,24 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime
+from sqlalchemy import (
+    create_engine,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 from app.config import settings
+from app.services.normalization import normalize_yoruba
 
 # Create database engine
 engine = create_engine(
@@ -14,16 +30,51 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def get_async_database_url(database_url: str) -> str:
+    """Map a sync database URL onto its async driver."""
+    scheme, _, rest = database_url.partition("://")
+    driver = scheme.split("+")[0]
+    if driver == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if driver in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return database_url
+
+
+# Create async engine and session factory for the API routes
+async_engine = create_async_engine(
+    settings.async_database_url
+    or get_async_database_url(settings.database_url)
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create base class for models
 Base = declarative_base()
 
 
+def _yoruba_normalized_default(context):
+    """Fold yoruba_word on INSERT, for ORM adds and bulk inserts alike."""
+    word = context.get_current_parameters().get("yoruba_word")
+    return normalize_yoruba(word) if word else None
+
+
 class Translation(Base):
     __tablename__ = "translations"
     
     id = Column(Integer, primary_key=True, index=True)
     english_word = Column(String(100), index=True, nullable=False)
     yoruba_word = Column(String(100), nullable=False)
+    yoruba_normalized = Column(
+        String(100), 
+        index=True, 
+        default=_yoruba_normalized_default
+    )
     part_of_speech = Column(String(50))
     example_sentence = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -33,6 +84,17 @@ class Translation(Base):
         onupdate=datetime.utcnow
     )
 
+    __table_args__ = (
+        # Case-insensitive matching of imported words to existing rows
+        Index("ix_translations_english_word_lower", func.lower(english_word)),
+    )
+
+
+@event.listens_for(Translation, "before_update")
+def _refold_yoruba_word(mapper, connection, target):
+    """Keep yoruba_normalized in step when an ORM update edits the word."""
+    target.yoruba_normalized = normalize_yoruba(target.yoruba_word)
+
 
 class Proverb(Base):
     __tablename__ = "proverbs"
@@ -46,12 +108,20 @@ class Proverb(Base):
 
 
 class ToneMarking(Base):
+    """One row per distinct input text (see app.services.tone_history)."""
     __tablename__ = "tone_markings"
+    __table_args__ = (
+        # History pages, newest first
+        Index("ix_tone_markings_last_seen_at_id", "last_seen_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), unique=True, index=True)
     original_text = Column(Text, nullable=False)
     tone_marked_text = Column(Text, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=1)
     created_at = Column(DateTime, default=datetime.utcnow)
+    last_seen_at = Column(DateTime, default=datetime.utcnow)
 
 
 # Dependency to get database session
@@ -61,3 +131,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
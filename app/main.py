@@ -1,20 +1,137 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
+import logging
 import uvicorn
 
-from app.routes import translations, proverbs, tone_marking
-from app.database import engine, Base
+from app.routes import (
+    translations,
+    proverbs,
+    tone_marking,
+    bulk_import,
+    export
+)
+from app.database import async_engine, Base
 from app.config import settings
+from app.services.ai_translation_service import ai_translation_service
+from app.services.bulk_import import ensure_import_key_index
+from app.services.http_cache import (
+    proverb_validators,
+    translate_validators,
+    translation_validators
+)
+from app.services.proverb_search import proverb_search
+from app.services.reverse_lookup import (
+    backfill_yoruba_normalized,
+    ensure_normalized_column
+)
+from app.services.proverb_pool import (
+    load_proverb_pool,
+    refresh_proverb_pool
+)
+from app.services.tone_document import tone_pool
+from app.services.tone_lexicon import reload_tone_lexicon
+from app.services.tone_service import load_tone_model, tone_mark_cache
+from app.services.tone_history import (
+    compact_tone_history,
+    tone_history,
+    upgrade_tone_history
+)
+from app.services.translation_index import (
+    load_translation_index,
+    refresh_translation_index
+)
+from app.services.translation_service import (
+    ai_batcher,
+    ai_translation_flights,
+    enrichment_queue,
+    translation_cache,
+    translation_misses
+)
+from app.services.word_of_the_day import word_of_the_day
+
+logger = logging.getLogger(__name__)
+
+
+async def _refresh_periodically(interval: int):
+    """Pick up translations, proverbs and lexicon changes from elsewhere."""
+    while True:
+        await asyncio.sleep(interval)
+        # Each refresh is tried on its own, so one failing source does
+        # not leave the others stale
+        try:
+            await refresh_translation_index()
+        except Exception as e:
+            logger.error(f"Translation index refresh failed: {str(e)}")
+        try:
+            await refresh_proverb_pool()
+        except Exception as e:
+            logger.error(f"Proverb pool refresh failed: {str(e)}")
+        try:
+            await reload_tone_lexicon(force=False)
+        except Exception as e:
+            logger.error(f"Tone lexicon refresh failed: {str(e)}")
+
+
+async def _compact_periodically(interval: int):
+    """Apply the tone marking history retention limits."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await compact_tone_history(async_engine)
+        except Exception as e:
+            logger.error(f"Tone history compaction failed: {str(e)}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    Base.metadata.create_all(bind=engine)
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await ensure_normalized_column(async_engine)
+    await backfill_yoruba_normalized(async_engine)
+    await ensure_import_key_index(async_engine)
+    await upgrade_tone_history(async_engine)
+    await proverb_search.install(async_engine)
+    await load_translation_index()
+    await load_proverb_pool()
+    try:
+        await reload_tone_lexicon()
+    except Exception as e:
+        # Keep serving with the bundled lexicon
+        logger.error(f"Tone lexicon load failed: {str(e)}")
+    try:
+        load_tone_model()
+    except Exception as e:
+        # The ngram engine reports itself unavailable
+        logger.error(f"Tone model load failed: {str(e)}")
+    refresh_task = None
+    if settings.translation_index_refresh_seconds > 0:
+        refresh_task = asyncio.create_task(
+            _refresh_periodically(settings.translation_index_refresh_seconds)
+        )
+    compact_task = None
+    if settings.tone_history_compact_seconds > 0 and (
+        settings.tone_history_retention_days > 0
+        or settings.tone_history_max_rows > 0
+    ):
+        compact_task = asyncio.create_task(
+            _compact_periodically(settings.tone_history_compact_seconds)
+        )
+    enrichment_queue.start()
+    tone_history.start()
     yield
     # Shutdown
-    pass
+    if refresh_task:
+        refresh_task.cancel()
+    if compact_task:
+        compact_task.cancel()
+    await enrichment_queue.stop()
+    await tone_history.stop()
+    tone_pool.shutdown()
+    await async_engine.dispose()
+    await ai_translation_service.aclose()
 
 
 app = FastAPI(
@@ -49,6 +166,16 @@ app.include_router(
     prefix="/api/v1", 
     tags=["tone-marking"]
 )
+app.include_router(
+    bulk_import.router,
+    prefix="/api/v1",
+    tags=["import"]
+)
+app.include_router(
+    export.router,
+    prefix="/api/v1",
+    tags=["export"]
+)
 
 
 @app.get("/")
@@ -70,6 +197,27 @@ async def health_check():
     return {"status": "healthy", "service": "yoruba-language-api"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Get cache and AI counters for monitoring"""
+    return {
+        "translation_cache": translation_cache.stats(),
+        "translation_misses": translation_misses.stats(),
+        "ai_coalescing": ai_translation_flights.stats(),
+        "ai_batching": ai_batcher.stats(),
+        "ai_queue": enrichment_queue.stats(),
+        "tone_pool": tone_pool.stats(),
+        "tone_cache": tone_mark_cache.stats(),
+        "tone_history": tone_history.stats(),
+        "word_of_the_day": word_of_the_day.stats(),
+        "conditional_get": {
+            "translations": translation_validators.stats(),
+            "translate": translate_validators.stats(),
+            "proverbs": proverb_validators.stats()
+        }
+    }
+
+
 @app.get("/config")
 async def get_config():
     """Get current configuration (without sensitive data)"""
@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+import gzip
+import io
+
+from app.auth import require_api_key
+from app.config import settings
+from app.database import get_async_db
+from app.services.bulk_import import (
+    FORMATS,
+    detect_format,
+    import_records,
+    iter_records
+)
+from app.services.http_cache import proverb_validators
+from app.services.pagination import invalidate_counts
+from app.services.proverb_pool import (
+    load_proverb_pool,
+    proverb_pool,
+    refresh_proverb_pool
+)
+from app.services.translation_index import (
+    load_translation_index,
+    refresh_translation_index
+)
+from app.services.translation_service import invalidate_translations
+
+router = APIRouter()
+
+
+@router.post("/import/{kind}", dependencies=[Depends(require_api_key)])
+async def bulk_import(
+    kind: str,
+    file: UploadFile = File(..., description="CSV or NDJSON, optionally gzip"),
+    format: Optional[str] = Query(
+        None, description="csv or ndjson (guessed from the file name)"
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Bulk import translations or proverbs from a CSV or NDJSON upload.
+
+    Requires the X-API-Key header.
+    """
+    if kind not in ("translations", "proverbs"):
+        raise HTTPException(
+            status_code=404,
+            detail="Only translations and proverbs can be imported"
+        )
+    fmt = format or detect_format(file.filename)
+    if fmt not in FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail="format must be 'csv' or 'ndjson'"
+        )
+
+    raw = file.file
+    if (file.filename or "").lower().endswith(".gz"):
+        # The spooled upload is opened w+b; GzipFile would take that mode
+        raw = gzip.GzipFile(fileobj=raw, mode="rb")
+    stream = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+    try:
+        stats = await import_records(
+            db,
+            kind,
+            iter_records(stream, fmt),
+            chunk_size=settings.import_chunk_size
+        )
+    except (UnicodeDecodeError, OSError, ValueError) as e:
+        # Earlier chunks were committed, so resync before reporting
+        await _refresh_after_import(kind, reload=True)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Could not read import file: {str(e)}"
+        )
+    finally:
+        # Leave the upload open for FastAPI to close, but close the gzip
+        # reader wrapped around it (which does not close its fileobj)
+        stream.detach()
+        if raw is not file.file:
+            raw.close()
+
+    await _refresh_after_import(kind, reload=bool(stats["updated"]))
+    return {"kind": kind, "format": fmt, **stats}
+
+
+async def _refresh_after_import(kind: str, reload: bool) -> None:
+    """
+    Bring in-memory indexes and caches up to date after an import.
+    
+    New rows only need an incremental refresh; updated rows need the
+    index rebuilt. Caches are invalidated only once the rebuilt index
+    or pool is in place, so lookups in between cannot cache misses
+    against a partial one.
+    """
+    invalidate_counts(kind)
+    if kind == "translations":
+        if reload:
+            await load_translation_index()
+        else:
+            await refresh_translation_index()
+        await invalidate_translations()
+    else:
+        if reload:
+            await load_proverb_pool()
+            await proverb_pool.invalidate()
+        else:
+            await refresh_proverb_pool()
+        await proverb_validators.invalidate()
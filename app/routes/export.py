@@ -0,0 +1,35 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.database import async_engine
+from app.services.export import EXPORT_COLUMNS, gzip_stream, iter_ndjson
+
+router = APIRouter()
+
+
+@router.get("/export/{kind}")
+async def export_corpus(
+    kind: str,
+    gzip: bool = Query(False, description="Compress the export with gzip")
+):
+    """Stream every translation or proverb as NDJSON"""
+    if kind not in EXPORT_COLUMNS:
+        raise HTTPException(
+            status_code=404,
+            detail="Only translations and proverbs can be exported"
+        )
+
+    body = iter_ndjson(async_engine, kind, settings.export_chunk_size)
+    filename = f"{kind}.ndjson"
+    media_type = "application/x-ndjson"
+    if gzip:
+        body = gzip_stream(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,67 +1,163 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
-import random
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 
-from app.database import get_db, Proverb
-from app.schemas import ProverbCreate, ProverbResponse
+from app.database import get_async_db, Proverb
+from app.schemas import (
+    ProverbCreate,
+    ProverbResponse,
+    ProverbPageResponse,
+    ProverbSearchResponse
+)
+from app.services.http_cache import proverb_validators
+from app.services.pagination import (
+    cached_count,
+    invalidate_counts,
+    keyset_page
+)
+from app.services.proverb_pool import proverb_pool
+from app.services.proverb_search import proverb_search
 
 router = APIRouter()
 
 
-@router.get("/proverbs", response_model=List[ProverbResponse])
+@router.get("/proverbs", response_model=ProverbPageResponse)
 async def get_all_proverbs(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     category: str = Query(None, description="Filter by category"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all proverbs with optional category filtering"""
-    query = db.query(Proverb)
+    resource = f"page:{skip}:{limit}:{category}:{cursor}"
+    version, not_modified = await proverb_validators.check(request, resource)
+    if not_modified:
+        return not_modified
+    
+    query = select(Proverb)
     
     if category:
-        query = query.filter(Proverb.category == category)
+        query = query.where(Proverb.category == category)
+    
+    try:
+        proverbs, page, next_cursor = await keyset_page(
+            db, query, Proverb.id, limit, cursor=cursor, skip=skip
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    total = await cached_count(db, "proverbs", query, key=category)
+    not_modified = await proverb_validators.respond(
+        request,
+        response,
+        resource,
+        version,
+        [(p.id, p.created_at) for p in proverbs],
+        total,
+        next_cursor
+    )
+    if not_modified:
+        return not_modified
     
-    proverbs = query.offset(skip).limit(limit).all()
-    return proverbs
+    return ProverbPageResponse(
+        results=proverbs,
+        total=total,
+        page=page,
+        per_page=limit,
+        next_cursor=next_cursor
+    )
 
 
-@router.get("/proverbs/random", response_model=ProverbResponse)
-async def get_random_proverb(db: Session = Depends(get_db)):
-    """Get a random Yoruba proverb"""
-    total = db.query(Proverb).count()
-    if total == 0:
+@router.get("/proverbs/search", response_model=ProverbSearchResponse)
+async def search_proverbs(
+    q: str = Query(..., min_length=1, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=100),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Search proverbs in Yoruba or English, ignoring tone marks"""
+    try:
+        hits, total, page, next_cursor = await proverb_search.search(
+            db, q, limit=limit, cursor=cursor, category=category
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return ProverbSearchResponse(
+        results=hits,
+        total=total,
+        page=page,
+        per_page=limit,
+        next_cursor=next_cursor
+    )
+
+
+@router.get(
+    "/proverbs/random",
+    response_model=Union[ProverbResponse, List[ProverbResponse]]
+)
+async def get_random_proverb(
+    category: Optional[str] = Query(None, description="Filter by category"),
+    count: Optional[int] = Query(
+        None,
+        ge=1,
+        le=50,
+        description="Return a list of this many distinct proverbs"
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a random Yoruba proverb, or several distinct ones"""
+    proverbs = await proverb_pool.pick(db, count=count or 1, category=category)
+    if not proverbs:
         raise HTTPException(
             status_code=404, 
             detail="No proverbs available"
         )
     
-    random_offset = random.randint(0, total - 1)
-    proverb = db.query(Proverb).offset(random_offset).first()
-    
-    return proverb
+    if count is None:
+        return ProverbResponse(**proverbs[0])
+    return [ProverbResponse(**p) for p in proverbs]
 
 
 @router.post("/proverbs", response_model=ProverbResponse)
 async def create_proverb(
     proverb: ProverbCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new proverb"""
     db_proverb = Proverb(**proverb.dict())
     db.add(db_proverb)
-    db.commit()
-    db.refresh(db_proverb)
+    await db.commit()
+    await db.refresh(db_proverb)
+    await proverb_pool.add(db_proverb)
+    await proverb_validators.invalidate()
+    invalidate_counts("proverbs")
     return db_proverb
 
 
 @router.get("/proverbs/{proverb_id}", response_model=ProverbResponse)
 async def get_proverb(
     proverb_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific proverb by ID"""
-    proverb = db.query(Proverb).filter(Proverb.id == proverb_id).first()
+    resource = f"proverb:{proverb_id}"
+    version, not_modified = await proverb_validators.check(request, resource)
+    if not_modified:
+        return not_modified
+    
+    proverb = await db.get(Proverb, proverb_id)
     
     if not proverb:
         raise HTTPException(
@@ -69,4 +165,13 @@ async def get_proverb(
             detail="Proverb not found"
         )
     
+    not_modified = await proverb_validators.respond(
+        request,
+        response,
+        resource,
+        version,
+        [(proverb.id, proverb.created_at)]
+    )
+    if not_modified:
+        return not_modified
     return proverb
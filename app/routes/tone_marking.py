@@ -1,54 +1,340 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import asyncio
 
-from app.database import get_db, ToneMarking
-from app.schemas import ToneMarkingRequest, ToneMarkingResponse
-from app.services.tone_service import add_tone_marks
+from app.auth import require_api_key
+from app.config import settings
+from app.database import get_async_db, ToneMarking
+from app.schemas import (
+    ToneMarkingRequest,
+    ToneMarkingResponse,
+    ToneMarkingBatchRequest,
+    ToneMarkingBatchResponse,
+    ToneMarkingHistoryResponse,
+    ToneLexiconResponse,
+    ToneEngineResponse
+)
+from app.services.pagination import cached_count, keyset_page
+from app.services.tone_document import (
+    iter_file,
+    iter_sentence_chunks,
+    spool_stream,
+    tone_pool
+)
+from app.services.tone_lexicon import (
+    current_tone_lexicon,
+    reload_tone_lexicon
+)
+from app.services.tone_service import (
+    ENGINES,
+    ToneEngineUnavailableError,
+    add_tone_marks,
+    cache_tone_marks,
+    cached_tone_marks,
+    engine_available,
+    engine_version,
+    mark_text,
+    tone_engines
+)
+from app.services.tone_history import tone_history
 
 router = APIRouter()
 
 
+def _check_engine(engine: Optional[str], budget_ms: Optional[int]) -> str:
+    """Resolve the requested engine, rejecting unusable ones."""
+    engine = engine or settings.tone_default_engine
+    if engine not in ENGINES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"engine must be one of: {', '.join(ENGINES)}"
+        )
+    if budget_ms is not None and budget_ms <= 0:
+        raise HTTPException(
+            status_code=400,
+            detail="budget_ms must be positive"
+        )
+    if not engine_available(engine):
+        raise HTTPException(
+            status_code=503,
+            detail=f"The {engine} tone engine is not available"
+        )
+    return engine
+
+
 @router.post("/tone-mark", response_model=ToneMarkingResponse)
-async def mark_tones(
-    request: ToneMarkingRequest,
-    db: Session = Depends(get_db)
-):
+async def mark_tones(request: ToneMarkingRequest):
     """Add tone marks (diacritics) to Yoruba text"""
+    engine = _check_engine(request.engine, request.budget_ms)
+    if len(request.text) > settings.tone_text_max_chars:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                "Text is too long, send it to /tone-mark/document instead"
+            )
+        )
+    
     try:
-        tone_marked_text = add_tone_marks(request.text)
-        
-        # Save to database
-        db_tone_marking = ToneMarking(
-            original_text=request.text,
-            tone_marked_text=tone_marked_text
-        )
-        db.add(db_tone_marking)
-        db.commit()
-        
-        return ToneMarkingResponse(
-            original=request.text,
-            tone_marked=tone_marked_text
-        )
-    except Exception as e:
+        if len(request.text) > settings.tone_inline_max_chars:
+            # Large texts would stall other requests; use the pool
+            tone_marked_text = await tone_pool.mark(
+                request.text, engine, request.budget_ms
+            )
+        elif engine == "ngram":
+            # Decoding is CPU work, keep it off the event loop
+            tone_marked_text = await asyncio.to_thread(
+                add_tone_marks, request.text, engine, request.budget_ms
+            )
+        else:
+            tone_marked_text = add_tone_marks(request.text, engine)
+    except ToneEngineUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    # Logged in the background, unless the text is too large to keep
+    if len(request.text) <= settings.tone_store_max_chars:
+        tone_history.add({
+            "original_text": request.text,
+            "tone_marked_text": tone_marked_text
+        })
+    
+    return ToneMarkingResponse(
+        original_text=request.text,
+        tone_marked_text=tone_marked_text,
+        engine=engine
+    )
+
+
+@router.post("/tone-mark/batch", response_model=ToneMarkingBatchResponse)
+async def mark_tones_batch(request: ToneMarkingBatchRequest):
+    """
+    Add tone marks to many short texts in one request.
+    
+    Each distinct text is marked once, repeats of earlier texts are
+    served from a cache, and the history is written in bulk.
+    """
+    engine = _check_engine(request.engine, request.budget_ms)
+    if len(request.texts) > settings.tone_batch_max_texts:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error processing tone marking: {str(e)}"
+            status_code=400,
+            detail=(
+                f"At most {settings.tone_batch_max_texts} texts "
+                "can be tone-marked per batch"
+            )
+        )
+    if sum(map(len, request.texts)) > settings.tone_text_max_chars:
+        raise HTTPException(
+            status_code=413,
+            detail="Batch is too long, split it into smaller batches"
+        )
+    
+    version = engine_version(engine)
+    if version is None:
+        # The model was unloaded after the engine check
+        raise HTTPException(
+            status_code=503,
+            detail=f"The {engine} tone engine is not available"
+        )
+    results, misses = await cached_tone_marks(
+        request.texts, engine, version
+    )
+    cached = len(results)
+    
+    if misses:
+        try:
+            if (
+                engine == "ngram"
+                or sum(map(len, misses)) > settings.tone_inline_max_chars
+            ):
+                marked = await tone_pool.mark_many(
+                    misses, engine, request.budget_ms
+                )
+            else:
+                marked = [mark_text(text, engine) for text in misses]
+        except ToneEngineUnavailableError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        # Results cut short by the decoding budget are not reusable
+        final = [
+            (text, result)
+            for text, (result, complete) in zip(misses, marked)
+            if complete
+        ]
+        await cache_tone_marks(
+            [text for text, _ in final],
+            [result for _, result in final],
+            engine,
+            version
         )
+        results.update(
+            (text, result) for text, (result, _) in zip(misses, marked)
+        )
+    
+    tone_history.add_many(
+        {"original_text": text, "tone_marked_text": marked}
+        for text, marked in results.items()
+        if text and len(text) <= settings.tone_store_max_chars
+    )
+    
+    return ToneMarkingBatchResponse(
+        results=[results[text] for text in request.texts],
+        engine=engine,
+        total=len(request.texts),
+        unique=len(results),
+        cached=cached
+    )
 
 
-@router.get("/tone-mark/history", response_model=list[ToneMarkingResponse])
+@router.post(
+    "/tone-mark/document",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/plain": {}}}}
+)
+async def mark_document_tones(
+    request: Request,
+    engine: Optional[str] = Query(None, description="lexicon or ngram"),
+    budget_ms: Optional[int] = Query(
+        None, description="ngram decoding budget per chunk"
+    )
+):
+    """
+    Add tone marks to a large plain-text document.
+    
+    The request body is spooled (to disk past 1 MB), then read back in
+    sentence-aligned chunks that are marked in a process pool, and the
+    result is streamed back as each chunk is ready.
+    """
+    engine = _check_engine(engine, budget_ms)
+    # The body has to be read in full before the response starts, since
+    # a streaming response listens on the same channel for disconnects
+    try:
+        body = await spool_stream(
+            request.stream(), settings.tone_document_max_bytes
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    
+    return StreamingResponse(
+        _mark_and_store(body, engine, budget_ms),
+        media_type="text/plain; charset=utf-8"
+    )
+
+
+async def _mark_and_store(body, engine: str, budget_ms: Optional[int]):
+    """Stream marked chunks, saving the document if it is small enough."""
+    chunks = iter_sentence_chunks(
+        iter_file(body), settings.tone_document_chunk_chars
+    )
+    originals = []
+    marked = []
+    size = 0
+
+    async def recorded():
+        nonlocal size
+        async for chunk in chunks:
+            size += len(chunk)
+            if size <= settings.tone_store_max_chars:
+                originals.append(chunk)
+            yield chunk
+
+    try:
+        async for result in tone_pool.mark_stream(
+            recorded(), engine, budget_ms
+        ):
+            if size <= settings.tone_store_max_chars:
+                marked.append(result)
+            yield result
+    finally:
+        body.close()
+
+    if 0 < size <= settings.tone_store_max_chars:
+        tone_history.add({
+            "original_text": "".join(originals),
+            "tone_marked_text": "".join(marked)
+        })
+
+
+@router.get("/tone-mark/history", response_model=ToneMarkingHistoryResponse)
 async def get_tone_marking_history(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get history of tone marking requests"""
-    history = db.query(ToneMarking).offset(skip).limit(limit).all()
+    """Get the distinct texts tone-marked, most recently seen first"""
+    query = select(ToneMarking)
+    try:
+        history, page, next_cursor = await keyset_page(
+            db,
+            query,
+            ToneMarking.id,
+            limit,
+            cursor=cursor,
+            skip=skip,
+            descending=True,
+            sort_column=ToneMarking.last_seen_at
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return [
-        ToneMarkingResponse(
-            original=item.original_text,
-            tone_marked=item.tone_marked_text
+    return ToneMarkingHistoryResponse(
+        results=[
+            ToneMarkingResponse(
+                original_text=item.original_text,
+                tone_marked_text=item.tone_marked_text,
+                hit_count=item.hit_count,
+                last_seen_at=item.last_seen_at
+            )
+            for item in history
+        ],
+        total=await cached_count(db, "tone_markings", query),
+        page=page,
+        per_page=limit,
+        next_cursor=next_cursor
+    )
+
+
+@router.get("/tone-mark/engines", response_model=List[ToneEngineResponse])
+async def get_tone_engines():
+    """List the tone marking engines and whether they can be used"""
+    return tone_engines()
+
+
+@router.get("/tone-mark/lexicon", response_model=ToneLexiconResponse)
+async def get_tone_lexicon():
+    """Describe the tone lexicon currently in use"""
+    return current_tone_lexicon().stats()
+
+
+@router.post(
+    "/tone-mark/lexicon/reload",
+    response_model=ToneLexiconResponse,
+    dependencies=[Depends(require_api_key)]
+)
+async def reload_lexicon(
+    source: Optional[str] = Query(
+        None,
+        description=(
+            "file or db (defaults to the last source loaded, "
+            "then TONE_LEXICON_SOURCE)"
+        )
+    )
+):
+    """
+    Rebuild the tone lexicon and swap it in without pausing requests.
+    
+    Requires the X-API-Key header.
+    """
+    try:
+        lexicon = await reload_tone_lexicon(source=source)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except OSError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Could not read tone lexicon: {str(e)}"
         )
-        for item in history
-    ]
+    return lexicon.stats()
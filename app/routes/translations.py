@@ -1,30 +1,77 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Optional
+import asyncio
 
-from app.database import get_db, Translation
+from app.database import get_async_db, Translation
+from app.config import settings
 from app.schemas import (
     TranslationCreate, 
     TranslationResponse, 
-    TranslationRequest
+    TranslationRequest,
+    TranslationJobResponse,
+    BatchTranslationRequest,
+    BatchTranslationItem,
+    BatchTranslationResponse,
+    ReverseTranslationResponse,
+    SearchResponse,
+    WordOfTheDayResponse
 )
 from app.services.ai_translation_service import (
-    translate_to_yoruba, 
-    is_ai_available
+    is_ai_available,
+    ai_translation_service,
+    resilient_ai_service
+)
+from app.services.enrichment_queue import QueueFullError
+from app.services.http_cache import (
+    etag_matches,
+    translate_validators,
+    translation_validators
+)
+from app.services.pagination import cached_count, keyset_page
+from app.services.normalization import normalize_yoruba
+from app.services.resilience import CircuitOpenError, DeadlineExceededError
+from app.services.reverse_lookup import reverse_lookup
+from app.services.translation_index import normalize_word
+from app.services.translation_service import (
+    ai_translation_flights,
+    enrichment_queue,
+    lookup_translation,
+    lookup_translations,
+    remember_translation,
+    translate_with_ai
+)
+from app.services.word_of_the_day import (
+    seconds_until_midnight,
+    word_of_the_day
 )
 
 router = APIRouter()
 
 
-@router.get("/translate", response_model=TranslationResponse)
+@router.get(
+    "/translate",
+    response_model=TranslationResponse,
+    responses={202: {"model": TranslationJobResponse}}
+)
 async def translate_word(
+    request: Request,
+    response: Response,
     word: str = Query(..., description="English word to translate"),
     lang: str = Query("yo", description="Target language (yo for Yoruba)"),
     use_ai: bool = Query(
         False, 
         description="Use AI translation if not in database"
     ),
-    db: Session = Depends(get_db)
+    mode: str = Query(
+        "inline",
+        description=(
+            "inline waits for the AI; queue returns 202 with a job id"
+        )
+    ),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Translate an English word to Yoruba"""
     if lang.lower() != "yo":
@@ -32,54 +79,65 @@ async def translate_word(
             status_code=400, 
             detail="Only Yoruba (yo) translation is supported"
         )
+    if mode not in ("inline", "queue"):
+        raise HTTPException(
+            status_code=400,
+            detail="mode must be 'inline' or 'queue'"
+        )
+    
+    # Clients that already hold the translation get a 304
+    resource = f"word:{normalize_word(word)}"
+    version, not_modified = await translate_validators.check(
+        request, resource
+    )
+    if not_modified:
+        return not_modified
     
-    # First, try to find in database
-    translation = db.query(Translation).filter(
-        Translation.english_word.ilike(f"%{word}%")
-    ).first()
+    # First, try the cache and dictionary
+    result = await lookup_translation(word)
     
-    if translation:
+    if result:
         # Return database result
-        return TranslationResponse(
-            english_word=translation.english_word,
-            yoruba_word=translation.yoruba_word,
-            part_of_speech=translation.part_of_speech,
-            example_sentence=translation.example_sentence,
-            id=translation.id,
-            created_at=translation.created_at,
-            updated_at=translation.updated_at,
-            source="database"
+        entry, source = result
+        not_modified = await translate_validators.respond(
+            request,
+            response,
+            resource,
+            version,
+            [(entry["id"], entry["updated_at"] or entry["created_at"])],
+            source
+        )
+        if not_modified:
+            return not_modified
+        return TranslationResponse(**entry, source=source)
+    
+    # Hand misses to the background workers when queueing is requested
+    if use_ai and is_ai_available() and mode == "queue":
+        try:
+            job = await enrichment_queue.submit(normalize_word(word), word)
+        except QueueFullError as e:
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": "5"}
+            )
+        return JSONResponse(
+            status_code=202,
+            content=_job_response(job).model_dump(mode="json"),
+            headers={"Location": f"/api/v1/translate/jobs/{job['job_id']}"}
         )
     
     # If not in database and AI is requested
     if use_ai and is_ai_available():
         try:
-            # Get AI translation
-            ai_result = translate_to_yoruba(word)
-            
-            # Save AI translation to database for future use
-            db_translation = Translation(
-                english_word=ai_result['word'],
-                yoruba_word=ai_result['translation'],
-                part_of_speech=ai_result['part_of_speech'],
-                example_sentence=ai_result['example']
-            )
-            db.add(db_translation)
-            db.commit()
-            db.refresh(db_translation)
-            
-            # Return AI result
-            return TranslationResponse(
-                english_word=db_translation.english_word,
-                yoruba_word=db_translation.yoruba_word,
-                part_of_speech=db_translation.part_of_speech,
-                example_sentence=db_translation.example_sentence,
-                id=db_translation.id,
-                created_at=db_translation.created_at,
-                updated_at=db_translation.updated_at,
-                source="ai"
-            )
+            # Get AI translation, saved to the database for future use
+            entry, source = await translate_with_ai(word)
+            return TranslationResponse(**entry, source=source)
             
+        except CircuitOpenError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        except DeadlineExceededError as e:
+            raise HTTPException(status_code=504, detail=str(e))
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -90,7 +148,7 @@ async def translate_word(
     if use_ai and not is_ai_available():
         raise HTTPException(
             status_code=503,
-            detail="AI translation service is not available. Check OpenAI API key."
+            detail=_ai_unavailable_detail()
         )
     
     # Word not found and AI not requested
@@ -103,30 +161,165 @@ async def translate_word(
     )
 
 
-@router.post("/translate", response_model=TranslationResponse)
+@router.post(
+    "/translate",
+    response_model=TranslationResponse,
+    responses={202: {"model": TranslationJobResponse}}
+)
 async def translate_word_post(
     request: TranslationRequest,
-    db: Session = Depends(get_db)
+    http_request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Translate an English word to Yoruba using POST method"""
     return await translate_word(
+        request=http_request,
+        response=response,
         word=request.word,
         lang=request.lang,
         use_ai=request.use_ai,
+        mode=request.mode,
         db=db
     )
 
 
+@router.get(
+    "/translate/jobs/{job_id}", response_model=TranslationJobResponse
+)
+async def get_translation_job(job_id: str):
+    """Get the status and result of a queued AI translation"""
+    job = await enrichment_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Translation job not found"
+        )
+    return _job_response(job)
+
+
+@router.post("/translate/batch", response_model=BatchTranslationResponse)
+async def translate_batch(
+    request: BatchTranslationRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Translate many English words to Yoruba in one request"""
+    if request.lang.lower() != "yo":
+        raise HTTPException(
+            status_code=400, 
+            detail="Only Yoruba (yo) translation is supported"
+        )
+    if len(request.words) > settings.batch_translate_max_words:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"At most {settings.batch_translate_max_words} words "
+                "can be translated per batch"
+            )
+        )
+    
+    # Resolve each distinct word once
+    keys: Dict[str, str] = {}
+    for word in request.words:
+        key = normalize_word(word)
+        if key:
+            keys.setdefault(key, word)
+    
+    resolved = await lookup_translations(keys, db)
+    
+    misses = [key for key in keys if key not in resolved]
+    errors: Dict[str, str] = {}
+    if misses and request.use_ai:
+        if not is_ai_available():
+            raise HTTPException(
+                status_code=503,
+                detail=_ai_unavailable_detail()
+            )
+        
+        # Translate every miss concurrently
+        ai_results = await asyncio.gather(
+            *(translate_with_ai(keys[key]) for key in misses),
+            return_exceptions=True
+        )
+        
+        for key, ai_result in zip(misses, ai_results):
+            if isinstance(ai_result, Exception):
+                errors[key] = str(ai_result)
+            else:
+                resolved[key] = ai_result
+    
+    results = []
+    for word in request.words:
+        key = normalize_word(word)
+        if key in resolved:
+            entry, source = resolved[key]
+            results.append(BatchTranslationItem(
+                word=word,
+                source=source,
+                translation=TranslationResponse(**entry, source=source)
+            ))
+        elif key in errors:
+            results.append(BatchTranslationItem(
+                word=word,
+                source="error",
+                detail=f"AI translation failed: {errors[key]}"
+            ))
+        else:
+            results.append(BatchTranslationItem(
+                word=word,
+                source="not_found",
+                detail=f"Translation for '{word}' not found."
+            ))
+    
+    return BatchTranslationResponse(
+        results=results,
+        total=len(results),
+        found=sum(1 for item in results if item.translation)
+    )
+
+
+@router.get("/reverse-translate", response_model=ReverseTranslationResponse)
+async def reverse_translate(
+    word: str = Query(
+        ..., 
+        min_length=1, 
+        description="Yoruba word, with or without tone marks"
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Translate a Yoruba word to English, ignoring tone marks"""
+    translations = await reverse_lookup(db, word, limit=limit)
+    return ReverseTranslationResponse(
+        word=word,
+        normalized=normalize_yoruba(word),
+        results=[
+            TranslationResponse(
+                english_word=t.english_word,
+                yoruba_word=t.yoruba_word,
+                part_of_speech=t.part_of_speech,
+                example_sentence=t.example_sentence,
+                id=t.id,
+                created_at=t.created_at,
+                updated_at=t.updated_at,
+                source="database"
+            )
+            for t in translations
+        ]
+    )
+
+
 @router.post("/translations", response_model=TranslationResponse)
 async def create_translation(
     translation: TranslationCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new translation"""
     db_translation = Translation(**translation.dict())
     db.add(db_translation)
-    db.commit()
-    db.refresh(db_translation)
+    await db.commit()
+    await db.refresh(db_translation)
+    await remember_translation(db_translation)
     
     return TranslationResponse(
         english_word=db_translation.english_word,
@@ -140,28 +333,90 @@ async def create_translation(
     )
 
 
-@router.get("/translations", response_model=List[TranslationResponse])
+@router.get("/translations", response_model=SearchResponse)
 async def get_all_translations(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all translations with pagination"""
-    translations = db.query(Translation).offset(skip).limit(limit).all()
-    
-    return [
-        TranslationResponse(
-            english_word=t.english_word,
-            yoruba_word=t.yoruba_word,
-            part_of_speech=t.part_of_speech,
-            example_sentence=t.example_sentence,
-            id=t.id,
-            created_at=t.created_at,
-            updated_at=t.updated_at,
-            source="database"
+    """Get all translations with cursor pagination"""
+    resource = f"page:{skip}:{limit}:{cursor}"
+    version, not_modified = await translation_validators.check(
+        request, resource
+    )
+    if not_modified:
+        return not_modified
+    
+    query = select(Translation)
+    try:
+        translations, page, next_cursor = await keyset_page(
+            db, query, Translation.id, limit, cursor=cursor, skip=skip
         )
-        for t in translations
-    ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    total = await cached_count(db, "translations", query)
+    not_modified = await translation_validators.respond(
+        request,
+        response,
+        resource,
+        version,
+        [(t.id, t.updated_at or t.created_at) for t in translations],
+        total,
+        next_cursor
+    )
+    if not_modified:
+        return not_modified
+    
+    return SearchResponse(
+        results=[
+            TranslationResponse(
+                english_word=t.english_word,
+                yoruba_word=t.yoruba_word,
+                part_of_speech=t.part_of_speech,
+                example_sentence=t.example_sentence,
+                id=t.id,
+                created_at=t.created_at,
+                updated_at=t.updated_at,
+                source="database"
+            )
+            for t in translations
+        ],
+        total=total,
+        page=page,
+        per_page=limit,
+        next_cursor=next_cursor
+    )
+
+
+@router.get(
+    "/word-of-the-day",
+    response_model=WordOfTheDayResponse,
+    responses={304: {"description": "Not modified"}}
+)
+async def get_word_of_the_day(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the Yoruba word of the day, fixed until midnight UTC"""
+    entry = await word_of_the_day.get(db)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="No translations yet")
+    body, etag = entry
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={seconds_until_midnight()}"
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=body, media_type="application/json", headers=headers
+    )
 
 
 @router.get("/ai/status")
@@ -169,5 +424,34 @@ async def get_ai_status():
     """Check if AI translation service is available"""
     return {
         "available": is_ai_available(),
-        "model": "gpt-4o" if is_ai_available() else None
+        "model": ai_translation_service.model if is_ai_available() else None,
+        "circuit": resilient_ai_service.stats(),
+        "coalescing": ai_translation_flights.stats()
     }
+
+
+def _job_response(job) -> TranslationJobResponse:
+    """Build the API response for an enrichment job."""
+    translation = None
+    if job["translation"]:
+        translation = TranslationResponse(
+            **job["translation"], source=job["source"]
+        )
+    return TranslationJobResponse(
+        job_id=job["job_id"],
+        word=job["word"],
+        status=job["status"],
+        created_at=job["created_at"],
+        translation=translation,
+        detail=job["detail"]
+    )
+
+
+def _ai_unavailable_detail() -> str:
+    """Explain why AI translation cannot be used right now."""
+    if ai_translation_service.is_available():
+        return (
+            "AI translation is temporarily unavailable after repeated "
+            "failures. Try again later."
+        )
+    return "AI translation service is not available. Check OpenAI API key."
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -15,7 +15,7 @@ class TranslationCreate(TranslationBase):
 
 
 class TranslationResponse(TranslationBase):
-    id: int
+    id: Optional[int]  # None for unsaved AI fallback results
     created_at: datetime
     updated_at: datetime
     source: Optional[str] = "database"  # database, ai, or ai_fallback
@@ -24,6 +24,12 @@ class TranslationResponse(TranslationBase):
         from_attributes = True
 
 
+class ReverseTranslationResponse(BaseModel):
+    word: str
+    normalized: str
+    results: List[TranslationResponse]
+
+
 class AITranslationResponse(BaseModel):
     word: str
     translation: str
@@ -54,11 +60,30 @@ class ProverbResponse(ProverbBase):
 
 class ToneMarkingRequest(BaseModel):
     text: str
+    engine: Optional[str] = None  # lexicon or ngram, default from settings
+    budget_ms: Optional[int] = None  # ngram decoding time before fallback
 
 
 class ToneMarkingResponse(BaseModel):
     original_text: str
     tone_marked_text: str
+    engine: Optional[str] = None
+    hit_count: Optional[int] = None  # history only
+    last_seen_at: Optional[datetime] = None  # history only
+
+
+class ToneMarkingBatchRequest(BaseModel):
+    texts: List[str]
+    engine: Optional[str] = None
+    budget_ms: Optional[int] = None  # per text, ngram only
+
+
+class ToneMarkingBatchResponse(BaseModel):
+    results: List[str]  # tone-marked texts, in request order
+    engine: str
+    total: int
+    unique: int
+    cached: int
 
 
 class WordOfTheDayResponse(BaseModel):
@@ -79,9 +104,81 @@ class SearchResponse(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: Optional[str] = None
+
+
+class ProverbPageResponse(BaseModel):
+    results: List[ProverbResponse]
+    total: int
+    page: int
+    per_page: int
+    next_cursor: Optional[str] = None
+
+
+class ProverbSearchHit(ProverbResponse):
+    score: float
+    highlights: Dict[str, str]
+
+
+class ProverbSearchResponse(BaseModel):
+    results: List[ProverbSearchHit]
+    total: int
+    page: int
+    per_page: int
+    next_cursor: Optional[str] = None
+
+
+class ToneLexiconResponse(BaseModel):
+    source: str
+    version: str
+    entries: int
+
+
+class ToneEngineResponse(BaseModel):
+    name: str
+    available: bool
+    default: bool
+    version: Optional[str] = None
+
+
+class ToneMarkingHistoryResponse(BaseModel):
+    results: List[ToneMarkingResponse]
+    total: int
+    page: int
+    per_page: int
+    next_cursor: Optional[str] = None
 
 
 class TranslationRequest(BaseModel):
     word: str
     lang: str = "yo"  # Default to Yoruba
     use_ai: bool = False  # Whether to use AI if not in database
+    mode: str = "inline"  # inline, or queue to get a 202 with a job id
+
+
+class TranslationJobResponse(BaseModel):
+    job_id: str
+    word: str
+    status: str  # pending, running, done or failed
+    created_at: datetime
+    translation: Optional[TranslationResponse] = None
+    detail: Optional[str] = None
+
+
+class BatchTranslationRequest(BaseModel):
+    words: List[str]
+    lang: str = "yo"
+    use_ai: bool = False
+
+
+class BatchTranslationItem(BaseModel):
+    word: str
+    source: str  # database, ai, ai_fallback, not_found or error
+    translation: Optional[TranslationResponse] = None
+    detail: Optional[str] = None
+
+
+class BatchTranslationResponse(BaseModel):
+    results: List[BatchTranslationItem]
+    total: int
+    found: int
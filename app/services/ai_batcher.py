@@ -0,0 +1,95 @@
+"""
+Micro-batching scheduler for AI translations.
+Packs words requested within a short window into a single LLM prompt.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchTranslator = Callable[[List[str]], Awaitable[List[Dict[str, any]]]]
+
+
+class AIMicroBatcher:
+    """
+    Collect AI-bound words and translate them together.
+
+    A batch is sent once ``max_batch_size`` words are waiting or
+    ``max_wait_seconds`` after the first word arrived, whichever comes
+    first. Each caller gets back the result for its own word.
+    """
+
+    def __init__(
+        self,
+        translate_batch: BatchTranslator,
+        max_batch_size: int = 16,
+        max_wait_seconds: float = 0.02
+    ):
+        self._translate_batch = translate_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.words = 0
+
+    async def submit(self, word: str) -> Dict[str, any]:
+        """Queue a word for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((word, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send every pending word as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Translate one batch and fan the results out to the waiters."""
+        words = [word for word, _ in batch]
+        self.batches += 1
+        self.words += len(words)
+        try:
+            results = await self._translate_batch(words)
+            if len(results) != len(words):
+                # Results are matched by position, so none can be trusted
+                raise ValueError(
+                    f"AI batch returned {len(results)} results "
+                    f"for {len(words)} words"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, any]:
+        """Return counters for monitoring."""
+        return {
+            "batches": self.batches,
+            "words": self.words,
+            "average_batch_size": (
+                round(self.words / self.batches, 2) if self.batches else 0
+            ),
+            "pending": len(self._pending),
+        }
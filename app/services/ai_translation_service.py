@@ -3,11 +3,14 @@ AI Translation Service for Yoruba Language API.
 Uses OpenAI GPT models to provide context-aware translations.
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict
-from openai import OpenAI
+from typing import Dict, List, Union
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from app.config import settings
+from app.services.resilience import CircuitBreaker, ResilientAIService
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -19,10 +22,29 @@ class AITranslationService:
     
     def __init__(self):
         self.client = None
+        self.async_client = None
         self.model = settings.ai_model
+        self._semaphore = None
         
         if settings.openai_api_key:
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            self.client = OpenAI(
+                api_key=settings.openai_api_key,
+                timeout=settings.ai_timeout_seconds,
+                max_retries=settings.ai_max_retries
+            )
+            # One pooled HTTP client shared by every async request
+            self.async_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                timeout=settings.ai_timeout_seconds,
+                max_retries=settings.ai_max_retries,
+                http_client=httpx.AsyncClient(
+                    timeout=settings.ai_timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=settings.ai_max_concurrency,
+                        max_keepalive_connections=settings.ai_max_concurrency
+                    )
+                )
+            )
             logger.info(
                 f"AI Translation Service initialized with model: {self.model}"
             )
@@ -37,20 +59,11 @@ class AITranslationService:
             raise ValueError("OpenAI client not initialized. Check API key.")
         
         try:
-            prompt = self._create_translation_prompt(english_text)
-            
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Yoruba language expert and translator."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
+                messages=self._create_messages(
+                    self._create_translation_prompt(english_text)
+                ),
                 temperature=0.3,
                 max_tokens=500
             )
@@ -62,6 +75,84 @@ class AITranslationService:
             logger.error(f"AI translation failed: {str(e)}")
             raise Exception(f"AI translation failed: {str(e)}")
     
+    async def translate_to_yoruba_async(
+        self, english_text: str
+    ) -> Dict[str, any]:
+        """Translate English text to Yoruba without blocking the loop."""
+        if not self.async_client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+        
+        try:
+            async with self._get_semaphore():
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=self._create_messages(
+                        self._create_translation_prompt(english_text)
+                    ),
+                    temperature=0.3,
+                    max_tokens=500
+                )
+            
+            ai_response = response.choices[0].message.content
+            return self._parse_ai_response(ai_response, english_text)
+            
+        except Exception as e:
+            # Keep the SDK's error type so the resilience layer can tell
+            # timeouts and 5xx responses from bad requests
+            logger.error(f"AI translation failed: {str(e)}")
+            raise
+    
+    async def translate_many_to_yoruba_async(
+        self, english_texts: List[str]
+    ) -> List[Dict[str, any]]:
+        """Translate several English words with a single AI request."""
+        if len(english_texts) == 1:
+            return [await self.translate_to_yoruba_async(english_texts[0])]
+        if not self.async_client:
+            raise ValueError("OpenAI client not initialized. Check API key.")
+        
+        try:
+            async with self._get_semaphore():
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=self._create_messages(
+                        self._create_batch_translation_prompt(english_texts)
+                    ),
+                    temperature=0.3,
+                    max_tokens=min(200 * len(english_texts) + 300, 4000)
+                )
+            
+            ai_response = response.choices[0].message.content
+            return self._parse_ai_response(ai_response, english_texts)
+            
+        except Exception as e:
+            logger.error(f"AI batch translation failed: {str(e)}")
+            raise
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Cap concurrent requests to the size of the connection pool."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.ai_max_concurrency)
+        return self._semaphore
+    
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections."""
+        if self.async_client:
+            await self.async_client.close()
+    
+    def _create_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Create the chat messages for a translation prompt."""
+        return [
+            {
+                "role": "system",
+                "content": "You are a Yoruba language expert and translator."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
     def _create_translation_prompt(self, english_text: str) -> str:
         """Create a structured prompt for the AI translation."""
         return f"""Translate "{english_text}" from English to Yoruba.
@@ -73,10 +164,34 @@ Respond in this JSON format:
   "example": "English example → Yoruba example"
 }}"""
     
+    def _create_batch_translation_prompt(
+        self, english_texts: List[str]
+    ) -> str:
+        """Create a prompt translating several words into a JSON array."""
+        words = json.dumps(english_texts, ensure_ascii=False)
+        return f"""Translate each of these English words to Yoruba: {words}
+Respond with a JSON array containing one object per word, in the same order:
+[
+  {{
+    "word": "english_word",
+    "translation": "yoruba_translation_with_tones",
+    "part_of_speech": "noun/verb/adjective",
+    "example": "English example → Yoruba example"
+  }}
+]"""
+    
     def _parse_ai_response(
-        self, ai_response: str, original_text: str
-    ) -> Dict[str, any]:
-        """Parse the AI response and extract translation data."""
+        self, ai_response: str, original_text: Union[str, List[str]]
+    ) -> Union[Dict[str, any], List[Dict[str, any]]]:
+        """
+        Parse the AI response and extract translation data.
+        
+        A list of words expects a JSON array and returns one result per
+        word, falling back individually for missing or malformed items.
+        """
+        if isinstance(original_text, list):
+            return self._parse_ai_batch_response(ai_response, original_text)
+        
         try:
             json_start = ai_response.find('{')
             json_end = ai_response.rfind('}') + 1
@@ -93,6 +208,57 @@ Respond in this JSON format:
         except json.JSONDecodeError:
             return self._create_fallback_response(original_text)
     
+    def _parse_ai_batch_response(
+        self, ai_response: str, original_texts: List[str]
+    ) -> List[Dict[str, any]]:
+        """Parse a JSON array response into one result per word."""
+        items = []
+        try:
+            json_start = ai_response.find('[')
+            json_end = ai_response.rfind(']') + 1
+            if json_start != -1 and json_end != 0:
+                parsed = json.loads(ai_response[json_start:json_end])
+                if isinstance(parsed, list):
+                    items = parsed
+        except json.JSONDecodeError:
+            items = []
+        
+        by_word = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get('word'), str):
+                by_word.setdefault(item['word'].strip().casefold(), item)
+        
+        matches = [
+            by_word.get(original_text.strip().casefold())
+            for original_text in original_texts
+        ]
+        claimed = {id(item) for item in matches if item is not None}
+        
+        results = []
+        for position, original_text in enumerate(original_texts):
+            item = matches[position]
+            if (
+                item is None
+                and len(items) == len(original_texts)
+                and id(items[position]) not in claimed
+            ):
+                # Fall back to matching by position, but never to an
+                # item another word already matched by name
+                item = items[position]
+            if isinstance(item, dict) and item.get('translation'):
+                data = {
+                    'word': original_text,
+                    'translation': item['translation'],
+                    'part_of_speech': item.get('part_of_speech') or 'noun',
+                    'example': item.get('example') or '',
+                    'source': 'ai',
+                    'model': self.model
+                }
+                results.append(data)
+            else:
+                results.append(self._create_fallback_response(original_text))
+        return results
+    
     def _create_fallback_response(self, original_text: str) -> Dict[str, any]:
         """Create a fallback response when AI parsing fails."""
         return {
@@ -112,12 +278,44 @@ Respond in this JSON format:
 # Global instance
 ai_translation_service = AITranslationService()
 
+# Async calls go through deadlines, retries and the circuit breaker
+resilient_ai_service = ResilientAIService(
+    ai_translation_service,
+    breaker=CircuitBreaker(
+        failure_rate_threshold=settings.ai_breaker_failure_rate,
+        window_size=settings.ai_breaker_window,
+        min_calls=settings.ai_breaker_min_calls,
+        open_seconds=settings.ai_breaker_open_seconds
+    ),
+    deadline=settings.ai_deadline_seconds,
+    max_attempts=settings.ai_max_attempts,
+    backoff=settings.ai_retry_backoff_ms / 1000,
+    hedge_delay=settings.ai_hedge_delay_ms / 1000 or None
+)
+
 
 def translate_to_yoruba(english_text: str) -> Dict[str, any]:
     """Convenience function to translate English to Yoruba."""
     return ai_translation_service.translate_to_yoruba(english_text)
 
 
+async def translate_to_yoruba_async(english_text: str) -> Dict[str, any]:
+    """Convenience function to translate English to Yoruba asynchronously."""
+    return await resilient_ai_service.translate_to_yoruba_async(english_text)
+
+
+async def translate_many_to_yoruba_async(
+    english_texts: List[str]
+) -> List[Dict[str, any]]:
+    """Convenience function to translate several words in one AI request."""
+    return await resilient_ai_service.translate_many_to_yoruba_async(
+        english_texts
+    )
+
+
 def is_ai_available() -> bool:
-    """Check if AI translation is available."""
-    return ai_translation_service.is_available()
+    """Check if AI translation is available and its circuit is not open."""
+    return (
+        ai_translation_service.is_available()
+        and resilient_ai_service.breaker.allows_requests()
+    )
@@ -0,0 +1,209 @@
+"""
+Streaming bulk import for translations and proverbs.
+Reads CSV or NDJSON in chunks and writes each chunk with batched statements.
+"""
+
+import asyncio
+import csv
+import json
+import logging
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy import func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database import Proverb, Translation
+from app.services.normalization import normalize_yoruba
+from app.services.translation_index import normalize_word
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "ndjson")
+
+TRANSLATION_FIELDS = (
+    "english_word", "yoruba_word", "part_of_speech", "example_sentence"
+)
+PROVERB_FIELDS = ("yoruba_text", "english_translation", "meaning", "category")
+
+ProgressCallback = Callable[[Dict[str, int]], None]
+
+
+def detect_format(filename: Optional[str]) -> str:
+    """Guess the input format from a file name, defaulting to NDJSON."""
+    name = (filename or "").lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return "csv" if name.endswith(".csv") else "ndjson"
+
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Dict[str, any]]:
+    """Yield one dict per CSV row or NDJSON line without buffering."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "ndjson":
+        for line in stream:
+            line = line.strip()
+            if line:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Counted as skipped by the importer
+                    yield {}
+    else:
+        raise ValueError(f"Unsupported format '{fmt}', use csv or ndjson")
+
+
+def chunked(records: Iterable, size: int) -> Iterator[List]:
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _clean(record, fields, required, max_lengths) -> Optional[Dict]:
+    """Keep known fields, returning None if the record is invalid."""
+    if not isinstance(record, dict):
+        return None
+    row = {}
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, str):
+            value = value.strip() or None
+        row[field] = value
+    for field in required:
+        if not isinstance(row[field], str):
+            return None
+    for field, max_length in max_lengths.items():
+        if row[field] and len(row[field]) > max_length:
+            return None
+    return row
+
+
+async def ensure_import_key_index(engine: AsyncEngine) -> None:
+    """Add the lower(english_word) index to databases created before it."""
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_translations_english_word_lower "
+            "ON translations (lower(english_word))"
+        ))
+
+
+async def _upsert_chunk(
+    db: AsyncSession,
+    model,
+    key_field: str,
+    rows: List[Dict],
+    fold: Optional[Callable[[str], str]] = None
+) -> Dict[str, int]:
+    """
+    Insert new rows and update existing ones, keyed on ``key_field``.
+
+    With ``fold`` (a lowercasing key function) rows match whenever their
+    folded keys are equal, and existing rows are found through
+    ``lower(key_field)``.
+    """
+    # Later rows in a chunk win over earlier ones with the same key
+    by_key = {
+        fold(row[key_field]) if fold else row[key_field]: row
+        for row in rows
+    }
+    key_column = getattr(model, key_field)
+    lookup = func.lower(key_column) if fold else key_column
+
+    existing = {}
+    for row_id, key in (await db.execute(
+        select(model.id, key_column)
+        .where(lookup.in_(list(by_key)))
+        .order_by(model.id)
+    )).all():
+        # The oldest row for a key is the one the index serves
+        existing.setdefault(fold(key) if fold else key, row_id)
+
+    now = datetime.utcnow()
+    updates = []
+    inserts = []
+    for key, row in by_key.items():
+        if key in existing:
+            updates.append({"id": existing[key], **row})
+        else:
+            inserts.append(row)
+    if updates and hasattr(model, "updated_at"):
+        for row in updates:
+            row["updated_at"] = now
+
+    if inserts:
+        await db.execute(insert(model), inserts)
+    if updates:
+        await db.execute(update(model), updates)
+    await db.commit()
+    return {"inserted": len(inserts), "updated": len(updates)}
+
+
+async def import_records(
+    db: AsyncSession,
+    kind: str,
+    records: Iterable[Dict[str, any]],
+    chunk_size: int = 1000,
+    on_progress: Optional[ProgressCallback] = None
+) -> Dict[str, int]:
+    """
+    Import translations or proverbs from an iterable of records.
+
+    Translations are deduplicated on ``english_word`` folded the way the
+    translation index keys it (see ``normalize_word``), and proverbs on
+    the exact ``yoruba_text``: existing rows are updated, new ones
+    inserted. Only
+    one chunk is held in memory at a time, and ``records`` is iterated
+    off the event loop. Invalid records are skipped.
+    """
+    if kind == "translations":
+        model, key_field, fields = Translation, "english_word", (
+            TRANSLATION_FIELDS
+        )
+        required = ("english_word", "yoruba_word")
+        fold = normalize_word
+        max_lengths = {
+            "english_word": 100, "yoruba_word": 100, "part_of_speech": 50
+        }
+    elif kind == "proverbs":
+        model, key_field, fields = Proverb, "yoruba_text", PROVERB_FIELDS
+        required = ("yoruba_text", "english_translation")
+        max_lengths = {"category": 100}
+        fold = None
+    else:
+        raise ValueError(f"Unknown import kind '{kind}'")
+
+    stats = {"read": 0, "inserted": 0, "updated": 0, "skipped": 0}
+    chunks = chunked(records, chunk_size)
+    while True:
+        # Reading, decompressing and parsing the upload are blocking, so
+        # each chunk is pulled in a worker thread
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            break
+        stats["read"] += len(chunk)
+        rows = []
+        for record in chunk:
+            row = _clean(record, fields, required, max_lengths)
+            if row is None:
+                stats["skipped"] += 1
+                continue
+            if model is Translation:
+                # Bulk UPDATEs skip ORM events, so fold the word here
+                row["yoruba_normalized"] = normalize_yoruba(row["yoruba_word"])
+            rows.append(row)
+        if rows:
+            result = await _upsert_chunk(
+                db, model, key_field, rows, fold
+            )
+            stats["inserted"] += result["inserted"]
+            stats["updated"] += result["updated"]
+        logger.info(f"Imported {kind}: {stats}")
+        if on_progress:
+            on_progress(dict(stats))
+    return stats
@@ -0,0 +1,119 @@
+"""
+In-memory LRU cache with TTLs for the Yoruba Language API.
+Supports short-lived negative entries for misses and fallbacks.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Returned by LRUCache.get when a key is absent or expired
+MISS = object()
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe LRU cache with per-entry expiry.
+
+    Positive entries live for ``ttl`` seconds and negative entries, which
+    record that a lookup found nothing useful, for ``negative_ttl``
+    seconds. The least recently used entry is evicted once ``maxsize``
+    is reached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: Optional[float] = 3600,
+        negative_ttl: Optional[float] = 60
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        # key -> (value, expires_at, negative)
+        self._data: "OrderedDict[Hashable, Tuple[Any, float, bool]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or ``MISS`` if absent or expired."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return MISS
+            value, expires_at, negative = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return MISS
+            self._data.move_to_end(key)
+            if negative:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Cache a positive value."""
+        self._store(key, value, self.ttl if ttl is None else ttl, False)
+
+    def set_negative(self, key: Hashable, value: Any = None) -> None:
+        """Cache a short-lived negative value for a miss or fallback."""
+        self._store(key, value, self.negative_ttl, True)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear_negative(self) -> None:
+        """Drop every negative entry, e.g. after new rows are written."""
+        with self._lock:
+            for key in [k for k, item in self._data.items() if item[2]]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def _store(
+        self, key: Hashable, value: Any, ttl: Optional[float], negative: bool
+    ) -> None:
+        if self.maxsize <= 0 or ttl == 0:
+            return
+        expires_at = (
+            float("inf") if ttl is None else time.monotonic() + ttl
+        )
+        with self._lock:
+            self._data[key] = (value, expires_at, negative)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,150 @@
+"""
+Background AI enrichment queue for the Yoruba Language API.
+Translates dictionary misses off the request path and tracks them as jobs.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.services.cache import MISS
+from app.services.shared_cache import LocalCacheBackend, SharedCache
+
+logger = logging.getLogger(__name__)
+
+Translator = Callable[[str], Awaitable[Tuple[Dict[str, any], str]]]
+
+
+class QueueFullError(Exception):
+    """Raised when the enrichment queue cannot accept more words."""
+
+
+class EnrichmentQueue:
+    """
+    Bounded queue of words served by a fixed pool of worker tasks.
+
+    The worker count caps AI concurrency independently of HTTP
+    concurrency. Words already queued or running share one job. Job
+    records live in ``jobs``, so with a Redis-backed cache any replica
+    can answer a poll for a job queued on another. Finished jobs are
+    kept for ``job_ttl`` seconds.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        translate: Translator,
+        workers: int = 4,
+        max_size: int = 1000,
+        job_ttl: float = 3600,
+        max_jobs: int = 10000,
+        jobs: Optional[SharedCache] = None
+    ):
+        self._translate = translate
+        self.worker_count = workers
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._jobs = jobs or SharedCache(
+            "ai-jobs", LocalCacheBackend(max_jobs), ttl=job_ttl
+        )
+        self._active: Dict[str, str] = {}
+        self.enqueued = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop."""
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued words are dropped."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def submit(self, key: str, word: str) -> Dict[str, Any]:
+        """Queue a word, returning its job (an existing one if active)."""
+        job_id = self._active.get(key)
+        if job_id:
+            job = await self._jobs.get(job_id)
+            if job is not MISS:
+                return job
+
+        if self._queue is None or not self.running:
+            raise QueueFullError("Enrichment queue is not running")
+
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "word": word,
+            "status": self.PENDING,
+            "created_at": datetime.utcnow(),
+            "translation": None,
+            "source": None,
+            "detail": None,
+        }
+        try:
+            self._queue.put_nowait((key, job))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError("Enrichment queue is full")
+
+        self.enqueued += 1
+        self._active[key] = job["job_id"]
+        await self._jobs.set(job["job_id"], job)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job by id, or None if unknown or expired."""
+        job = await self._jobs.get(job_id)
+        return None if job is MISS else job
+
+    async def _worker(self) -> None:
+        while True:
+            key, job = await self._queue.get()
+            job["status"] = self.RUNNING
+            await self._jobs.set(job["job_id"], job)
+            try:
+                entry, source = await self._translate(job["word"])
+                job["translation"] = entry
+                job["source"] = source
+                job["status"] = self.DONE
+                self.completed += 1
+            except Exception as e:
+                logger.error(f"Enrichment of '{job['word']}' failed: {e}")
+                job["detail"] = f"AI translation failed: {str(e)}"
+                job["status"] = self.FAILED
+                self.failed += 1
+            finally:
+                self._active.pop(key, None)
+                # Refresh the TTL from completion time
+                await self._jobs.set(job["job_id"], job)
+                self._queue.task_done()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_size": self.max_size,
+            "enqueued": self.enqueued,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
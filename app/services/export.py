@@ -0,0 +1,89 @@
+"""
+Streaming NDJSON export of translations and proverbs.
+Rows are read through a server-side cursor inside one read-only snapshot.
+"""
+
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Dict, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.database import Proverb, Translation
+
+EXPORT_COLUMNS: Dict[str, Tuple] = {
+    "translations": (
+        Translation.id,
+        Translation.english_word,
+        Translation.yoruba_word,
+        Translation.part_of_speech,
+        Translation.example_sentence,
+        Translation.created_at,
+        Translation.updated_at,
+    ),
+    "proverbs": (
+        Proverb.id,
+        Proverb.yoruba_text,
+        Proverb.english_translation,
+        Proverb.meaning,
+        Proverb.category,
+        Proverb.created_at,
+    ),
+}
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+async def iter_ndjson(
+    engine: AsyncEngine, kind: str, chunk_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Yield NDJSON for every row of ``kind``, one chunk of rows at a time.
+
+    The rows come from a single streamed SELECT inside one transaction,
+    so the export is a consistent snapshot even while writes continue.
+    On PostgreSQL the transaction is REPEATABLE READ and READ ONLY. Rows
+    are plain tuples serialized with ``json.dumps``; no ORM objects or
+    Pydantic models are built.
+    """
+    columns = EXPORT_COLUMNS.get(kind)
+    if columns is None:
+        raise ValueError(f"Unknown export kind '{kind}'")
+    keys = [column.key for column in columns]
+    query = select(*columns).order_by(columns[0])
+
+    async with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execution_options(
+                isolation_level="REPEATABLE READ",
+                postgresql_readonly=True
+            )
+        async with conn.begin():
+            result = await conn.stream(
+                query.execution_options(yield_per=chunk_size)
+            )
+            async for rows in result.partitions(chunk_size):
+                yield "".join(
+                    json.dumps(
+                        dict(zip(keys, row)),
+                        ensure_ascii=False,
+                        default=_default
+                    ) + "\n"
+                    for row in rows
+                ).encode("utf-8")
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally into gzip format."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,238 @@
+"""
+HTTP caching helpers for the Yoruba Language API.
+Entity tags, conditional request checks and per-table validators.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.config import settings
+from app.services.cache import MISS
+from app.services.shared_cache import SharedCache, shared_cache
+
+# What a response is derived from: (row id, updated_at or created_at)
+Stamp = Tuple[Any, Optional[datetime]]
+
+
+def strong_etag(body: bytes) -> str:
+    """A strong entity tag for a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison RFC 9110 asks for here, so ``W/"x"``
+    matches ``"x"``.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive UTC datetime for a Last-Modified header."""
+    return format_datetime(value.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def parse_http_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an HTTP date into a naive UTC datetime, or None."""
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime]
+) -> bool:
+    """
+    Whether the client's copy is current. ``If-None-Match`` wins over
+    ``If-Modified-Since`` when both are sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    since = parse_http_date(request.headers.get("if-modified-since"))
+    if since is None or last_modified is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+class ConditionalGet:
+    """
+    ETag and Last-Modified validators for one table's read endpoints.
+
+    A response's validators come from the ids and timestamps of the
+    rows it is built from, never from its serialized body. With
+    ``versioned_etags`` (for tables without ``updated_at``) the table
+    version goes into the ETag as well, since an edited row keeps its
+    timestamp.
+
+    Validators are remembered in the shared cache per resource and per
+    table version, so a repeat conditional request is answered with 304
+    before the database is touched. Writers call ``invalidate``, which
+    bumps the version on every replica. Without Redis each process has
+    its own version, so a write on one process can be missed by others
+    for up to ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        cache: Optional[SharedCache] = None,
+        versioned_etags: bool = False
+    ):
+        self.table = table
+        self.versioned_etags = versioned_etags
+        self._cache = cache or SharedCache(f"validators:{table}", ttl=300)
+        self.validated = 0
+        self.not_modified = 0
+        self.early_not_modified = 0
+
+    async def check(
+        self, request: Request, resource: str
+    ) -> Tuple[Optional[int], Optional[Response]]:
+        """
+        Return the table version to pass to ``respond``, and a 304
+        response if the remembered validators of ``resource`` show the
+        client's copy is current.
+        """
+        if request.method not in ("GET", "HEAD"):
+            return None, None
+        try:
+            version = await self._cache.version()
+        except Exception:
+            # Without the version no validator can be trusted
+            return None, None
+        if not (
+            "if-none-match" in request.headers
+            or "if-modified-since" in request.headers
+        ):
+            return version, None
+        # Keyed by the version read before the database, so validators
+        # computed while a write lands are never filed under the new one
+        remembered = await self._cache.get(f"{version}:{resource}")
+        if remembered is MISS:
+            return version, None
+        etag, last_modified = remembered
+        if not is_not_modified(request, etag, last_modified):
+            return version, None
+        self.not_modified += 1
+        self.early_not_modified += 1
+        return version, _not_modified(_headers(etag, last_modified))
+
+    async def respond(
+        self,
+        request: Request,
+        response: Response,
+        resource: str,
+        version: Optional[int],
+        stamps: Iterable[Stamp],
+        *extra: Any
+    ) -> Optional[Response]:
+        """
+        Set the validators of ``resource`` on ``response``, derived from
+        ``stamps`` and ``extra`` (e.g. the page total); return a 304
+        response instead if the client's copy is current.
+        """
+        if version is None:
+            return None
+        stamps = list(stamps)
+        last_modified = max(
+            (stamp for _, stamp in stamps if stamp is not None),
+            default=None
+        )
+        state: List[Any] = [self.table, resource, stamps, extra]
+        if self.versioned_etags:
+            state.append(version)
+        digest = hashlib.blake2b(repr(state).encode(), digest_size=16)
+        etag = f'W/"{digest.hexdigest()}"'
+        await self._cache.set(f"{version}:{resource}", (etag, last_modified))
+
+        self.validated += 1
+        headers = _headers(etag, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            self.not_modified += 1
+            return _not_modified(headers)
+        response.headers.update(headers)
+        return None
+
+    async def forget(self, resource: str) -> None:
+        """Retire the validators of one resource, on every replica."""
+        try:
+            version = await self._cache.version()
+        except Exception:
+            return
+        await self._cache.delete(f"{version}:{resource}")
+
+    async def invalidate(self) -> None:
+        """Retire the table's validators, on every replica."""
+        await self._cache.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for monitoring."""
+        return {
+            "validated": self.validated,
+            "not_modified": self.not_modified,
+            "early_not_modified": self.early_not_modified,
+            "cache": self._cache.stats(),
+        }
+
+
+def _headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    # no-cache: clients may store the body but must revalidate it
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def _not_modified(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+# Global instances; writers to a table call ``invalidate``, or ``forget``
+# for the resources a new row changes. Translation list pages and single
+# word lookups are kept apart, so new words do not retire every lookup.
+translation_validators = ConditionalGet(
+    "translations",
+    shared_cache(
+        "validators:translations",
+        settings.validator_cache_size,
+        ttl=settings.validator_cache_ttl_seconds
+    )
+)
+translate_validators = ConditionalGet(
+    "translate",
+    shared_cache(
+        "validators:translate",
+        settings.validator_cache_size,
+        ttl=settings.validator_cache_ttl_seconds
+    )
+)
+proverb_validators = ConditionalGet(
+    "proverbs",
+    shared_cache(
+        "validators:proverbs",
+        settings.validator_cache_size,
+        ttl=settings.validator_cache_ttl_seconds
+    ),
+    versioned_etags=True
+)
@@ -3,7 +3,8 @@ Mock AI Translation Service for testing purposes.
 Provides sample translations when OpenAI API is not available.
 """
 
-from typing import Dict
+from typing import Dict, List
+import asyncio
 import random
 
 
@@ -104,6 +105,60 @@ class MockAITranslationService:
         return True
 
 
+class AsyncMockAITranslationService(MockAITranslationService):
+    """Async mock service that simulates network latency and failures."""
+    
+    def __init__(
+        self,
+        latency: float = 0.5,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0
+    ):
+        super().__init__()
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def translate_to_yoruba_async(
+        self, english_text: str
+    ) -> Dict[str, any]:
+        """Translate using mock data after a simulated round trip."""
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self._simulate_round_trip()
+            return self.translate_to_yoruba(english_text)
+        finally:
+            self.in_flight -= 1
+    
+    async def translate_many_to_yoruba_async(
+        self, english_texts: List[str]
+    ) -> List[Dict[str, any]]:
+        """Translate several words after a single simulated round trip."""
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self._simulate_round_trip()
+            return [self.translate_to_yoruba(text) for text in english_texts]
+        finally:
+            self.in_flight -= 1
+    
+    async def _simulate_round_trip(self) -> None:
+        """Sleep for the configured latency, then maybe fail."""
+        await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+        if random.random() < self.failure_rate:
+            raise Exception("Simulated AI failure")
+    
+    async def aclose(self) -> None:
+        """Nothing to release for the mock service."""
+        return None
+
+
 # Global instance
 mock_ai_service = MockAITranslationService()
 
@@ -0,0 +1,48 @@
+"""
+Diacritic folding for Yoruba text.
+Maps tone marks and under-dots away with precomputed translation tables.
+"""
+
+import unicodedata
+from typing import Dict, Optional
+
+# Latin-1 Supplement through Latin Extended-B, plus Latin Extended
+# Additional where ẹ, ọ and ṣ live
+_LATIN_RANGES = ((0x00C0, 0x0250), (0x1E00, 0x1F00))
+_COMBINING_MARKS = range(0x0300, 0x0370)
+
+
+def _build_fold_table() -> Dict[int, Optional[str]]:
+    """
+    Map every precomposed Latin letter to its lowercase base letter and
+    every combining mark to nothing.
+
+    The table is derived once from each character's NFD decomposition,
+    so folding a string is a single ``str.translate`` call that handles
+    both composed (NFC) and decomposed (NFD) input.
+    """
+    table: Dict[int, Optional[str]] = {
+        code: None for code in _COMBINING_MARKS
+    }
+    for start, end in _LATIN_RANGES:
+        for code in range(start, end):
+            decomposed = unicodedata.normalize("NFD", chr(code))
+            base = "".join(
+                c for c in decomposed if not unicodedata.combining(c)
+            ).lower()
+            if base != chr(code):
+                table[code] = base
+    return table
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+def normalize_yoruba(text: str) -> str:
+    """
+    Fold Yoruba text for diacritic-insensitive matching.
+
+    Tone marks and under-dots are removed, so ọmọ́, Ọmọ and omo all fold
+    to ``omo``. Text is also casefolded and whitespace collapsed.
+    """
+    return " ".join(text.lower().translate(_FOLD_TABLE).split())
@@ -0,0 +1,124 @@
+"""
+Keyset pagination helpers for the Yoruba Language API.
+Encodes opaque cursors and caches row counts for page envelopes.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.services.cache import MISS, LRUCache
+
+# Table name -> cached counts keyed by filter
+_count_caches: Dict[str, LRUCache] = {}
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """Encode cursor state as an opaque URL-safe token."""
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """Decode a cursor token, raising ValueError if it is malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(data, dict) or not isinstance(data.get("id"), int):
+        raise ValueError("Invalid cursor")
+    return data
+
+
+async def keyset_page(
+    db: AsyncSession,
+    query,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    descending: bool = False,
+    sort_column=None
+) -> Tuple[List[Any], int, Optional[str]]:
+    """
+    Fetch one page of ``query`` ordered by ``id_column``, or by
+    ``sort_column`` then ``id_column`` when a sort column is given.
+
+    With a cursor the page starts right after the last row of the
+    previous page, so its cost does not depend on how deep it is. The
+    legacy ``skip`` offset is honoured when no cursor is given. Returns
+    the rows, the 1-based page number and the next cursor, if any.
+    """
+    if cursor:
+        state = decode_cursor(cursor)
+        page = int(state.get("page", 1))
+        after = id_column < state["id"] if descending else (
+            id_column > state["id"]
+        )
+        if sort_column is not None:
+            key = _decode_sort_key(state.get("key"))
+            beyond = sort_column < key if descending else sort_column > key
+            after = or_(beyond, and_(sort_column == key, after))
+        query = query.where(after)
+    else:
+        page = skip // limit + 1
+        query = query.offset(skip)
+
+    columns = [id_column] if sort_column is None else [sort_column, id_column]
+    order = [c.desc() if descending else c.asc() for c in columns]
+    rows = (await db.scalars(query.order_by(*order).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        state = {"id": rows[-1].id, "page": page + 1}
+        if sort_column is not None:
+            value = getattr(rows[-1], sort_column.key)
+            state["key"] = (
+                value.isoformat() if isinstance(value, datetime) else value
+            )
+        next_cursor = encode_cursor(state)
+    return rows, page, next_cursor
+
+
+def _decode_sort_key(value: Any) -> Any:
+    """Sort keys are JSON values; datetimes travel as ISO strings."""
+    if value is None:
+        raise ValueError("Invalid cursor")
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+async def cached_count(
+    db: AsyncSession, table: str, query, key: Hashable = None
+) -> int:
+    """Count the rows of ``query``, caching the result per table and key."""
+    cache = _count_caches.get(table)
+    if cache is None:
+        cache = _count_caches[table] = LRUCache(
+            maxsize=1000, ttl=settings.count_cache_ttl_seconds
+        )
+    total = cache.get(key)
+    if total is MISS:
+        total = await db.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
+        cache.set(key, total)
+    return total
+
+
+def invalidate_counts(table: str) -> None:
+    """Drop cached counts for a table after rows are written."""
+    cache = _count_caches.get(table)
+    if cache is not None:
+        cache.clear()
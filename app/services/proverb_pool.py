@@ -0,0 +1,189 @@
+"""
+In-memory pool of proverb ids for random selection.
+Picks random proverbs without COUNT or OFFSET queries.
+"""
+
+import logging
+import random
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, Proverb
+from app.services.shared_cache import (
+    LocalCacheBackend,
+    SharedCache,
+    shared_cache
+)
+
+logger = logging.getLogger(__name__)
+
+
+def proverb_to_entry(proverb: Proverb) -> Dict[str, any]:
+    """Snapshot the fields of a Proverb row needed by the API."""
+    return {
+        "id": proverb.id,
+        "yoruba_text": proverb.yoruba_text,
+        "english_translation": proverb.english_translation,
+        "meaning": proverb.meaning,
+        "category": proverb.category,
+        "created_at": proverb.created_at,
+    }
+
+
+class ProverbPool:
+    """
+    Process-local pool of proverb ids, overall and per category.
+
+    A random pick is a ``random.sample`` over the pool followed by a
+    primary-key fetch, or no query at all when the rows are cached.
+    Rows are cached in ``cache``, shared between replicas when it is
+    backed by Redis. Writers must call ``add`` so new proverbs join the
+    pool, and ``invalidate`` after changing existing rows.
+    """
+
+    def __init__(
+        self, cache_size: int = 1000, cache: Optional[SharedCache] = None
+    ):
+        self._ids: List[int] = []
+        self._id_set = set()
+        self._by_category: Dict[str, List[int]] = {}
+        self._max_id = 0
+        self._cache = cache or SharedCache(
+            "proverbs", LocalCacheBackend(cache_size), ttl=None
+        )
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    async def load(self, db: AsyncSession) -> int:
+        """
+        Build the pool from scratch from the proverbs table.
+
+        The new pool is filled off to the side and swapped in with no
+        await in between, so picks keep using the old one until then.
+        """
+        rows = await self._read(db, 0)
+        max_id = rows[-1][0] if rows else 0
+        # Ids added while the query ran, past what it read, stay
+        categories = {
+            proverb_id: category
+            for category, ids in self._by_category.items()
+            for proverb_id in ids if proverb_id > max_id
+        }
+        added = [
+            (proverb_id, categories.get(proverb_id))
+            for proverb_id in self._ids if proverb_id > max_id
+        ]
+        ids: List[int] = []
+        id_set = set()
+        by_category: Dict[str, List[int]] = {}
+        for proverb_id, category in rows + added:
+            if proverb_id in id_set:
+                continue
+            id_set.add(proverb_id)
+            ids.append(proverb_id)
+            if category:
+                by_category.setdefault(category, []).append(proverb_id)
+        self._ids, self._id_set, self._by_category = ids, id_set, by_category
+        self._max_id = max_id
+        self.loaded = True
+        logger.info(f"Proverb pool loaded with {len(rows)} ids")
+        return len(rows)
+
+    async def refresh(self, db: AsyncSession) -> int:
+        """Add proverbs with an id greater than any already pooled."""
+        rows = await self._read(db, self._max_id)
+        for proverb_id, category in rows:
+            self._add_id(proverb_id, category)
+        if rows:
+            # Only rows read here advance the watermark, so ids added by
+            # this process cannot hide older rows from other replicas
+            self._max_id = max(self._max_id, rows[-1][0])
+        return len(rows)
+
+    async def _read(self, db: AsyncSession, after_id: int) -> List[tuple]:
+        """(id, category) of every proverb with an id above ``after_id``."""
+        return list((await db.execute(
+            select(Proverb.id, Proverb.category)
+            .where(Proverb.id > after_id)
+            .order_by(Proverb.id)
+        )).all())
+
+    async def add(self, proverb: Proverb) -> None:
+        """Pool a newly inserted proverb and cache its row."""
+        self._add_id(proverb.id, proverb.category)
+        await self._cache.set(str(proverb.id), proverb_to_entry(proverb))
+
+    async def invalidate(self) -> None:
+        """Drop cached rows, on every replica, after rows were changed."""
+        await self._cache.invalidate()
+
+    def _add_id(self, proverb_id: int, category: Optional[str]) -> None:
+        if proverb_id in self._id_set:
+            return
+        self._id_set.add(proverb_id)
+        self._ids.append(proverb_id)
+        if category:
+            self._by_category.setdefault(category, []).append(proverb_id)
+
+    def _remove_id(self, proverb_id: int) -> None:
+        """Forget an id whose row no longer exists."""
+        if proverb_id in self._id_set:
+            self._id_set.discard(proverb_id)
+            self._ids.remove(proverb_id)
+        for ids in self._by_category.values():
+            if proverb_id in ids:
+                ids.remove(proverb_id)
+
+    async def pick(
+        self,
+        db: AsyncSession,
+        count: int = 1,
+        category: Optional[str] = None
+    ) -> List[Dict[str, any]]:
+        """Return up to ``count`` distinct random proverbs."""
+        if not self.loaded:
+            await self.load(db)
+
+        pool = self._by_category.get(category, []) if category else self._ids
+        ids = random.sample(pool, min(count, len(pool)))
+
+        cached = await self._cache.get_many([str(i) for i in ids])
+        entries = {int(key): entry for key, entry in cached.items()}
+        missing = [i for i in ids if i not in entries]
+
+        if missing:
+            proverbs = (await db.scalars(
+                select(Proverb).where(Proverb.id.in_(missing))
+            )).all()
+            for proverb in proverbs:
+                entries[proverb.id] = proverb_to_entry(proverb)
+            await self._cache.set_many({
+                str(proverb.id): entries[proverb.id] for proverb in proverbs
+            })
+            for proverb_id in set(missing) - set(entries):
+                self._remove_id(proverb_id)
+
+        return [entries[i] for i in ids if i in entries]
+
+
+# Global instance
+proverb_pool = ProverbPool(
+    cache=shared_cache("proverbs", settings.proverb_cache_size, ttl=None)
+)
+
+
+async def load_proverb_pool() -> int:
+    """Build the global pool from the database."""
+    async with AsyncSessionLocal() as db:
+        return await proverb_pool.load(db)
+
+
+async def refresh_proverb_pool() -> int:
+    """Pick up proverbs inserted since the pool was last loaded."""
+    async with AsyncSessionLocal() as db:
+        return await proverb_pool.refresh(db)
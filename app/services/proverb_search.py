@@ -0,0 +1,286 @@
+"""
+Full-text proverb search for the Yoruba Language API.
+Uses SQLite FTS5 or a PostgreSQL tsvector GIN index, folding diacritics.
+"""
+
+import html
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.services.normalization import normalize_yoruba
+from app.services.pagination import cached_count, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIELDS = ("yoruba_text", "english_translation", "meaning")
+
+# Words, including combining tone marks on decomposed text
+_TOKEN_RE = re.compile(r"[\w\u0300-\u036f]+")
+
+_SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS proverbs_fts USING fts5(
+        yoruba_text, english_translation, meaning,
+        content='proverbs', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS proverbs_fts_insert
+    AFTER INSERT ON proverbs BEGIN
+        INSERT INTO proverbs_fts(
+            rowid, yoruba_text, english_translation, meaning
+        )
+        VALUES (new.id, new.yoruba_text, new.english_translation, new.meaning);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS proverbs_fts_delete
+    AFTER DELETE ON proverbs BEGIN
+        INSERT INTO proverbs_fts(
+            proverbs_fts, rowid, yoruba_text, english_translation, meaning
+        )
+        VALUES (
+            'delete', old.id, old.yoruba_text, old.english_translation,
+            old.meaning
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS proverbs_fts_update
+    AFTER UPDATE ON proverbs BEGIN
+        INSERT INTO proverbs_fts(
+            proverbs_fts, rowid, yoruba_text, english_translation, meaning
+        )
+        VALUES (
+            'delete', old.id, old.yoruba_text, old.english_translation,
+            old.meaning
+        );
+        INSERT INTO proverbs_fts(
+            rowid, yoruba_text, english_translation, meaning
+        )
+        VALUES (new.id, new.yoruba_text, new.english_translation, new.meaning);
+    END
+    """,
+)
+
+# The index expression and the query expression must match exactly
+_PG_VECTOR = (
+    "to_tsvector('simple', yoruba_fold(yoruba_text) || ' ' || "
+    "yoruba_fold(english_translation) || ' ' || yoruba_fold(meaning))"
+)
+
+_PG_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION yoruba_fold(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT lower(public.unaccent('public.unaccent'::regdictionary,
+                                     coalesce($1, '')))
+    $$
+    """,
+    f"CREATE INDEX IF NOT EXISTS ix_proverbs_search "
+    f"ON proverbs USING GIN ({_PG_VECTOR})",
+)
+
+
+def query_terms(q: str) -> List[str]:
+    """Split a user query into folded search terms."""
+    return _TOKEN_RE.findall(normalize_yoruba(q))
+
+
+def highlight(value: Optional[str], terms: List[str]) -> Optional[str]:
+    """
+    Wrap words of ``value`` matching any term in <b> tags.
+
+    Matching is done on folded words so the original diacritics are kept
+    in the output. The last term matches as a prefix, like the query.
+    """
+    if not value:
+        return value
+    exact = set(terms[:-1])
+    prefix = terms[-1] if terms else None
+
+    parts = []
+    last = 0
+    for match in _TOKEN_RE.finditer(value):
+        folded = normalize_yoruba(match.group())
+        if folded in exact or (prefix and folded.startswith(prefix)):
+            parts.append(html.escape(value[last:match.start()]))
+            parts.append(f"<b>{html.escape(match.group())}</b>")
+            last = match.end()
+    parts.append(html.escape(value[last:]))
+    return "".join(parts)
+
+
+class ProverbSearch:
+    """
+    Ranked full-text search over proverbs.
+
+    ``install`` creates the index for the current database: an external
+    content FTS5 table kept in sync by triggers on SQLite, or a GIN
+    expression index on PostgreSQL. Both are maintained by the database
+    itself, so ORM inserts and bulk loads are indexed without extra code.
+    Other databases fall back to an unranked LIKE scan.
+    """
+
+    def __init__(self):
+        self.backend: Optional[str] = None
+
+    async def install(self, engine: AsyncEngine) -> Optional[str]:
+        """Create the search index if the database supports one."""
+        dialect = engine.dialect.name
+        try:
+            async with engine.begin() as conn:
+                if dialect == "sqlite":
+                    exists = await conn.scalar(text(
+                        "SELECT count(*) FROM sqlite_master "
+                        "WHERE name = 'proverbs_fts'"
+                    ))
+                    for statement in _SQLITE_DDL:
+                        await conn.exec_driver_sql(statement)
+                    if not exists:
+                        # Index proverbs written before the table existed
+                        await conn.exec_driver_sql(
+                            "INSERT INTO proverbs_fts(proverbs_fts) "
+                            "VALUES ('rebuild')"
+                        )
+                    self.backend = "fts5"
+                elif dialect == "postgresql":
+                    for statement in _PG_DDL:
+                        await conn.exec_driver_sql(statement)
+                    self.backend = "tsvector"
+        except Exception as e:
+            logger.warning(f"Full-text proverb search unavailable: {str(e)}")
+            self.backend = None
+        logger.info(f"Proverb search backend: {self.backend or 'like'}")
+        return self.backend
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], int, int, Optional[str]]:
+        """
+        Search proverbs, best matches first.
+
+        Pages are keyed on (score, id), where a lower score is a better
+        match. Returns the hits, the total match count, the 1-based page
+        number and the next cursor, if any.
+        """
+        terms = query_terms(q)
+        if not terms:
+            return [], 0, 1, None
+
+        page = 1
+        after = None
+        if cursor:
+            state = decode_cursor(cursor)
+            if not isinstance(state.get("score"), (int, float)):
+                raise ValueError("Invalid cursor")
+            page = int(state.get("page", 1))
+            after = (state["score"], state["id"])
+
+        matches, params = self._match_sql(terms)
+        if category:
+            matches += " AND p.category = :category"
+            params["category"] = category
+        match_params = dict(params)
+
+        page_sql = f"SELECT * FROM ({matches}) AS m"
+        if after:
+            page_sql += (
+                " WHERE m.score > :after_score"
+                " OR (m.score = :after_score AND m.id > :after_id)"
+            )
+            params.update(after_score=after[0], after_id=after[1])
+        page_sql += " ORDER BY m.score, m.id LIMIT :limit"
+        params["limit"] = limit + 1
+
+        rows = (await db.execute(
+            text(page_sql).columns(created_at=DateTime), params
+        )).mappings().all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({
+                "id": rows[-1]["id"],
+                "page": page + 1,
+                "score": rows[-1]["score"],
+            })
+
+        total = await cached_count(
+            db,
+            "proverbs",
+            text(matches).bindparams(**match_params).columns(),
+            key=("search", tuple(terms), category)
+        )
+
+        hits = [self._hit(row, terms) for row in rows]
+        return hits, total, page, next_cursor
+
+    def _match_sql(self, terms: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Build the SQL selecting matching proverbs with a score."""
+        columns = (
+            "p.id, p.yoruba_text, p.english_translation, p.meaning, "
+            "p.category, p.created_at"
+        )
+        if self.backend == "fts5":
+            # Quote every term so user input cannot inject FTS syntax
+            match = " ".join(f'"{t}"' for t in terms[:-1])
+            match = f'{match} "{terms[-1]}"*'.strip()
+            return (
+                f"SELECT {columns}, "
+                f"bm25(proverbs_fts, 3.0, 1.0, 1.0) AS score "
+                f"FROM proverbs_fts JOIN proverbs AS p "
+                f"ON p.id = proverbs_fts.rowid "
+                f"WHERE proverbs_fts MATCH :q"
+            ), {"q": match}
+
+        if self.backend == "tsvector":
+            tsquery = " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+            return (
+                f"SELECT {columns}, "
+                f"-ts_rank({_PG_VECTOR}, to_tsquery('simple', :q)) AS score "
+                f"FROM proverbs AS p "
+                f"WHERE {_PG_VECTOR} @@ to_tsquery('simple', :q)"
+            ), {"q": tsquery}
+
+        conditions = []
+        params = {}
+        for i, term in enumerate(terms):
+            params[f"term{i}"] = f"%{term}%"
+            conditions.append("(" + " OR ".join(
+                f"lower(p.{field}) LIKE :term{i}" for field in SEARCH_FIELDS
+            ) + ")")
+        return (
+            f"SELECT {columns}, 0 AS score FROM proverbs AS p "
+            f"WHERE {' AND '.join(conditions)}"
+        ), params
+
+    @staticmethod
+    def _hit(row, terms: List[str]) -> Dict[str, Any]:
+        hit = {
+            key: row[key] for key in (
+                "id", "yoruba_text", "english_translation", "meaning",
+                "category", "created_at"
+            )
+        }
+        hit["score"] = row["score"]
+        hit["highlights"] = {
+            field: highlight(row[field], terms)
+            for field in SEARCH_FIELDS
+            if row[field]
+        }
+        return hit
+
+
+# Global instance
+proverb_search = ProverbSearch()
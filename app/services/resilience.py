@@ -0,0 +1,266 @@
+"""
+Resilience layer for the AI translation service.
+Adds deadlines, a circuit breaker, jittered retries and hedged requests.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker is rejecting calls."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call runs past its overall deadline."""
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker over a rolling window of calls.
+
+    The breaker opens once at least ``min_calls`` outcomes are recorded
+    and the share of failures reaches ``failure_rate_threshold``. After
+    ``open_seconds`` it lets a single probe through (half-open); the
+    probe's outcome closes or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30,
+        name: str = "AI"
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._outcomes = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open after cooldown."""
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allows_requests(self) -> bool:
+        """Check whether a call would currently be let through."""
+        state = self.state
+        return state == self.CLOSED or (
+            state == self.HALF_OPEN and not self._probe_in_flight
+        )
+
+    def before_call(self) -> None:
+        """Reserve a call, raising CircuitOpenError if it is rejected."""
+        state = self.state
+        if state == self.OPEN or (
+            state == self.HALF_OPEN and self._probe_in_flight
+        ):
+            self.rejected += 1
+            raise CircuitOpenError(
+                "AI translation is temporarily unavailable "
+                "after repeated failures"
+            )
+        if state == self.HALF_OPEN:
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self._state == self.HALF_OPEN:
+            logger.info(f"{self.name} circuit breaker closed")
+            self._state = self.CLOSED
+            self._outcomes.clear()
+        self._probe_in_flight = False
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker past the threshold."""
+        self._probe_in_flight = False
+        if self._state == self.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        if (
+            self._state == self.CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self.failure_rate() >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def record_cancelled(self) -> None:
+        """Release a reserved call that was cancelled before finishing."""
+        self._probe_in_flight = False
+
+    def failure_rate(self) -> float:
+        """Share of failed calls in the rolling window."""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _open(self) -> None:
+        logger.warning(f"{self.name} circuit breaker opened")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return breaker state and counters for monitoring."""
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate(), 3),
+            "window_calls": len(self._outcomes),
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
+
+
+class ResilientAIService:
+    """
+    Wrap an async AI translation service with resilience policies.
+
+    Every call gets an overall deadline. Failed attempts are retried with
+    exponential backoff and full jitter while the deadline allows. When
+    ``hedge_delay`` is set, a second attempt is started if the first has
+    not answered by then, and whichever finishes first wins. All attempts
+    go through the circuit breaker.
+    """
+
+    def __init__(
+        self,
+        service,
+        breaker: Optional[CircuitBreaker] = None,
+        deadline: float = 15.0,
+        max_attempts: int = 3,
+        backoff: float = 0.2,
+        max_backoff: float = 2.0,
+        hedge_delay: Optional[float] = None
+    ):
+        self.service = service
+        self.breaker = breaker or CircuitBreaker()
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hedge_delay = hedge_delay
+        self.retries = 0
+        self.hedges = 0
+        self.timeouts = 0
+
+    async def translate_to_yoruba_async(
+        self, english_text: str
+    ) -> Dict[str, any]:
+        """Translate a word under the resilience policies."""
+        return await self.call(
+            lambda: self.service.translate_to_yoruba_async(english_text)
+        )
+
+    async def translate_many_to_yoruba_async(self, english_texts):
+        """Translate several words under the resilience policies."""
+        return await self.call(
+            lambda: self.service.translate_many_to_yoruba_async(
+                english_texts
+            )
+        )
+
+    async def call(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func`` with a deadline, retries and optional hedging."""
+        if not self.breaker.allows_requests():
+            self.breaker.before_call()
+        try:
+            return await asyncio.wait_for(
+                self._retry(func), timeout=self.deadline
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.breaker.record_failure()
+            raise DeadlineExceededError(
+                f"AI translation exceeded its {self.deadline}s deadline"
+            )
+
+    async def _retry(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        for attempt in range(self.max_attempts):
+            try:
+                return await self._hedged(func)
+            except CircuitOpenError:
+                raise
+            except Exception as e:
+                if attempt + 1 >= self.max_attempts:
+                    raise
+                self.retries += 1
+                delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+                logger.warning(
+                    f"AI attempt {attempt + 1} failed, retrying: {str(e)}"
+                )
+                await asyncio.sleep(random.uniform(0, delay))
+
+    async def _hedged(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        primary = asyncio.ensure_future(self._attempt(func))
+        if not self.hedge_delay:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay)
+            if done or self.breaker.state != CircuitBreaker.CLOSED:
+                return await primary
+
+            self.hedges += 1
+            pending.add(asyncio.ensure_future(self._attempt(func)))
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+
+    async def _attempt(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        self.breaker.before_call()
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self.breaker.record_cancelled()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return breaker state and policy counters for monitoring."""
+        return {
+            **self.breaker.stats(),
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "timeouts": self.timeouts,
+        }
@@ -0,0 +1,113 @@
+"""
+Yoruba to English reverse lookup for the Yoruba Language API.
+Matches on the indexed, diacritic-folded yoruba_normalized column.
+"""
+
+import logging
+from typing import List
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database import Translation
+from app.services.normalization import normalize_yoruba
+
+logger = logging.getLogger(__name__)
+
+
+def _missing_normalized_column(sync_conn) -> bool:
+    columns = inspect(sync_conn).get_columns("translations")
+    return "yoruba_normalized" not in {column["name"] for column in columns}
+
+
+async def ensure_normalized_column(engine: AsyncEngine) -> None:
+    """Add yoruba_normalized and its index to databases created before it."""
+    async with engine.begin() as conn:
+        if await conn.run_sync(_missing_normalized_column):
+            logger.info("Adding translations.yoruba_normalized column")
+            await conn.execute(text(
+                "ALTER TABLE translations "
+                "ADD COLUMN yoruba_normalized VARCHAR(100)"
+            ))
+            await conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_translations_yoruba_normalized "
+                "ON translations (yoruba_normalized)"
+            ))
+
+
+async def backfill_yoruba_normalized(
+    engine: AsyncEngine, chunk_size: int = 1000
+) -> int:
+    """
+    Fill yoruba_normalized for rows written before the column existed.
+
+    Rows are read in id order a chunk at a time and updated with one
+    executemany per chunk. Returns the number of rows filled.
+    """
+    filled = 0
+    last_id = 0
+    while True:
+        async with engine.begin() as conn:
+            rows = (await conn.execute(
+                select(Translation.id, Translation.yoruba_word)
+                .where(
+                    Translation.id > last_id,
+                    Translation.yoruba_normalized.is_(None)
+                )
+                .order_by(Translation.id)
+                .limit(chunk_size)
+            )).all()
+            if not rows:
+                break
+            await conn.execute(
+                update(Translation.__table__)
+                .where(Translation.__table__.c.id == bindparam("row_id"))
+                .values(yoruba_normalized=bindparam("normalized")),
+                [
+                    {"row_id": row_id, "normalized": normalize_yoruba(word)}
+                    for row_id, word in rows
+                ]
+            )
+        filled += len(rows)
+        last_id = rows[-1][0]
+    if filled:
+        logger.info(f"Backfilled yoruba_normalized for {filled} translations")
+    return filled
+
+
+async def reverse_lookup(
+    db: AsyncSession, word: str, limit: int = 20
+) -> List[Translation]:
+    """
+    Find translations whose Yoruba word matches ``word``, ignoring tone
+    marks, under-dots and case.
+
+    Exact matches on the folded form come first, then words starting
+    with it. Each is its own query, ordered by the indexed column (and
+    id), so the index returns rows in order and LIMIT stops the scan.
+    """
+    normalized = normalize_yoruba(word)
+    if not normalized:
+        return []
+
+    matches = list((await db.scalars(
+        select(Translation)
+        .where(Translation.yoruba_normalized == normalized)
+        .order_by(Translation.id)
+        .limit(limit)
+    )).all())
+    if len(matches) == limit:
+        return matches
+
+    # Every longer string starting with the prefix sorts inside this range
+    prefix_end = normalized + "\uffff"
+    matches.extend((await db.scalars(
+        select(Translation)
+        .where(
+            Translation.yoruba_normalized > normalized,
+            Translation.yoruba_normalized < prefix_end
+        )
+        .order_by(Translation.yoruba_normalized, Translation.id)
+        .limit(limit - len(matches))
+    )).all())
+    return matches
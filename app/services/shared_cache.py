@@ -0,0 +1,507 @@
+"""
+Cache shared by every replica of the Yoruba Language API.
+Namespaced, versioned entries in process memory or in Redis.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from app.config import settings
+from app.services.cache import MISS, LRUCache
+from app.services.resilience import CircuitBreaker, CircuitOpenError
+from app.services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# What backends store: (value, expires_at as a Unix time, negative)
+Entry = tuple
+
+
+class LocalCacheBackend:
+    """Process-local backend over an LRUCache; one per namespace."""
+
+    name = "local"
+
+    def __init__(self, maxsize: int = 10000):
+        self._data = LRUCache(maxsize=maxsize, ttl=None, negative_ttl=None)
+        self._counters: Dict[str, int] = {}
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Entry]]:
+        values = [self._data.get(key) for key in keys]
+        return [None if value is MISS else value for value in values]
+
+    async def set_many(
+        self, entries: Dict[str, Entry], ttl: Optional[float]
+    ) -> None:
+        for key, entry in entries.items():
+            self._data.set(key, entry, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.delete(key)
+
+    async def add(self, key: str, ttl: float) -> bool:
+        """Set ``key`` only if it is absent, as a short-lived lock."""
+        if self._data.get(key) is not MISS:
+            return False
+        self._data.set(key, True, ttl=ttl)
+        return True
+
+    async def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    def size(self) -> int:
+        return len(self._data)
+
+
+def _to_json(value: Any) -> Any:
+    """
+    Turn a cached value into JSON types, tagging the types JSON lacks
+    (tuples, datetimes, dates and bytes) so ``_from_json`` restores them.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, tuple):
+        return {"__tuple__": [_to_json(item) for item in value]}
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict) and all(isinstance(k, str) for k in value):
+        return {key: _to_json(item) for key, item in value.items()}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, bytes):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Cannot cache a {type(value).__name__} value")
+
+
+def _from_json(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        tag, value = next(iter(obj.items()))
+        if tag == "__tuple__":
+            return tuple(value)
+        if tag == "__datetime__":
+            return datetime.fromisoformat(value)
+        if tag == "__date__":
+            return date.fromisoformat(value)
+        if tag == "__bytes__":
+            return base64.b64decode(value)
+    return obj
+
+
+def dumps(entry: Entry) -> bytes:
+    """Serialize a cache entry as JSON."""
+    return json.dumps(_to_json(entry), separators=(",", ":")).encode()
+
+
+def loads(raw: bytes) -> Entry:
+    return json.loads(raw, object_hook=_from_json)
+
+
+class RedisCacheBackend:
+    """
+    Backend over any Redis-protocol client (``redis.asyncio.Redis``, or
+    ``fakeredis.FakeAsyncRedis`` in tests).
+
+    Values are stored as JSON (see ``dumps``), so unlike pickle, reading
+    an entry cannot run code whoever wrote it. Entries without a TTL
+    rely on the server's eviction policy, e.g. ``maxmemory-policy
+    allkeys-lru``.
+    """
+
+    name = "redis"
+
+    def __init__(self, client):
+        self._redis = client
+
+    async def get_many(self, keys: List[str]) -> List[Optional[Entry]]:
+        raw = await self._redis.mget(keys)
+        return [loads(value) if value else None for value in raw]
+
+    async def set_many(
+        self, entries: Dict[str, Entry], ttl: Optional[float]
+    ) -> None:
+        px = int(ttl * 1000) if ttl else None
+        pipe = self._redis.pipeline(transaction=False)
+        for key, entry in entries.items():
+            pipe.set(key, dumps(entry), px=px)
+        await pipe.execute()
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def add(self, key: str, ttl: float) -> bool:
+        return bool(await self._redis.set(
+            key, b"1", nx=True, px=int(ttl * 1000)
+        ))
+
+    async def counter(self, key: str) -> int:
+        return int(await self._redis.get(key) or 0)
+
+    async def incr(self, key: str) -> int:
+        return await self._redis.incr(key)
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+_redis_client = None
+# Shared by every namespace, so one outage trips it for all of them
+_redis_breaker = CircuitBreaker(open_seconds=10, name="Redis cache")
+
+
+def _redis_backend(url: str) -> RedisCacheBackend:
+    """One client, and so one connection pool, for every namespace."""
+    global _redis_client
+    if _redis_client is None:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError(
+                "REDIS_URL is set but the redis package is not installed"
+            )
+        _redis_client = redis.Redis.from_url(
+            url,
+            socket_timeout=settings.cache_redis_timeout_seconds,
+            socket_connect_timeout=settings.cache_redis_timeout_seconds
+        )
+    return RedisCacheBackend(_redis_client)
+
+
+class SharedCache:
+    """
+    Async cache for one namespace, kept in a pluggable backend.
+
+    Keys are stored as ``<prefix>:<namespace>:<version>:<key>``.
+    ``invalidate`` bumps the namespace version in the backend, which
+    retires every entry at once on every replica; replicas re-read the
+    version at most every ``version_check_seconds``. As in LRUCache,
+    negative entries record misses for ``negative_ttl`` seconds.
+
+    ``get_or_load`` protects loaders from stampedes: concurrent callers
+    in a process share one load, replicas take a lock in the backend so
+    only one of them loads while the others wait for its result, and an
+    entry in the last ``early_refresh`` part of its life is refreshed
+    by one caller while the rest keep getting the current value.
+
+    Backend errors are logged and treated as misses, so an unreachable
+    Redis slows requests down rather than failing them, and ``breaker``
+    stops calling a failing backend for a while.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        backend=None,
+        ttl: Optional[float] = 3600,
+        negative_ttl: Optional[float] = 60,
+        prefix: str = "yoruba",
+        version_check_seconds: float = 1.0,
+        lock_seconds: float = 5.0,
+        early_refresh: float = 0.1,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.namespace = namespace
+        self.backend = backend or LocalCacheBackend()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.version_check_seconds = version_check_seconds
+        self.lock_seconds = lock_seconds
+        self.early_refresh = early_refresh
+        self._prefix = f"{prefix}:{namespace}"
+        self._version = 0
+        self._version_checked = float("-inf")
+        self._breaker = breaker or CircuitBreaker(name="Cache")
+        self._flights = SingleFlight()
+        self._refreshing: set = set()
+        self._refresh_tasks: set = set()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.refreshes = 0
+        self.lock_waits = 0
+        self.invalidations = 0
+        self.errors = 0
+        self.skipped = 0
+
+    async def _call(self, method, *args):
+        """Call the backend through the circuit breaker."""
+        self._breaker.before_call()
+        try:
+            result = await method(*args)
+        except asyncio.CancelledError:
+            self._breaker.record_cancelled()
+            raise
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return result
+
+    async def _current_version(self) -> int:
+        now = time.monotonic()
+        if now - self._version_checked >= self.version_check_seconds:
+            self._version = await self._call(
+                self.backend.counter, f"{self._prefix}:version"
+            )
+            self._version_checked = now
+        return self._version
+
+    async def _keys(self, keys: Iterable[str]) -> List[str]:
+        version = await self._current_version()
+        return [f"{self._prefix}:{version}:{key}" for key in keys]
+
+    def _failed(self, action: str, error: Exception) -> None:
+        if isinstance(error, CircuitOpenError):
+            self.skipped += 1
+            return
+        self.errors += 1
+        logger.warning(
+            f"Cache {action} failed for {self.namespace}: {str(error)}"
+        )
+
+    def _count(self, entry: Optional[Entry]) -> None:
+        if entry is None:
+            self.misses += 1
+        elif entry[2]:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+
+    async def get(self, key: str) -> Any:
+        """Return the cached value, or ``MISS`` if absent or expired."""
+        return (await self.get_many([key])).get(key, MISS)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return the cached values of whichever ``keys`` are present."""
+        if not keys:
+            return {}
+        try:
+            entries = await self._call(
+                self.backend.get_many, await self._keys(keys)
+            )
+        except Exception as e:
+            self._failed("read", e)
+            entries = [None] * len(keys)
+        found = {}
+        for key, entry in zip(keys, entries):
+            self._count(entry)
+            if entry is not None:
+                found[key] = entry[0]
+        return found
+
+    async def set(
+        self, key: str, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Cache a positive value."""
+        await self.set_many({key: value}, ttl)
+
+    async def set_many(
+        self, items: Dict[str, Any], ttl: Optional[float] = None
+    ) -> None:
+        await self._store(items, self.ttl if ttl is None else ttl, False)
+
+    async def set_negative(self, key: str, value: Any = None) -> None:
+        """Cache a short-lived negative value for a miss or fallback."""
+        await self._store({key: value}, self.negative_ttl, True)
+
+    async def set_many_negative(self, keys: Iterable[str]) -> None:
+        await self._store(dict.fromkeys(keys), self.negative_ttl, True)
+
+    async def _store(
+        self, items: Dict[str, Any], ttl: Optional[float], negative: bool
+    ) -> None:
+        if not items or ttl == 0:
+            return
+        expires_at = float("inf") if ttl is None else time.time() + ttl
+        try:
+            keys = await self._keys(items)
+            entries = {
+                full_key: (value, expires_at, negative)
+                for full_key, value in zip(keys, items.values())
+            }
+            await self._call(self.backend.set_many, entries, ttl)
+        except Exception as e:
+            self._failed("write", e)
+
+    async def delete(self, key: str) -> None:
+        try:
+            full_key = (await self._keys([key]))[0]
+            await self._call(self.backend.delete, full_key)
+        except Exception as e:
+            self._failed("delete", e)
+
+    async def version(self) -> int:
+        """The namespace version, bumped by every ``invalidate``."""
+        return await self._current_version()
+
+    async def invalidate(self) -> None:
+        """Retire every entry of the namespace, on every replica."""
+        self.invalidations += 1
+        try:
+            self._version = await self._call(
+                self.backend.incr, f"{self._prefix}:version"
+            )
+            self._version_checked = time.monotonic()
+        except Exception as e:
+            self._failed("invalidation", e)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        negative: Callable[[Any], bool] = lambda value: value is None
+    ) -> Any:
+        """
+        Return the cached value of ``key``, loading and caching it on a
+        miss. Values for which ``negative`` is true are cached as misses.
+        """
+        try:
+            full_key = (await self._keys([key]))[0]
+            entry = await self._get_entry(full_key)
+        except Exception as e:
+            self._failed("read", e)
+            return await loader()
+        self._count(entry)
+
+        if entry is None:
+            return await self._flights.do(
+                full_key, lambda: self._load(full_key, loader, negative)
+            )
+
+        value, expires_at, is_negative = entry
+        ttl = self.negative_ttl if is_negative else self.ttl
+        if (
+            ttl
+            and expires_at - time.time() < ttl * self.early_refresh
+            and full_key not in self._refreshing
+        ):
+            self._refreshing.add(full_key)
+            # Keep a reference, or the task may be collected mid-refresh
+            task = asyncio.ensure_future(
+                self._refresh(full_key, loader, negative)
+            )
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return value
+
+    async def _get_entry(self, full_key: str) -> Optional[Entry]:
+        return (await self._call(self.backend.get_many, [full_key]))[0]
+
+    async def _lock(self, lock_key: str) -> bool:
+        return await self._call(self.backend.add, lock_key, self.lock_seconds)
+
+    async def _load(self, full_key: str, loader, negative) -> Any:
+        lock_key = f"{full_key}:lock"
+        try:
+            locked = await self._lock(lock_key)
+        except Exception as e:
+            self._failed("lock", e)
+            locked = True
+        if not locked:
+            # Another replica is loading this key; wait for its result
+            self.lock_waits += 1
+            deadline = time.monotonic() + self.lock_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+                try:
+                    entry = await self._get_entry(full_key)
+                except Exception:
+                    break
+                if entry is not None:
+                    return entry[0]
+        try:
+            return await self._load_and_store(full_key, loader, negative)
+        finally:
+            if locked:
+                try:
+                    await self._call(self.backend.delete, lock_key)
+                except Exception:
+                    pass
+
+    async def _refresh(self, full_key: str, loader, negative) -> None:
+        try:
+            lock_key = f"{full_key}:lock"
+            if await self._lock(lock_key):
+                self.refreshes += 1
+                try:
+                    await self._load_and_store(full_key, loader, negative)
+                finally:
+                    await self._call(self.backend.delete, lock_key)
+        except Exception as e:
+            self._failed("refresh", e)
+        finally:
+            self._refreshing.discard(full_key)
+
+    async def _load_and_store(self, full_key: str, loader, negative) -> Any:
+        self.loads += 1
+        value = await loader()
+        is_negative = negative(value)
+        ttl = self.negative_ttl if is_negative else self.ttl
+        if ttl != 0:
+            expires_at = float("inf") if ttl is None else time.time() + ttl
+            try:
+                await self._call(
+                    self.backend.set_many,
+                    {full_key: (value, expires_at, is_negative)},
+                    ttl
+                )
+            except Exception as e:
+                self._failed("write", e)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for monitoring."""
+        return {
+            "backend": self.backend.name,
+            "size": self.backend.size(),
+            "version": self._version,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "refreshes": self.refreshes,
+            "lock_waits": self.lock_waits,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "skipped": self.skipped,
+            "breaker": self._breaker.state,
+        }
+
+
+def shared_cache(
+    namespace: str,
+    maxsize: int,
+    ttl: Optional[float] = 3600,
+    negative_ttl: Optional[float] = 60
+) -> SharedCache:
+    """
+    Build the cache for a namespace: in Redis when ``REDIS_URL`` is set,
+    so replicas share it, otherwise in process memory (``maxsize``
+    entries).
+    """
+    breaker = None
+    if settings.redis_url:
+        backend = _redis_backend(settings.redis_url)
+        breaker = _redis_breaker
+    else:
+        backend = LocalCacheBackend(maxsize)
+    return SharedCache(
+        namespace,
+        backend,
+        breaker=breaker,
+        ttl=ttl,
+        negative_ttl=negative_ttl,
+        prefix=settings.cache_prefix,
+        version_check_seconds=settings.cache_version_check_seconds
+    )
@@ -0,0 +1,53 @@
+"""
+Single-flight call coalescing.
+Concurrent callers asking for the same key share one in-flight execution.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls by key.
+
+    The first caller for a key starts the work as a task; callers that
+    arrive while it is running await the same task instead of starting
+    their own. The task is shielded so a cancelled caller does not cancel
+    the work for everyone else.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(
+        self, key: str, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``func`` once for all concurrent callers of ``key``."""
+        task = self._tasks.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished task so the next call starts fresh."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved if every caller went away
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._tasks),
+        }
@@ -0,0 +1,247 @@
+"""
+Document-scale tone marking for the Yoruba Language API.
+Splits large inputs at sentence boundaries and marks them in a process pool.
+"""
+
+import asyncio
+import codecs
+import multiprocessing
+import re
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import IO, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.tone_lexicon import (
+    ToneLexicon,
+    current_tone_lexicon,
+    set_tone_lexicon
+)
+from app.services import tone_service
+
+# End of a sentence: terminal punctuation or a line break, any closing
+# quotes or brackets, then whitespace
+_SENTENCE_END = re.compile(r"(?:[.!?…]+[\"'”’)\]]*|\n)\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_point(text: str, target: int) -> int:
+    """
+    Where to cut ``text`` so the first part is about ``target`` chars.
+
+    Prefers the last sentence end before ``2 * target``, then the last
+    whitespace, so words (and their combining tone marks) are never
+    split. Returns 0 if the text should not be cut yet.
+    """
+    limit = 2 * target
+    if len(text) < target:
+        return 0
+    window = text[:limit]
+    cut = 0
+    for match in _SENTENCE_END.finditer(window, target // 2):
+        cut = match.end()
+    if not cut:
+        for match in _WHITESPACE.finditer(window, target // 2):
+            cut = match.end()
+    if not cut and len(text) >= limit:
+        # One enormous word; nothing better to do
+        cut = limit
+    return cut
+
+
+async def spool_stream(
+    stream: AsyncIterator[bytes], max_bytes: int, max_memory: int = 1 << 20
+) -> IO[bytes]:
+    """
+    Copy a byte stream into a temporary file, in memory while small.
+
+    Raises ValueError once more than ``max_bytes`` have been read.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    size = 0
+    try:
+        async for data in stream:
+            size += len(data)
+            if size > max_bytes:
+                raise ValueError(f"Document is larger than {max_bytes} bytes")
+            spool.write(data)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+async def iter_file(file: IO[bytes], block_size: int = 65536):
+    """Read a file in blocks, yielding to the event loop between them."""
+    while True:
+        data = file.read(block_size)
+        if not data:
+            return
+        yield data
+        await asyncio.sleep(0)
+
+
+async def iter_sentence_chunks(
+    stream: AsyncIterator[bytes], target: int = 16384
+) -> AsyncIterator[str]:
+    """
+    Decode a UTF-8 byte stream and yield text chunks of roughly
+    ``target`` characters, each ending at a sentence boundary.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    async for data in stream:
+        buffer += decoder.decode(data)
+        while True:
+            cut = split_point(buffer, target)
+            if not cut:
+                break
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def _init_worker(
+    entries: Dict[str, str], source: str, model_path: Optional[str]
+) -> None:
+    """Give a pool process the parent's lexicon and tone model."""
+    set_tone_lexicon(ToneLexicon(entries, source))
+    if model_path:
+        tone_service.load_tone_model(model_path)
+
+
+def _mark_chunk(text: str, engine: str, budget_ms: Optional[int]) -> str:
+    return tone_service.add_tone_marks(text, engine, budget_ms)
+
+
+def _mark_texts(
+    texts: List[str], engine: str, budget_ms: Optional[int]
+) -> List[Tuple[str, bool]]:
+    return [tone_service.mark_text(t, engine, budget_ms) for t in texts]
+
+
+class ToneMarkingPool:
+    """
+    Process pool for CPU-bound tone marking.
+
+    Marking a large text in the event loop, or in a thread holding the
+    GIL, stalls every other request on the worker; pool processes do
+    not. Processes are started with the current lexicon and model, and
+    the pool is replaced when the lexicon is swapped. With no workers
+    configured, marking falls back to a thread.
+    """
+
+    def __init__(self, workers: int = 2, model_path: Optional[str] = None):
+        self.workers = workers
+        self.model_path = model_path
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lexicon_version: Optional[str] = None
+        self.chunks = 0
+        self.restarts = 0
+
+    def _current_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        lexicon = current_tone_lexicon()
+        if self._executor and self._lexicon_version == lexicon.version:
+            return self._executor
+        if self._executor:
+            # Running chunks finish on the old processes
+            self._executor.shutdown(wait=False)
+            self.restarts += 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(dict(lexicon.items()), lexicon.source, self.model_path)
+        )
+        self._lexicon_version = lexicon.version
+        return self._executor
+
+    async def mark(
+        self,
+        text: str,
+        engine: str,
+        budget_ms: Optional[int] = None
+    ) -> str:
+        """Mark one chunk of text off the event loop."""
+        return await self._run(_mark_chunk, text, engine, budget_ms)
+
+    async def mark_many(
+        self,
+        texts: List[str],
+        engine: str,
+        budget_ms: Optional[int] = None
+    ) -> List[Tuple[str, bool]]:
+        """
+        Mark a list of texts as one chunk of work, returning each
+        result with its ``mark_text`` completeness flag.
+        """
+        return await self._run(_mark_texts, texts, engine, budget_ms)
+
+    async def _run(self, func, *args):
+        self.chunks += 1
+        executor = self._current_executor()
+        if executor is None:
+            return await asyncio.to_thread(func, *args)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # A process died; start a fresh pool for the next chunk
+            self._executor = None
+            self.restarts += 1
+            raise
+
+    async def mark_stream(
+        self,
+        chunks: AsyncIterator[str],
+        engine: str,
+        budget_ms: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Mark chunks in parallel and yield the results in input order.
+
+        At most ``max_in_flight`` chunks are read ahead, so memory stays
+        bounded however long the input is.
+        """
+        max_in_flight = max_in_flight or max(2, 2 * self.workers)
+        pending: deque = deque()
+        try:
+            async for chunk in chunks:
+                pending.append(asyncio.ensure_future(
+                    self.mark(chunk, engine, budget_ms)
+                ))
+                if len(pending) >= max_in_flight:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "workers": self.workers,
+            "chunks": self.chunks,
+            "restarts": self.restarts,
+        }
+
+
+# Global instance
+tone_pool = ToneMarkingPool(
+    workers=settings.tone_pool_workers,
+    model_path=settings.tone_model_path
+)
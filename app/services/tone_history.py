@@ -0,0 +1,294 @@
+"""
+Content-addressed tone marking history for the Yoruba Language API.
+Keeps one row per distinct input with a hit count, and prunes old rows.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    and_,
+    case,
+    delete,
+    inspect,
+    or_,
+    select,
+    text,
+    update
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.config import settings
+from app.database import ToneMarking
+from app.services.pagination import invalidate_counts
+from app.services.write_behind import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+# Added to tone_markings after its first release, with their DDL
+_HISTORY_COLUMNS = {
+    "content_hash": "VARCHAR(64)",
+    "hit_count": "INTEGER NOT NULL DEFAULT 1",
+    "last_seen_at": "TIMESTAMP",
+}
+
+
+def content_hash(original_text: str) -> str:
+    """Key of a history row: the SHA-256 of the input text."""
+    return hashlib.sha256(original_text.encode("utf-8")).hexdigest()
+
+
+def _coalesce(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fold buffered rows for the same input into one, counting hits."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        key = content_hash(row["original_text"])
+        seen_at = row.get("created_at") or datetime.utcnow()
+        entry = merged.get(key)
+        if entry is None:
+            merged[key] = {
+                "content_hash": key,
+                "original_text": row["original_text"],
+                "tone_marked_text": row["tone_marked_text"],
+                "hit_count": 1,
+                "created_at": seen_at,
+                "last_seen_at": seen_at,
+            }
+        else:
+            # The latest marking wins, e.g. after a lexicon reload
+            entry["tone_marked_text"] = row["tone_marked_text"]
+            entry["hit_count"] += 1
+            entry["last_seen_at"] = max(entry["last_seen_at"], seen_at)
+    return list(merged.values())
+
+
+def _upsert_statement(dialect: str):
+    """INSERT ... ON CONFLICT (content_hash) DO UPDATE, where supported."""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    stmt = insert(ToneMarking)
+    return stmt.on_conflict_do_update(
+        index_elements=[ToneMarking.content_hash],
+        set_={
+            "tone_marked_text": stmt.excluded.tone_marked_text,
+            "hit_count": ToneMarking.hit_count + stmt.excluded.hit_count,
+            "last_seen_at": stmt.excluded.last_seen_at,
+        }
+    )
+
+
+async def write_tone_markings(
+    db: AsyncSession, rows: List[Dict[str, Any]]
+) -> None:
+    """
+    Record a batch of tone markings, one row per distinct input.
+
+    Inputs seen before only bump ``hit_count`` and ``last_seen_at``, so
+    the table grows with the number of distinct texts, not requests.
+    """
+    rows = _coalesce(rows)
+    stmt = _upsert_statement(db.bind.dialect.name)
+    if stmt is not None:
+        await db.execute(stmt, rows)
+        return
+
+    existing = dict((await db.execute(
+        select(ToneMarking.content_hash, ToneMarking.id)
+        .where(ToneMarking.content_hash.in_([r["content_hash"] for r in rows]))
+    )).all())
+    for row in rows:
+        row_id = existing.get(row["content_hash"])
+        if row_id is None:
+            db.add(ToneMarking(**row))
+        else:
+            await db.execute(
+                update(ToneMarking)
+                .where(ToneMarking.id == row_id)
+                .values(
+                    tone_marked_text=row["tone_marked_text"],
+                    hit_count=ToneMarking.hit_count + row["hit_count"],
+                    last_seen_at=row["last_seen_at"]
+                )
+            )
+
+
+def _missing_history_columns(sync_conn) -> List[str]:
+    columns = inspect(sync_conn).get_columns("tone_markings")
+    names = {column["name"] for column in columns}
+    return [name for name in _HISTORY_COLUMNS if name not in names]
+
+
+async def upgrade_tone_history(
+    engine: AsyncEngine, chunk_size: int = 1000
+) -> int:
+    """
+    Bring a tone_markings table from before content hashing up to date.
+
+    Adds the new columns and indexes, then folds the old one-row-per-
+    request rows into one row per distinct input. Returns the number of
+    rows removed.
+    """
+    async with engine.begin() as conn:
+        for name in await conn.run_sync(_missing_history_columns):
+            logger.info(f"Adding tone_markings.{name} column")
+            await conn.execute(text(
+                f"ALTER TABLE tone_markings "
+                f"ADD COLUMN {name} {_HISTORY_COLUMNS[name]}"
+            ))
+        await conn.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_tone_markings_content_hash "
+            "ON tone_markings (content_hash)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_tone_markings_last_seen_at_id "
+            "ON tone_markings (last_seen_at, id)"
+        ))
+
+    removed = 0
+    while True:
+        async with engine.begin() as conn:
+            rows = (await conn.execute(
+                select(
+                    ToneMarking.id,
+                    ToneMarking.original_text,
+                    ToneMarking.created_at
+                )
+                .where(ToneMarking.content_hash.is_(None))
+                .order_by(ToneMarking.id)
+                .limit(chunk_size)
+            )).all()
+            if not rows:
+                break
+            removed += await _fold_legacy_rows(conn, rows)
+    if removed:
+        invalidate_counts("tone_markings")
+        logger.info(f"Folded {removed} duplicate tone_markings rows")
+    return removed
+
+
+async def _fold_legacy_rows(conn, rows) -> int:
+    """Give rows a content hash, merging those whose input is already kept."""
+    groups: Dict[str, List] = {}
+    for row in rows:
+        groups.setdefault(content_hash(row.original_text), []).append(row)
+    kept = dict((await conn.execute(
+        select(ToneMarking.content_hash, ToneMarking.id)
+        .where(ToneMarking.content_hash.in_(list(groups)))
+    )).all())
+
+    duplicates: List[int] = []
+    for key, group in groups.items():
+        last_seen = max(row.created_at or datetime.min for row in group)
+        survivor = kept.get(key)
+        if survivor is None:
+            survivor, group = group[0].id, group[1:]
+            await conn.execute(
+                update(ToneMarking)
+                .where(ToneMarking.id == survivor)
+                .values(
+                    content_hash=key,
+                    hit_count=len(group) + 1,
+                    last_seen_at=last_seen
+                )
+            )
+        else:
+            await conn.execute(
+                update(ToneMarking)
+                .where(ToneMarking.id == survivor)
+                .values(
+                    hit_count=ToneMarking.hit_count + len(group),
+                    last_seen_at=case(
+                        (ToneMarking.last_seen_at >= last_seen,
+                         ToneMarking.last_seen_at),
+                        else_=last_seen
+                    )
+                )
+            )
+        duplicates.extend(row.id for row in group)
+
+    if duplicates:
+        await conn.execute(
+            delete(ToneMarking).where(ToneMarking.id.in_(duplicates))
+        )
+    return len(duplicates)
+
+
+async def compact_tone_history(
+    engine: AsyncEngine,
+    retention_days: Optional[int] = None,
+    max_rows: Optional[int] = None,
+    chunk_size: int = 1000
+) -> int:
+    """
+    Delete history rows not seen for ``retention_days`` and, beyond
+    ``max_rows``, the least recently seen ones.
+
+    Settings supply the defaults and 0 disables either limit. Rows go
+    in chunks so writers are never locked out for long. Returns the
+    number of rows deleted.
+    """
+    if retention_days is None:
+        retention_days = settings.tone_history_retention_days
+    if max_rows is None:
+        max_rows = settings.tone_history_max_rows
+
+    conditions = []
+    if retention_days > 0:
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        conditions.append(ToneMarking.last_seen_at < cutoff)
+    if max_rows > 0:
+        async with engine.connect() as conn:
+            boundary = (await conn.execute(
+                select(ToneMarking.last_seen_at, ToneMarking.id)
+                .order_by(
+                    ToneMarking.last_seen_at.desc(), ToneMarking.id.desc()
+                )
+                .offset(max_rows)
+                .limit(1)
+            )).first()
+        if boundary is not None:
+            seen_at, row_id = boundary
+            conditions.append(or_(
+                ToneMarking.last_seen_at < seen_at,
+                and_(
+                    ToneMarking.last_seen_at == seen_at,
+                    ToneMarking.id <= row_id
+                )
+            ))
+    if not conditions:
+        return 0
+
+    deleted = 0
+    while True:
+        async with engine.begin() as conn:
+            ids = (await conn.scalars(
+                select(ToneMarking.id)
+                .where(or_(*conditions))
+                .limit(chunk_size)
+            )).all()
+            if not ids:
+                break
+            await conn.execute(
+                delete(ToneMarking).where(ToneMarking.id.in_(ids))
+            )
+        deleted += len(ids)
+    if deleted:
+        invalidate_counts("tone_markings")
+        logger.info(f"Compacted tone marking history: {deleted} rows deleted")
+    return deleted
+
+
+# Global instance; requests add rows, a background task writes them
+tone_history = WriteBehindBuffer(
+    ToneMarking,
+    max_size=settings.tone_history_buffer_size,
+    batch_size=settings.tone_history_batch_size,
+    flush_interval=settings.tone_history_flush_seconds,
+    write=write_tone_markings
+)
@@ -0,0 +1,274 @@
+"""
+Data-driven tone lexicon for the Yoruba Language API.
+Maps unmarked words to tone-marked forms loaded from a file or the database.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterator, Optional, TextIO, Tuple
+
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.database import AsyncSessionLocal, Translation
+from app.services.normalization import normalize_yoruba
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEXICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data",
+    "tone_lexicon.tsv"
+)
+
+# Words of the input text, the same spans \b...\b delimits
+_WORD_RE = re.compile(r"\w+")
+# Marked forms, keeping combining tone marks with their letters
+MARKED_WORD_RE = re.compile(r"[\w\u0300-\u036f]+")
+
+# Letters re.IGNORECASE treats as ASCII letters that lower() leaves alone
+_CASE_FOLD = str.maketrans({
+    "\u0131": "i",  # dotless i
+    "\u0130": "i",  # dotted capital I
+    "\u017f": "s",  # long s
+    "\u212a": "k",  # Kelvin sign
+})
+
+
+def lexicon_key(word: str) -> str:
+    """Fold a word of input text to the form lexicon keys are stored in."""
+    if not word.isascii():
+        word = word.translate(_CASE_FOLD)
+    return word.lower()
+
+
+class ToneLexicon:
+    """
+    Immutable mapping from unmarked words to their tone-marked forms.
+
+    Marking is one regex pass over the words of the text with a dict
+    lookup per word, so its cost does not grow with the lexicon. A new
+    lexicon is built off to the side and swapped in whole, so readers
+    never see a partial one and never wait on a lock.
+    """
+
+    __slots__ = ("_entries", "source", "version")
+
+    def __init__(self, entries: Dict[str, str], source: str):
+        self._entries = entries
+        self.source = source
+        digest = hashlib.sha1()
+        for key in sorted(entries):
+            digest.update(f"{key}\t{entries[key]}\n".encode("utf-8"))
+        self.version = digest.hexdigest()[:12]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._entries.items())
+
+    def mark(self, text: str) -> str:
+        """Replace every word found in the lexicon with its marked form."""
+        get = self._entries.get
+
+        def replace(match):
+            word = match.group()
+            if word.isascii():
+                return get(word.lower(), word)
+            return get(lexicon_key(word), word)
+
+        return _WORD_RE.sub(replace, text)
+
+    def stats(self) -> Dict[str, any]:
+        return {
+            "source": self.source,
+            "version": self.version,
+            "entries": len(self._entries),
+        }
+
+
+def build_lexicon(
+    counts: Counter, source: str, max_entries: Optional[int] = None
+) -> ToneLexicon:
+    """
+    Build a lexicon from counts of (key, marked form) pairs.
+
+    Each key maps to its most frequent marked form. When there are more
+    than ``max_entries`` keys only the most frequent are kept, which
+    bounds worker memory however large the source grows.
+    """
+    best: Dict[str, Tuple[int, str]] = {}
+    totals: Counter = Counter()
+    for (key, marked), count in counts.items():
+        totals[key] += count
+        if key not in best or count > best[key][0]:
+            best[key] = (count, marked)
+
+    keys = best.keys()
+    if max_entries is not None and len(best) > max_entries:
+        keys = [key for key, _ in totals.most_common(max_entries)]
+
+    entries = {key: best[key][1] for key in keys}
+    return ToneLexicon(entries, source)
+
+
+def _word_pairs(marked_text: str) -> Iterator[Tuple[str, str]]:
+    """Yield (key, marked word) for every word of a marked phrase."""
+    marked_text = unicodedata.normalize("NFC", marked_text)
+    for marked in MARKED_WORD_RE.findall(marked_text):
+        key = normalize_yoruba(marked)
+        if _WORD_RE.fullmatch(key):
+            yield key, marked.lower()
+
+
+def iter_lexicon_file(stream: TextIO) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (key, marked form) pairs from a lexicon file.
+
+    Lines are ``word<TAB>marked``, or just a marked form whose key is
+    derived by stripping the marks. Blank lines and ``#`` comments are
+    ignored.
+    """
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, _, marked = line.partition("\t")
+        if marked:
+            key = lexicon_key(key.strip())
+            if _WORD_RE.fullmatch(key):
+                yield key, unicodedata.normalize("NFC", marked.strip())
+        else:
+            yield from _word_pairs(key)
+
+
+def load_lexicon_file(
+    path: str, max_entries: Optional[int] = None
+) -> ToneLexicon:
+    """Build a lexicon from a lexicon file."""
+    with open(path, encoding="utf-8-sig") as stream:
+        counts = Counter(iter_lexicon_file(stream))
+    return build_lexicon(counts, f"file:{path}", max_entries)
+
+
+async def load_lexicon_from_db(
+    chunk_size: int = 1000, max_entries: Optional[int] = None
+) -> ToneLexicon:
+    """
+    Build a lexicon from every ``translations.yoruba_word``.
+
+    Rows are streamed in chunks and only the pair counts are kept, so
+    memory follows the number of distinct words, not rows.
+    """
+    counts: Counter = Counter()
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            select(Translation.yoruba_word)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions(chunk_size):
+            for (word,) in rows:
+                counts.update(_word_pairs(word))
+    return await asyncio.to_thread(build_lexicon, counts, "db", max_entries)
+
+
+# The lexicon in use; replaced wholesale by set_tone_lexicon, and only
+# read from disk on first use so importing this module does no I/O
+_current: Optional[ToneLexicon] = None
+_fingerprint = None
+# (source, path) of the last reload, which periodic refreshes reuse
+_active_source: Optional[Tuple[str, str]] = None
+# Reloads run one at a time; created on first use, inside the event loop
+_reload_lock: Optional[asyncio.Lock] = None
+
+
+def current_tone_lexicon() -> ToneLexicon:
+    """Return the lexicon in use, falling back to the bundled file."""
+    global _current
+    if _current is None:
+        _current = load_lexicon_file(DEFAULT_LEXICON_PATH)
+    return _current
+
+
+def set_tone_lexicon(lexicon: ToneLexicon) -> None:
+    """Swap in a new lexicon; one reference assignment, so it is atomic."""
+    global _current
+    _current = lexicon
+
+
+async def _source_fingerprint(source: str, path: str):
+    """Cheap summary of the lexicon source, used to skip no-op reloads."""
+    if source == "file":
+        stat = os.stat(path)
+        return (path, stat.st_mtime_ns, stat.st_size)
+    async with AsyncSessionLocal() as db:
+        return tuple((await db.execute(
+            select(
+                func.count(Translation.id),
+                func.max(Translation.id),
+                func.max(Translation.updated_at)
+            )
+        )).one())
+
+
+async def reload_tone_lexicon(
+    source: Optional[str] = None,
+    path: Optional[str] = None,
+    force: bool = True
+) -> ToneLexicon:
+    """
+    Rebuild the lexicon from its source and swap it in.
+
+    Parsing and compiling run off the event loop, and requests keep
+    using the previous lexicon until the swap. With ``force=False`` the
+    lexicon is only rebuilt if the source changed since the last load.
+    Without ``source`` or ``path`` the ones of the last reload are used,
+    so a periodic refresh keeps a source chosen through the API.
+
+    Reloads are serialized. A caller that had to wait for another reload
+    only rebuilds if the source changed since that one finished.
+    """
+    global _reload_lock
+    if _reload_lock is None:
+        _reload_lock = asyncio.Lock()
+    waited = _reload_lock.locked()
+    async with _reload_lock:
+        return await _reload(source, path, force and not waited)
+
+
+async def _reload(
+    source: Optional[str], path: Optional[str], force: bool
+) -> ToneLexicon:
+    global _fingerprint, _active_source
+    active_source, active_path = _active_source or (None, None)
+    source = source or active_source or settings.tone_lexicon_source
+    path = (
+        path or active_path or settings.tone_lexicon_path
+        or DEFAULT_LEXICON_PATH
+    )
+    if source not in ("file", "db"):
+        raise ValueError(f"Unknown tone lexicon source '{source}'")
+
+    fingerprint = await _source_fingerprint(source, path)
+    if not force and fingerprint == _fingerprint:
+        return current_tone_lexicon()
+
+    max_entries = settings.tone_lexicon_max_entries
+    if source == "file":
+        lexicon = await asyncio.to_thread(
+            load_lexicon_file, path, max_entries
+        )
+    else:
+        lexicon = await load_lexicon_from_db(max_entries=max_entries)
+
+    set_tone_lexicon(lexicon)
+    _fingerprint = fingerprint
+    _active_source = (source, path)
+    logger.info(f"Tone lexicon loaded: {lexicon.stats()}")
+    return lexicon
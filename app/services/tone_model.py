@@ -0,0 +1,365 @@
+"""
+Statistical tone restoration for Yoruba text.
+A bigram language model over tone-marked words, decoded with Viterbi.
+"""
+
+import hashlib
+import json
+import struct
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.normalization import normalize_yoruba
+from app.services.tone_lexicon import MARKED_WORD_RE, lexicon_key
+
+MAGIC = b"YTONE1\n"
+# Arrays start on this boundary so they can be memory-mapped
+ALIGNMENT = 64
+
+# Probability floor for transitions the model has never seen
+MIN_PROB = 1e-12
+
+
+class _StringTable(Sequence[str]):
+    """Read-only list of strings stored as a UTF-8 blob plus offsets."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+
+def _pack_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def tokenize_marked(text: str) -> List[str]:
+    """Split tone-marked text into lowercase NFC words."""
+    text = unicodedata.normalize("NFC", text).lower()
+    return MARKED_WORD_RE.findall(text)
+
+
+class ToneModel:
+    """
+    Interpolated bigram model over tone-marked word forms.
+
+    Every unmarked key (``omo``) has a list of candidate forms (``ọmọ``,
+    ``ọmọ́``...). Restoring a sentence picks the candidate sequence with
+    the highest probability under
+
+        P(w | v) = lambda_v * P_ml(w | v) + (1 - lambda_v) * P(w)
+
+    with Witten-Bell weights ``lambda_v``. Bigram rows are stored
+    CSR-style and ``lambda_v * P_ml`` is precomputed, so each Viterbi
+    step is a handful of NumPy operations over the candidate lattice.
+    All arrays can be memory-mapped from the model file and shared by
+    every worker on a host.
+
+    Form id 0 is the sentence boundary.
+    """
+
+    ARRAYS = (
+        "form_blob", "form_offsets",
+        "key_blob", "key_offsets",
+        "key_cand_offsets", "cand_ids",
+        "unigram", "backoff",
+        "bigram_offsets", "bigram_next", "bigram_prob",
+    )
+
+    def __init__(
+        self, arrays: Dict[str, np.ndarray], meta: Optional[Dict] = None
+    ):
+        self.form_blob: np.ndarray = arrays["form_blob"]
+        self.form_offsets: np.ndarray = arrays["form_offsets"]
+        self.key_blob: np.ndarray = arrays["key_blob"]
+        self.key_offsets: np.ndarray = arrays["key_offsets"]
+        self.key_cand_offsets: np.ndarray = arrays["key_cand_offsets"]
+        self.cand_ids: np.ndarray = arrays["cand_ids"]
+        self.unigram: np.ndarray = arrays["unigram"]
+        self.backoff: np.ndarray = arrays["backoff"]
+        self.bigram_offsets: np.ndarray = arrays["bigram_offsets"]
+        self.bigram_next: np.ndarray = arrays["bigram_next"]
+        self.bigram_prob: np.ndarray = arrays["bigram_prob"]
+        self.meta: Dict = meta or {}
+        self.forms = _StringTable(self.form_blob, self.form_offsets)
+        self.keys = _StringTable(self.key_blob, self.key_offsets)
+
+    @property
+    def version(self) -> str:
+        return self.meta.get("version", "")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # Training
+
+    @classmethod
+    def train(cls, texts: Iterable[str], min_count: int = 1) -> "ToneModel":
+        """Estimate a model from tone-marked sentences."""
+        unigrams: Counter = Counter()
+        bigrams: Counter = Counter()
+        for text in texts:
+            words = tokenize_marked(text)
+            if not words:
+                continue
+            sequence = [""] + words + [""]
+            unigrams.update(sequence)
+            bigrams.update(zip(sequence, sequence[1:]))
+
+        forms = [""] + sorted(
+            w for w, c in unigrams.items() if w and c >= min_count
+        )
+        form_ids = {form: i for i, form in enumerate(forms)}
+
+        counts = np.array([unigrams[f] for f in forms], dtype=np.float64)
+        # The boundary starts every sentence, so it stays a valid successor
+        unigram = counts / counts.sum()
+
+        rows: Dict[int, Dict[int, int]] = {}
+        for (prev, nxt), count in bigrams.items():
+            if prev in form_ids and nxt in form_ids:
+                rows.setdefault(form_ids[prev], {})[form_ids[nxt]] = count
+
+        bigram_offsets = np.zeros(len(forms) + 1, dtype=np.uint32)
+        bigram_next: List[int] = []
+        bigram_prob: List[float] = []
+        backoff = np.ones(len(forms), dtype=np.float64)
+        for form_id in range(len(forms)):
+            followers = rows.get(form_id, {})
+            total = sum(followers.values())
+            if total:
+                # Witten-Bell: trust the bigram more the more it was seen
+                weight = total / (total + len(followers))
+                backoff[form_id] = 1 - weight
+                for nxt in sorted(followers):
+                    bigram_next.append(nxt)
+                    bigram_prob.append(weight * followers[nxt] / total)
+            bigram_offsets[form_id + 1] = len(bigram_next)
+
+        candidates: Dict[str, List[int]] = {}
+        for form_id in range(1, len(forms)):
+            key = normalize_yoruba(forms[form_id])
+            candidates.setdefault(key, []).append(form_id)
+
+        keys = sorted(candidates)
+        key_cand_offsets = np.zeros(len(keys) + 1, dtype=np.uint32)
+        cand_ids: List[int] = []
+        for i, key in enumerate(keys):
+            # Most frequent first, which is also the greedy fallback
+            ids = sorted(candidates[key], key=lambda f: -counts[f])
+            cand_ids.extend(ids)
+            key_cand_offsets[i + 1] = len(cand_ids)
+
+        form_blob, form_offsets = _pack_strings(forms)
+        key_blob, key_offsets = _pack_strings(keys)
+        arrays = {
+            "form_blob": form_blob,
+            "form_offsets": form_offsets,
+            "key_blob": key_blob,
+            "key_offsets": key_offsets,
+            "key_cand_offsets": key_cand_offsets,
+            "cand_ids": np.array(cand_ids, dtype=np.uint32),
+            "unigram": unigram.astype(np.float32),
+            "backoff": backoff.astype(np.float32),
+            "bigram_offsets": bigram_offsets,
+            "bigram_next": np.array(bigram_next, dtype=np.uint32),
+            "bigram_prob": np.array(bigram_prob, dtype=np.float32),
+        }
+        meta = {
+            "forms": len(forms),
+            "keys": len(keys),
+            "bigrams": len(bigram_next),
+            "sentences": unigrams[""] // 2,
+        }
+        return cls(arrays, meta)
+
+    # Serialization
+
+    def save(self, path: str) -> None:
+        """
+        Write the model as one file: a JSON header followed by raw,
+        aligned arrays that ``load`` can memory-map.
+        """
+        layout = {}
+        offset = 0
+        for name in self.ARRAYS:
+            array = np.ascontiguousarray(getattr(self, name))
+            offset = -(-offset // ALIGNMENT) * ALIGNMENT
+            layout[name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset,
+            }
+            offset += array.nbytes
+
+        digest = hashlib.sha1()
+        for name in self.ARRAYS:
+            digest.update(np.ascontiguousarray(getattr(self, name)).data)
+        meta = dict(self.meta, version=digest.hexdigest()[:12])
+        header = json.dumps({"meta": meta, "arrays": layout}).encode()
+        data_start = len(MAGIC) + 8 + len(header)
+        data_start = -(-data_start // ALIGNMENT) * ALIGNMENT
+
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for name in self.ARRAYS:
+                array = np.ascontiguousarray(getattr(self, name))
+                f.seek(data_start + layout[name]["offset"])
+                f.write(array.tobytes())
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "ToneModel":
+        """Open a model file, memory-mapping its arrays by default."""
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a tone model file")
+            (header_size,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_size))
+        data_start = len(MAGIC) + 8 + header_size
+        data_start = -(-data_start // ALIGNMENT) * ALIGNMENT
+
+        if mmap:
+            raw = np.memmap(path, dtype=np.uint8, mode="r")
+        else:
+            raw = np.fromfile(path, dtype=np.uint8)
+
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            start = data_start + spec["offset"]
+            count = int(np.prod(spec["shape"]))
+            arrays[name] = raw[start:start + count * dtype.itemsize].view(
+                dtype
+            ).reshape(spec["shape"])
+
+        return cls(arrays, header["meta"])
+
+    # Decoding
+
+    def candidates(self, word: str) -> Optional[np.ndarray]:
+        """Candidate form ids for an unmarked word, or None if unknown."""
+        key = lexicon_key(word)
+        index = bisect_left(self.keys, key)
+        if index == len(self.keys) or self.keys[index] != key:
+            return None
+        start = self.key_cand_offsets[index]
+        return self.cand_ids[start:self.key_cand_offsets[index + 1]]
+
+    def transitions(self, prev: np.ndarray, nxt: np.ndarray) -> np.ndarray:
+        """Log P(next | prev) for every pair of candidate ids."""
+        probs = (
+            self.backoff[prev][:, None].astype(np.float64)
+            * self.unigram[nxt][None, :]
+        )
+        for i, form_id in enumerate(prev):
+            start = self.bigram_offsets[form_id]
+            end = self.bigram_offsets[form_id + 1]
+            if start == end:
+                continue
+            row = self.bigram_next[start:end]
+            where = np.searchsorted(row, nxt)
+            where[where == len(row)] = 0
+            seen = row[where] == nxt
+            probs[i, seen] += self.bigram_prob[start:end][where[seen]]
+        return np.log(np.maximum(probs, MIN_PROB))
+
+    def viterbi(self, lattice: List[np.ndarray]) -> List[int]:
+        """Return the most likely form id at each position of a lattice."""
+        boundary = np.zeros(1, dtype=np.uint32)
+        score = self.transitions(boundary, lattice[0])[0]
+        backpointers = []
+        for prev, nxt in zip(lattice, lattice[1:]):
+            totals = score[:, None] + self.transitions(prev, nxt)
+            best = totals.argmax(axis=0)
+            backpointers.append(best)
+            score = totals[best, np.arange(len(nxt))]
+        score = score + self.transitions(lattice[-1], boundary)[:, 0]
+
+        index = int(score.argmax())
+        path = [index]
+        for best in reversed(backpointers):
+            index = int(best[index])
+            path.append(index)
+        path.reverse()
+        return [int(cands[i]) for cands, i in zip(lattice, path)]
+
+    def restore(self, text: str, deadline: Optional[float] = None) -> str:
+        """
+        Restore tone marks in ``text``.
+
+        Runs of known unmarked words are decoded together; unknown or
+        already marked words and punctuation end a run and are left as
+        they are. Once ``deadline`` (a ``time.perf_counter`` value)
+        passes, remaining runs take each word's most frequent form.
+        """
+        return self.restore_with_status(text, deadline)[0]
+
+    def restore_with_status(
+        self, text: str, deadline: Optional[float] = None
+    ) -> Tuple[str, bool]:
+        """
+        Like ``restore``, also returning False if the deadline passed
+        and some run fell back to the most frequent forms.
+        """
+        out: List[str] = []
+        run: List[Tuple[int, str, np.ndarray]] = []
+        complete = True
+
+        def flush():
+            nonlocal complete
+            if not run:
+                return
+            lattice = [cands for _, _, cands in run]
+            if deadline is not None and time.perf_counter() > deadline:
+                best = [int(cands[0]) for cands in lattice]
+                complete = False
+            else:
+                best = self.viterbi(lattice)
+            for (index, word, _), form_id in zip(run, best):
+                out[index] = _match_case(word, self.forms[form_id])
+            run.clear()
+
+        last = 0
+        for match in MARKED_WORD_RE.finditer(text):
+            gap = text[last:match.start()]
+            last = match.end()
+            if gap.strip():
+                flush()
+            out.append(gap)
+
+            word = match.group()
+            cands = self.candidates(word) if word.isascii() else None
+            if cands is None:
+                flush()
+            else:
+                run.append((len(out), word, cands))
+            out.append(word)
+        flush()
+        out.append(text[last:])
+        return "".join(out), complete
+
+
+def _match_case(word: str, form: str) -> str:
+    """Carry the capitalization of the input word over to its form."""
+    if len(word) > 1 and word.isupper():
+        return form.upper()
+    if word[:1].isupper():
+        return form[:1].upper() + form[1:]
+    return form
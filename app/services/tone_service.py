@@ -3,48 +3,157 @@ Tone marking service for Yoruba language.
 Adds diacritics (tone marks) to Yoruba text.
 """
 
-import re
+import hashlib
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
 
+from app.config import settings
+from app.services.shared_cache import shared_cache
+from app.services.tone_lexicon import current_tone_lexicon
+from app.services.tone_model import ToneModel
 
-def add_tone_marks(text: str) -> str:
+logger = logging.getLogger(__name__)
+
+ENGINES = ("lexicon", "ngram")
+
+# Loaded by load_tone_model; None until a model file is configured
+_tone_model: Optional[ToneModel] = None
+
+
+# Marked texts keyed by engine, engine version and a digest of the
+# input, so swapping the lexicon or model never serves stale marks
+tone_mark_cache = shared_cache("tone", settings.tone_cache_size, ttl=None)
+
+
+class ToneEngineUnavailableError(Exception):
+    """Raised when the requested engine has nothing to run with."""
+
+
+def load_tone_model(path: Optional[str] = None) -> Optional[ToneModel]:
+    """Memory-map the n-gram tone model, if one is configured."""
+    global _tone_model
+    path = path or settings.tone_model_path
+    if not path:
+        return None
+    _tone_model = ToneModel.load(path)
+    logger.info(f"Tone model loaded from {path}: {_tone_model.meta}")
+    return _tone_model
+
+
+def engine_available(engine: str) -> bool:
+    return engine == "lexicon" or (engine == "ngram" and bool(_tone_model))
+
+
+def engine_version(engine: str) -> Optional[str]:
+    """Version of the data an engine marks with."""
+    if engine == "lexicon":
+        return current_tone_lexicon().version
+    return _tone_model.version if _tone_model else None
+
+
+def tone_cache_key(text: str, engine: str, version: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    return f"{engine}:{version}:{digest.hexdigest()}"
+
+
+async def cached_tone_marks(
+    texts: List[str], engine: str, version: str
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Look up each distinct text in the cache.
+
+    Returns the cached results by text and the distinct texts that
+    still have to be marked, in first-seen order.
     """
-    Add tone marks to Yoruba text based on common patterns.
+    keys = {
+        text: tone_cache_key(text, engine, version)
+        for text in dict.fromkeys(texts)
+    }
+    cached = await tone_mark_cache.get_many(list(keys.values()))
+    results = {
+        text: cached[key] for text, key in keys.items() if key in cached
+    }
+    return results, [text for text in keys if text not in results]
+
+
+async def cache_tone_marks(
+    texts: List[str], marked: List[str], engine: str, version: str
+) -> None:
+    await tone_mark_cache.set_many({
+        tone_cache_key(text, engine, version): result
+        for text, result in zip(texts, marked)
+    })
+
+
+def tone_engines() -> List[Dict[str, any]]:
+    """Describe the available engines."""
+    lexicon = current_tone_lexicon()
+    return [
+        {
+            "name": "lexicon",
+            "available": True,
+            "default": settings.tone_default_engine == "lexicon",
+            "version": lexicon.version,
+        },
+        {
+            "name": "ngram",
+            "available": _tone_model is not None,
+            "default": settings.tone_default_engine == "ngram",
+            "version": _tone_model.version if _tone_model else None,
+        },
+    ]
+
+
+def add_tone_marks(
+    text: str,
+    engine: Optional[str] = None,
+    budget_ms: Optional[int] = None
+) -> str:
+    """
+    Add tone marks to Yoruba text.
+    
+    The ``lexicon`` engine replaces each word with its form in the
+    current lexicon (see ``app.services.tone_lexicon``). The ``ngram``
+    engine picks forms by context with the statistical model (see
+    ``app.services.tone_model``); once ``budget_ms`` is spent it falls
+    back to each word's most frequent form.
     
     Args:
         text (str): Input Yoruba text without tone marks
+        engine (str): lexicon or ngram, defaults to settings
+        budget_ms (int): ngram decoding budget, defaults to settings
         
     Returns:
         str: Text with tone marks added
     """
+    return mark_text(text, engine, budget_ms)[0]
+
+
+def mark_text(
+    text: str,
+    engine: Optional[str] = None,
+    budget_ms: Optional[int] = None
+) -> Tuple[str, bool]:
+    """
+    Like ``add_tone_marks``, also returning whether the result is
+    final: False when ngram decoding ran out of budget and fell back,
+    so the result depends on load and must not be cached.
+    """
+    engine = engine or settings.tone_default_engine
+    if engine not in ENGINES:
+        raise ValueError(
+            f"Unknown tone engine '{engine}', use one of {', '.join(ENGINES)}"
+        )
     if not text:
-        return text
+        return text, True
     
-    result = text
-    
-    # Common tone patterns
-    patterns = {
-        "omo": "ọmọ",
-        "baba": "bàbá",
-        "mama": "màmá",
-        "mi": "mi",
-        "re": "rẹ",
-        "wa": "wa",
-        "won": "wọn",
-        "ti": "tí",
-        "ni": "ní",
-        "si": "sí",
-        "ko": "kò",
-        "se": "ṣe",
-        "je": "jẹ",
-    }
-    
-    # Apply patterns
-    for pattern, replacement in patterns.items():
-        result = re.sub(
-            r'\b' + re.escape(pattern) + r'\b', 
-            replacement, 
-            result, 
-            flags=re.IGNORECASE
-        )
+    if engine == "lexicon":
+        return current_tone_lexicon().mark(text), True
     
-    return result
+    model = _tone_model
+    if model is None:
+        raise ToneEngineUnavailableError("No n-gram tone model is loaded")
+    budget_ms = budget_ms or settings.tone_budget_ms
+    deadline = time.perf_counter() + budget_ms / 1000
+    return model.restore_with_status(text, deadline=deadline)
@@ -0,0 +1,209 @@
+"""
+In-memory lookup index for English to Yoruba translations.
+Serves exact, prefix and substring matches without a database round trip.
+"""
+
+import bisect
+import heapq
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal, Translation
+
+logger = logging.getLogger(__name__)
+
+# Separator used to build the substring haystack; never part of a key
+_SEPARATOR = "\x00"
+
+
+def normalize_word(word: str) -> str:
+    """Normalize an English word for index lookups."""
+    return " ".join(word.casefold().split())
+
+
+def translation_to_entry(translation: Translation) -> Dict[str, any]:
+    """Snapshot the fields of a Translation row needed by the API."""
+    return {
+        "id": translation.id,
+        "english_word": translation.english_word,
+        "yoruba_word": translation.yoruba_word,
+        "part_of_speech": translation.part_of_speech,
+        "example_sentence": translation.example_sentence,
+        "created_at": translation.created_at,
+        "updated_at": translation.updated_at,
+    }
+
+
+class TranslationIndex:
+    """
+    Process-local index over the translations table.
+
+    Lookups try an exact hash match on the normalized word first, then
+    the first key starting with the word, then the first key containing
+    it. Writers must call ``add`` after inserting rows so the index stays
+    current; ``refresh`` picks up rows written by other processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._exact: Dict[str, Dict[str, any]] = {}
+        self._sorted_keys: List[str] = []
+        self._haystack: Optional[str] = None
+        self._offsets: List[int] = []
+        self._haystack_keys: List[str] = []
+        self._max_id = 0
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    async def load(self, db: AsyncSession, batch_size: int = 1000) -> int:
+        """
+        Build the index from scratch from the translations table.
+
+        The new index is built off to the side and swapped in whole, so
+        lookups keep using the old one until the scan finishes.
+        """
+        entries, max_id, count = await self._scan(db, 0, batch_size)
+        with self._lock:
+            # Rows added while the scan ran, past what it read, stay
+            for key, entry in self._exact.items():
+                if entry["id"] is not None and entry["id"] > max_id:
+                    entries.setdefault(key, entry)
+            self._exact = entries
+            self._sorted_keys = sorted(entries)
+            self._haystack = None
+            self._max_id = max_id
+        self.loaded = True
+        logger.info(f"Translation index loaded with {count} entries")
+        return count
+
+    async def refresh(self, db: AsyncSession, batch_size: int = 1000) -> int:
+        """Add rows with an id greater than any already indexed."""
+        entries, max_id, count = await self._scan(
+            db, self._max_id, batch_size
+        )
+        with self._lock:
+            new_keys = []
+            for key, entry in entries.items():
+                if key not in self._exact:
+                    # Keep the oldest row for a word, as the DB query did
+                    self._exact[key] = entry
+                    new_keys.append(key)
+            if new_keys:
+                # One sort and merge per refresh, not one insort per row
+                self._sorted_keys = list(
+                    heapq.merge(self._sorted_keys, sorted(new_keys))
+                )
+                self._haystack = None
+            # Only rows read here advance the watermark, so rows added by
+            # this process cannot hide older rows from other replicas
+            self._max_id = max(self._max_id, max_id)
+        return count
+
+    async def _scan(
+        self, db: AsyncSession, after_id: int, batch_size: int
+    ) -> Tuple[Dict[str, Dict[str, any]], int, int]:
+        """
+        Read rows with an id above ``after_id`` into a new key -> entry
+        map, returning it with the highest id read and the row count.
+        """
+        entries: Dict[str, Dict[str, any]] = {}
+        max_id = after_id
+        count = 0
+        while True:
+            # Keyset batches keep each query cheap however large the table
+            translations = (await db.scalars(
+                select(Translation)
+                .where(Translation.id > max_id)
+                .order_by(Translation.id)
+                .limit(batch_size)
+            )).all()
+            for translation in translations:
+                entry = translation_to_entry(translation)
+                key = normalize_word(entry["english_word"])
+                entries.setdefault(key, entry)
+            if translations:
+                max_id = translations[-1].id
+            count += len(translations)
+            if len(translations) < batch_size:
+                return entries, max_id, count
+
+    def add(self, translation: Translation) -> None:
+        """Index a newly inserted translation row."""
+        entry = translation_to_entry(translation)
+        key = normalize_word(entry["english_word"])
+        with self._lock:
+            if key in self._exact:
+                # Keep the oldest row for a word, as the DB query did
+                return
+            self._exact[key] = entry
+            bisect.insort(self._sorted_keys, key)
+            self._haystack = None
+
+    def get(self, word: str) -> Optional[Dict[str, any]]:
+        """Return the entry for an exact normalized match only."""
+        return self._exact.get(normalize_word(word))
+
+    def lookup(self, word: str) -> Optional[Dict[str, any]]:
+        """Find the best match: exact, then prefix, then substring."""
+        key = normalize_word(word)
+        if not key:
+            return None
+
+        entry = self._exact.get(key)
+        if entry is not None:
+            return entry
+
+        keys = self._sorted_keys
+        position = bisect.bisect_left(keys, key)
+        if position < len(keys) and keys[position].startswith(key):
+            return self._exact[keys[position]]
+
+        return self._substring_lookup(key)
+
+    def _substring_lookup(self, key: str) -> Optional[Dict[str, any]]:
+        """Scan every key for a substring match using a single str.find."""
+        if _SEPARATOR in key:
+            return None
+        haystack, offsets, keys = self._get_haystack()
+        found = haystack.find(key)
+        if found == -1:
+            return None
+        position = bisect.bisect_right(offsets, found) - 1
+        return self._exact[keys[position]]
+
+    def _get_haystack(self):
+        """Return the joined key string, rebuilding it after writes."""
+        with self._lock:
+            if self._haystack is None:
+                keys = list(self._sorted_keys)
+                offsets = []
+                position = 0
+                for key in keys:
+                    offsets.append(position)
+                    position += len(key) + len(_SEPARATOR)
+                self._haystack = _SEPARATOR.join(keys)
+                self._offsets = offsets
+                self._haystack_keys = keys
+            return self._haystack, self._offsets, self._haystack_keys
+
+
+# Global instance
+translation_index = TranslationIndex()
+
+
+async def load_translation_index() -> int:
+    """Build the global index from the database."""
+    async with AsyncSessionLocal() as db:
+        return await translation_index.load(db)
+
+
+async def refresh_translation_index() -> int:
+    """Pick up rows inserted since the global index was last loaded."""
+    async with AsyncSessionLocal() as db:
+        return await translation_index.refresh(db)
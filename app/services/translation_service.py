@@ -0,0 +1,265 @@
+"""
+Translation lookup chain for the Yoruba Language API.
+Resolves words through the shared cache, then the dictionary, then AI.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal, Translation
+from app.services import ai_translation_service as ai_service
+from app.services.ai_batcher import AIMicroBatcher
+from app.services.cache import MISS
+from app.services.enrichment_queue import EnrichmentQueue
+from app.services.http_cache import (
+    translate_validators,
+    translation_validators
+)
+from app.services.pagination import invalidate_counts
+from app.services.shared_cache import shared_cache
+from app.services.single_flight import SingleFlight
+from app.services.translation_index import (
+    normalize_word,
+    translation_index,
+    translation_to_entry
+)
+
+# Normalized word -> (entry, "database"). A new row only replaces its own
+# key; imports, which can change existing rows, invalidate the namespace.
+translation_cache = shared_cache(
+    "translations",
+    maxsize=settings.translation_cache_size,
+    ttl=settings.translation_cache_ttl_seconds,
+    negative_ttl=0
+)
+
+# Normalized word -> None for words missing from the dictionary, or an
+# unsaved (entry, "ai_fallback") result. Lookups match prefixes, so any
+# new row may answer an old miss: every write invalidates this namespace,
+# which only ever holds short-lived entries.
+translation_misses = shared_cache(
+    "translation-misses",
+    maxsize=settings.translation_cache_size,
+    ttl=settings.translation_cache_negative_ttl_seconds
+)
+
+# Concurrent AI requests for the same word share one LLM call and one row
+ai_translation_flights = SingleFlight()
+
+# Different words requested at about the same time share one LLM prompt
+ai_batcher = AIMicroBatcher(
+    lambda words: ai_service.translate_many_to_yoruba_async(words),
+    max_batch_size=settings.ai_batch_max_size,
+    max_wait_seconds=settings.ai_batch_window_ms / 1000
+)
+
+
+async def lookup_translation(
+    word: str
+) -> Optional[Tuple[Dict[str, any], str]]:
+    """Find a dictionary translation for a word, using the cache first."""
+    key = normalize_word(word)
+
+    async def load():
+        if await translation_misses.get(key) is not MISS:
+            return None
+        # The in-memory index, or the database before the index is built.
+        # Early refreshes run after the request is gone, so the loader
+        # opens its own session rather than borrowing the request's.
+        if translation_index.loaded:
+            entry = translation_index.lookup(word)
+        else:
+            async with AsyncSessionLocal() as db:
+                translation = await _match_in_database(db, key)
+            entry = translation_to_entry(translation) if translation else None
+        if not entry:
+            await translation_misses.set(key, None)
+            return None
+        return entry, "database"
+
+    return await translation_cache.get_or_load(key, load)
+
+
+async def lookup_translations(
+    words: Iterable[str], db: AsyncSession
+) -> Dict[str, Tuple[Dict[str, any], str]]:
+    """
+    Find dictionary translations for many words at once.
+
+    Returns results keyed by normalized word; misses are left out. Words
+    not cached are resolved from the index, or from the database before
+    the index is built. Either way a word matches as in
+    ``lookup_translation``: exactly, then by prefix, then by substring.
+    Exact matches are found with one set-based query; only the words it
+    misses are looked up one at a time.
+    """
+    keys = [key for key in {normalize_word(word) for word in words} if key]
+    resolved = await translation_cache.get_many(keys)
+    unresolved = [key for key in keys if key not in resolved]
+    missed = await translation_misses.get_many(unresolved)
+    pending = [key for key in unresolved if key not in missed]
+
+    found = {}
+    if translation_index.loaded:
+        for key in pending:
+            entry = translation_index.lookup(key)
+            if entry:
+                found[key] = entry
+    elif pending:
+        rows = (await db.scalars(
+            select(Translation)
+            .where(func.lower(Translation.english_word).in_(pending))
+            .order_by(Translation.id)
+        )).all()
+        for row in rows:
+            key = normalize_word(row.english_word)
+            if key in pending and key not in found:
+                found[key] = translation_to_entry(row)
+        for key in pending:
+            if key not in found:
+                row = await _match_in_database(db, key, exact=False)
+                if row:
+                    found[key] = translation_to_entry(row)
+
+    for key in found:
+        resolved[key] = (found[key], "database")
+    await translation_cache.set_many(
+        {key: resolved[key] for key in found}
+    )
+    await translation_misses.set_many(
+        {key: None for key in pending if key not in found}
+    )
+    return resolved
+
+
+async def _match_in_database(
+    db: AsyncSession, key: str, exact: bool = True
+) -> Optional[Translation]:
+    """
+    Match a normalized word the way the index does, for lookups made
+    before it is built: exactly, then by prefix, then by substring, taking
+    the first word in sorted order. ``exact=False`` skips the exact step.
+    """
+    word = func.lower(Translation.english_word)
+    conditions = [
+        word.startswith(key, autoescape=True),
+        word.contains(key, autoescape=True)
+    ]
+    if exact:
+        conditions.insert(0, word == key)
+    for condition in conditions:
+        translation = (await db.scalars(
+            select(Translation)
+            .where(condition)
+            .order_by(word, Translation.id)
+            .limit(1)
+        )).first()
+        if translation:
+            return translation
+    return None
+
+
+async def remember_translation(translation: Translation) -> None:
+    """Make a newly inserted row visible to the index and cache."""
+    key = normalize_word(translation.english_word)
+    translation_index.add(translation)
+    # Cached misses may now match the new word, on every replica
+    await translation_misses.invalidate()
+    await translation_cache.set(
+        key, (translation_to_entry(translation), "database")
+    )
+    # Every page total changed, but only this word's translation did
+    await translation_validators.invalidate()
+    await translate_validators.forget(f"word:{key}")
+    invalidate_counts("translations")
+
+
+async def invalidate_translations() -> None:
+    """Drop every cached translation and validator, on every replica."""
+    await translation_cache.invalidate()
+    await translation_misses.invalidate()
+    await translation_validators.invalidate()
+    await translate_validators.invalidate()
+
+
+async def translate_with_ai(word: str) -> Tuple[Dict[str, any], str]:
+    """
+    Translate a word with AI and save it to the dictionary.
+
+    Returns the entry and its source tag. Concurrent calls for the same
+    normalized word are coalesced into a single AI call and insert.
+    Fallback responses are cached briefly but never saved.
+    """
+    return await ai_translation_flights.do(
+        normalize_word(word), lambda: _translate_and_save(word)
+    )
+
+
+async def _translate_and_save(word: str) -> Tuple[Dict[str, any], str]:
+    """Run one AI translation and persist it unless it already landed."""
+    key = normalize_word(word)
+    cached = await translation_cache.get(key)
+    if cached is not MISS:
+        return cached
+    fallback = await translation_misses.get(key)
+    if fallback is not MISS and fallback is not None:
+        return fallback
+
+    entry = translation_index.get(word)
+    if entry:
+        return entry, "database"
+
+    if settings.ai_batch_max_size > 1:
+        ai_result = await ai_batcher.submit(word)
+    else:
+        ai_result = await ai_service.translate_to_yoruba_async(word)
+    if ai_result.get("source") == "ai_fallback":
+        now = datetime.utcnow()
+        entry = {
+            "id": None,
+            "english_word": ai_result['word'],
+            "yoruba_word": ai_result['translation'],
+            "part_of_speech": ai_result['part_of_speech'],
+            "example_sentence": ai_result['example'],
+            "created_at": now,
+            "updated_at": now,
+        }
+        await translation_misses.set(key, (entry, "ai_fallback"))
+        return entry, "ai_fallback"
+
+    entry = await _save_ai_translation(ai_result)
+    return entry, ai_result.get("source", "ai")
+
+
+# Background workers for translate requests made with mode=queue
+# Job records are shared, so a job can be polled on any replica
+enrichment_queue = EnrichmentQueue(
+    translate_with_ai,
+    workers=settings.ai_queue_workers,
+    max_size=settings.ai_queue_max_size,
+    jobs=shared_cache(
+        "ai-jobs", maxsize=10000, ttl=settings.ai_job_ttl_seconds
+    )
+)
+
+
+async def _save_ai_translation(
+    ai_result: Dict[str, any]
+) -> Dict[str, any]:
+    """Save an AI translation to the database for future use."""
+    async with AsyncSessionLocal() as db:
+        db_translation = Translation(
+            english_word=ai_result['word'],
+            yoruba_word=ai_result['translation'],
+            part_of_speech=ai_result['part_of_speech'],
+            example_sentence=ai_result['example']
+        )
+        db.add(db_translation)
+        await db.commit()
+        await db.refresh(db_translation)
+        await remember_translation(db_translation)
+        return translation_to_entry(db_translation)
@@ -0,0 +1,120 @@
+"""
+Word of the day for the Yoruba Language API.
+Picks one translation per UTC day, the same on every replica.
+"""
+
+import hashlib
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import Translation
+from app.schemas import WordOfTheDayResponse
+from app.services.http_cache import strong_etag
+from app.services.shared_cache import SharedCache, shared_cache
+
+# A rendered response: (JSON body, strong ETag)
+Entry = Tuple[bytes, str]
+
+
+def seconds_until_midnight(now: Optional[datetime] = None) -> int:
+    """Seconds left in the current UTC day, at least 1."""
+    now = now or datetime.utcnow()
+    midnight = datetime.combine(
+        now.date() + timedelta(days=1), datetime.min.time()
+    )
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def day_seed(day: date) -> int:
+    """A stable, well-spread number for a day."""
+    digest = hashlib.sha256(f"word-of-the-day:{day.isoformat()}".encode())
+    return int.from_bytes(digest.digest()[:8], "big")
+
+
+async def pick_word_of_the_day(
+    db: AsyncSession, day: date
+) -> Optional[Translation]:
+    """
+    The translation shown on ``day``, or None if there are none.
+
+    Picks a point in the id range from the day alone and takes the
+    first row at or after it, so the choice costs two indexed queries
+    and tolerates gaps left by deleted rows.
+    """
+    low, high = (await db.execute(
+        select(func.min(Translation.id), func.max(Translation.id))
+    )).one()
+    if low is None:
+        return None
+    target = low + day_seed(day) % (high - low + 1)
+    return (await db.scalars(
+        select(Translation)
+        .where(Translation.id >= target)
+        .order_by(Translation.id)
+        .limit(1)
+    )).first()
+
+
+def render_word_of_the_day(translation: Translation) -> Entry:
+    """Serialize the response once, with its ETag."""
+    body = WordOfTheDayResponse(
+        word=translation.yoruba_word,
+        translation=translation.english_word,
+        part_of_speech=translation.part_of_speech or "",
+        example=translation.example_sentence or ""
+    ).model_dump_json().encode("utf-8")
+    return body, strong_etag(body)
+
+
+class WordOfTheDay:
+    """
+    Today's rendered word of the day.
+
+    Each process keeps the day's entry in memory, so serving it costs
+    no database or cache round trip. The first request of the day on a
+    process looks it up in ``cache`` by date, which lets the first
+    replica to pick it share it with the rest. The pick is not redone
+    when translations change during the day, so the ETag stays put.
+    """
+
+    def __init__(self, cache: Optional[SharedCache] = None):
+        self._cache = cache or SharedCache("word-of-the-day", ttl=2 * 86400)
+        self._day: Optional[date] = None
+        self._entry: Optional[Entry] = None
+        self.picks = 0
+
+    async def get(
+        self, db: AsyncSession, now: Optional[datetime] = None
+    ) -> Optional[Entry]:
+        """Today's (body, ETag), or None while there are no translations."""
+        day = (now or datetime.utcnow()).date()
+        if self._day == day:
+            return self._entry
+
+        async def load() -> Optional[Entry]:
+            self.picks += 1
+            translation = await pick_word_of_the_day(db, day)
+            if translation is None:
+                return None
+            return render_word_of_the_day(translation)
+
+        entry = await self._cache.get_or_load(day.isoformat(), load)
+        if entry is not None:
+            self._day, self._entry = day, entry
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for monitoring."""
+        return {
+            "day": self._day.isoformat() if self._day else None,
+            "picks": self.picks,
+        }
+
+
+# Global instance; entries are keyed by date and outlive their day
+word_of_the_day = WordOfTheDay(
+    shared_cache("word-of-the-day", maxsize=4, ttl=2 * 86400)
+)
@@ -0,0 +1,173 @@
+"""
+Write-behind buffer for the Yoruba Language API.
+Queues log-style rows in memory and inserts them in bulk off the request path.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional
+)
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import AsyncSessionLocal
+from app.services.pagination import invalidate_counts
+
+logger = logging.getLogger(__name__)
+
+RowWriter = Callable[[AsyncSession, List[Dict[str, Any]]], Awaitable[None]]
+
+
+class WriteBehindBuffer:
+    """
+    Bounded buffer of rows flushed to one table in bulk.
+
+    Requests only append to a deque, so their latency does not depend
+    on the database. A background task inserts the rows with one
+    executemany per ``batch_size`` rows, as soon as a batch is full or
+    every ``flush_interval`` seconds. Once ``max_size`` rows are waiting,
+    new rows are dropped and counted rather than slowing requests down.
+    ``stop`` flushes whatever is left. ``write`` replaces the plain
+    INSERT, e.g. with an upsert.
+    """
+
+    def __init__(
+        self,
+        model,
+        max_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        session_factory=AsyncSessionLocal,
+        write: Optional[RowWriter] = None
+    ):
+        self.model = model
+        self._write = write or self._insert
+        self._session_factory = session_factory
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._rows: Deque[Dict[str, Any]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._closing = False
+        self.accepted = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.flushes = 0
+
+    def start(self) -> None:
+        """Start the flush task on the running event loop."""
+        self._wake = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task, then write every buffered row."""
+        if self._task:
+            # Let a flush in progress finish rather than losing its rows
+            self._closing = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        while self._rows:
+            if not await self.flush():
+                break
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """Buffer one row; returns False if it was dropped."""
+        return self.add_many([row]) == 1
+
+    def add_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Buffer rows, stamping ``created_at``; returns how many fit."""
+        now = datetime.utcnow()
+        added = 0
+        for row in rows:
+            if len(self._rows) >= self.max_size:
+                self.dropped += 1
+                continue
+            row.setdefault("created_at", now)
+            self._rows.append(row)
+            added += 1
+        self.accepted += added
+        if self._wake and len(self._rows) >= self.batch_size:
+            self._wake.set()
+        return added
+
+    async def flush(self) -> int:
+        """Insert up to one batch of rows; returns how many were written."""
+        count = min(len(self._rows), self.batch_size)
+        if not count:
+            return 0
+        batch: List[Dict[str, Any]] = [
+            self._rows.popleft() for _ in range(count)
+        ]
+        self.flushes += 1
+        try:
+            async with self._session_factory() as db:
+                await self._write(db, batch)
+                await db.commit()
+        except Exception as e:
+            # The rows are only a log; losing them beats blocking writers
+            self.failed += count
+            logger.error(
+                f"Writing {count} {self.model.__tablename__} rows "
+                f"failed: {str(e)}"
+            )
+            return 0
+        self.written += count
+        invalidate_counts(self.model.__tablename__)
+        return count
+
+    async def _insert(
+        self, db: AsyncSession, rows: List[Dict[str, Any]]
+    ) -> None:
+        await db.execute(insert(self.model), rows)
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                while self._rows:
+                    if not await self.flush():
+                        break
+                    if len(self._rows) < self.batch_size:
+                        break
+            except Exception as e:
+                logger.error(f"Write-behind flush failed: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "buffered": len(self._rows),
+            "max_size": self.max_size,
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+            "flushes": self.flushes,
+        }
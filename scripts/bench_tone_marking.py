@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for tone marking throughput.
+Compares the single-pass matcher with one re.sub per lexicon word, then
+shows that throughput holds as the lexicon grows.
+
+Usage:
+    python scripts/bench_tone_marking.py
+"""
+
+import os
+import random
+import re
+import sys
+import timeit
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.tone_lexicon import (
+    ToneLexicon,
+    current_tone_lexicon,
+    set_tone_lexicon
+)
+from app.services.tone_service import add_tone_marks
+
+TONE_PATTERNS = dict(current_tone_lexicon().items())
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+FILLER = (
+    "ile", "oja", "aso", "ounje", "owo", "lo", "dara", "pupo", "oko",
+    "iya", "ore", "akara", "eko", "oluko", "ise", "ojo", "ale", "osan",
+)
+# Roughly one word in four is in the lexicon, as in ordinary prose
+LEXICON_SHARE = 0.25
+
+
+def add_tone_marks_per_pattern(text: str) -> str:
+    """The previous implementation: one re.sub pass per lexicon word."""
+    result = text
+    for pattern, replacement in TONE_PATTERNS.items():
+        result = re.sub(
+            r'\b' + re.escape(pattern) + r'\b',
+            replacement,
+            result,
+            flags=re.IGNORECASE
+        )
+    return result
+
+
+def make_text(size: int) -> str:
+    rng = random.Random(size)
+    lexicon = [w.capitalize() for w in TONE_PATTERNS] + list(TONE_PATTERNS)
+    parts = []
+    length = 0
+    while length < size:
+        words = lexicon if rng.random() < LEXICON_SHARE else FILLER
+        word = rng.choice(words)
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)[:size]
+
+
+def bench(func, text: str) -> float:
+    """Return the best time of several runs, in seconds."""
+    runs = max(1, 200_000 // len(text))
+    return min(timeit.repeat(lambda: func(text), number=runs, repeat=5)) / runs
+
+
+def main():
+    print(f"{'size':>10} {'per-pattern':>14} {'single pass':>14} {'speedup':>8}")
+    for size in SIZES:
+        text = make_text(size)
+        assert add_tone_marks(text) == add_tone_marks_per_pattern(text)
+        old = bench(add_tone_marks_per_pattern, text)
+        new = bench(add_tone_marks, text)
+        print(
+            f"{size:>10} {size / old / 1e6:>10.1f} MB/s "
+            f"{size / new / 1e6:>10.1f} MB/s {old / new:>7.1f}x"
+        )
+
+    text = make_text(100_000)
+    rng = random.Random(0)
+    print(f"\n{'lexicon':>10} {'single pass':>14}  (100 KB input)")
+    for entries in (len(TONE_PATTERNS), 10_000, 100_000):
+        lexicon = dict(TONE_PATTERNS)
+        while len(lexicon) < entries:
+            word = "".join(
+                rng.choice("abdefgijklmnoprstuwy")
+                for _ in range(rng.randint(3, 9))
+            )
+            lexicon.setdefault(word, word)
+        set_tone_lexicon(ToneLexicon(lexicon, "bench"))
+        rate = len(text) / bench(add_tone_marks, text) / 1e6
+        print(f"{entries:>10} {rate:>10.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Bulk import script for Yoruba Language API.
+Streams translations or proverbs from CSV/NDJSON files into the database.
+
+Usage:
+    python scripts/import_data.py translations dictionary.csv
+    python scripts/import_data.py proverbs proverbs.ndjson.gz --chunk-size 5000
+"""
+
+import argparse
+import asyncio
+import gzip
+import sys
+import os
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+from app.database import AsyncSessionLocal, async_engine, Base
+from app.services.bulk_import import (
+    FORMATS,
+    detect_format,
+    import_records,
+    iter_records
+)
+from app.services.http_cache import proverb_validators
+from app.services.proverb_pool import proverb_pool
+from app.services.translation_service import invalidate_translations
+
+
+def open_input(path: str):
+    """Open a possibly gzipped text file for streaming."""
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+
+async def run_import(kind: str, path: str, fmt: str, chunk_size: int):
+    """Create tables if needed and import the file chunk by chunk."""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    started = time.monotonic()
+
+    def report(stats):
+        elapsed = time.monotonic() - started
+        rate = stats["read"] / elapsed if elapsed else 0
+        print(
+            f"\r{stats['read']} read, {stats['inserted']} inserted, "
+            f"{stats['updated']} updated, {stats['skipped']} skipped "
+            f"({rate:.0f} rows/s)",
+            end="",
+            flush=True
+        )
+
+    try:
+        with open_input(path) as stream:
+            async with AsyncSessionLocal() as db:
+                stats = await import_records(
+                    db,
+                    kind,
+                    iter_records(stream, fmt),
+                    chunk_size=chunk_size,
+                    on_progress=report
+                )
+        # Replicas sharing the cache must not keep serving stale rows
+        if kind == "translations":
+            await invalidate_translations()
+        else:
+            await proverb_validators.invalidate()
+            if stats["updated"]:
+                await proverb_pool.invalidate()
+    finally:
+        await async_engine.dispose()
+    print()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bulk import translations or proverbs"
+    )
+    parser.add_argument("kind", choices=["translations", "proverbs"])
+    parser.add_argument("path", help="CSV or NDJSON file, .gz or - for stdin")
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="Input format (guessed from the file name by default)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.import_chunk_size,
+        help="Rows written per batch"
+    )
+    args = parser.parse_args()
+
+    fmt = args.format or detect_format(args.path)
+    print(f"Importing {args.kind} from {args.path} ({fmt})...")
+    stats = asyncio.run(
+        run_import(args.kind, args.path, fmt, args.chunk_size)
+    )
+    print(f"Import complete: {stats}")
+
+
+if __name__ == "__main__":
+    main()
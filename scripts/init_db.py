@@ -10,6 +10,8 @@ import os
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import insert
+
 from app.database import engine, Base, SessionLocal
 from app.database import Translation, Proverb
 
@@ -126,15 +128,9 @@ def init_database():
             }
         ]
         
-        # Insert translations
-        for trans_data in translations:
-            translation = Translation(**trans_data)
-            db.add(translation)
-        
-        # Insert proverbs
-        for prov_data in proverbs:
-            proverb = Proverb(**prov_data)
-            db.add(proverb)
+        # Insert translations and proverbs with batched statements
+        db.execute(insert(Translation), translations)
+        db.execute(insert(Proverb), proverbs)
         
         db.commit()
         print(
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Train the n-gram tone restoration model for Yoruba Language API.
+Reads tone-marked text from the database and optional text files, then
+writes a memory-mappable model file for the ngram engine.
+
+Usage:
+    python scripts/train_tone_model.py tone_model.bin
+    python scripts/train_tone_model.py tone_model.bin --text corpus.txt
+"""
+
+import argparse
+import sys
+import os
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.database import SessionLocal, Proverb, Translation
+from app.services.tone_model import ToneModel
+
+
+def iter_database_texts(chunk_size: int = 1000):
+    """Yield tone-marked Yoruba from translations and proverbs."""
+    db = SessionLocal()
+    try:
+        for column in (Translation.yoruba_word, Proverb.yoruba_text):
+            rows = db.execute(
+                select(column).execution_options(yield_per=chunk_size)
+            )
+            for (text,) in rows:
+                if text:
+                    yield text
+    finally:
+        db.close()
+
+
+def iter_text_files(paths):
+    """Yield one sentence per non-empty line of each file."""
+    for path in paths:
+        with open(path, encoding="utf-8-sig") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Train the n-gram tone restoration model"
+    )
+    parser.add_argument("output", help="Where to write the model file")
+    parser.add_argument(
+        "--text",
+        action="append",
+        default=[],
+        help="Extra tone-marked corpus, one sentence per line (repeatable)"
+    )
+    parser.add_argument(
+        "--no-db",
+        action="store_true",
+        help="Train only on --text files"
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=1,
+        help="Drop word forms seen fewer times than this"
+    )
+    args = parser.parse_args()
+
+    def texts():
+        if not args.no_db:
+            yield from iter_database_texts()
+        yield from iter_text_files(args.text)
+
+    started = time.monotonic()
+    model = ToneModel.train(texts(), min_count=args.min_count)
+    model.save(args.output)
+    model = ToneModel.load(args.output)
+
+    size = os.path.getsize(args.output)
+    print(f"Trained in {time.monotonic() - started:.1f}s: {model.meta}")
+    print(f"Wrote {args.output} ({size / 1024:.1f} KiB)")
+    print(f"Set TONE_MODEL_PATH={args.output} to enable the ngram engine")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import asyncio
+import atexit
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# Route tests run the app's lifespan, which creates its tables; keep
+# them in a throwaway database rather than the working copy's yoruba.db.
+# Set before anything imports app.config.
+_DB_DIR = tempfile.mkdtemp(prefix="yoruba-tests-")
+atexit.register(shutil.rmtree, _DB_DIR, ignore_errors=True)
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(_DB_DIR, 'yoruba.db')}"
+)
+# Admin routes stay closed without an API key
+os.environ.setdefault("API_KEY", "test-api-key")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    async_sessionmaker,
+    create_async_engine
+)
+
+from app.config import settings  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def client():
+    """A test client that runs the app's startup and shutdown."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def admin_headers():
+    """Headers that pass the admin routes' API key check."""
+    return {"X-API-Key": settings.api_key}
+
+
+@pytest.fixture
+def run_db():
+    """
+    Run ``scenario(engine, session_factory)`` against a fresh in-memory
+    SQLite database in a new event loop, and return its result.
+
+    Pass ``create_tables=False`` to start from an empty schema, e.g. to
+    build a legacy table by hand.
+    """
+    def run(scenario, create_tables: bool = True):
+        async def main():
+            engine = create_async_engine("sqlite+aiosqlite://")
+            try:
+                if create_tables:
+                    async with engine.begin() as conn:
+                        await conn.run_sync(Base.metadata.create_all)
+                session_factory = async_sessionmaker(
+                    engine, expire_on_commit=False
+                )
+                return await scenario(engine, session_factory)
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
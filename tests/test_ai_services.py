@@ -0,0 +1,300 @@
+"""
+Tests for the AI translation services, run offline against the mock.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import fakeredis
+import httpx
+import pytest
+
+from app.services.ai_batcher import AIMicroBatcher
+from app.services.ai_translation_service import AITranslationService
+from app.services.enrichment_queue import EnrichmentQueue, QueueFullError
+from app.services.mock_ai_service import AsyncMockAITranslationService
+from app.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientAIService
+)
+from app.services.shared_cache import RedisCacheBackend, SharedCache
+from app.services.single_flight import SingleFlight
+
+
+def test_async_mock_translations_run_concurrently():
+    """Simulated AI round trips overlap instead of queueing."""
+    service = AsyncMockAITranslationService(latency=0.2)
+
+    async def translate_all():
+        return await asyncio.gather(
+            *(service.translate_to_yoruba_async("love") for _ in range(10))
+        )
+
+    started = time.perf_counter()
+    results = asyncio.run(translate_all())
+    elapsed = time.perf_counter() - started
+
+    assert [r["translation"] for r in results] == ["ifẹ́"] * 10
+    assert service.max_in_flight == 10
+    assert elapsed < 1.0
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    """Concurrent requests for one word share a single AI call."""
+    service = AsyncMockAITranslationService(latency=0.1)
+    flights = SingleFlight()
+
+    async def translate_all():
+        return await asyncio.gather(*(
+            flights.do(
+                "wisdom",
+                lambda: service.translate_to_yoruba_async("wisdom")
+            )
+            for _ in range(20)
+        ))
+
+    results = asyncio.run(translate_all())
+
+    assert service.calls == 1
+    assert all(r is results[0] for r in results)
+    assert flights.stats() == {
+        "executions": 1, "coalesced": 19, "in_flight": 0
+    }
+
+
+def test_single_flight_shares_failures_and_retries_afterwards():
+    """A failed call is reported to every waiter and not cached."""
+    flights = SingleFlight()
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        results = await asyncio.gather(
+            *(flights.do("x", failing) for _ in range(3)),
+            return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        await asyncio.gather(flights.do("x", failing), return_exceptions=True)
+
+    asyncio.run(run())
+    assert len(attempts) == 2
+
+
+def test_micro_batcher_packs_concurrent_words_into_one_call():
+    """Words submitted within the window share a single AI request."""
+    service = AsyncMockAITranslationService(latency=0.05)
+    batcher = AIMicroBatcher(
+        service.translate_many_to_yoruba_async,
+        max_batch_size=4,
+        max_wait_seconds=0.05
+    )
+    words = ["love", "peace", "hope", "wisdom", "courage", "knowledge"]
+
+    async def translate_all():
+        return await asyncio.gather(*(batcher.submit(w) for w in words))
+
+    results = asyncio.run(translate_all())
+
+    assert [r["word"] for r in results] == words
+    assert results[1]["translation"] == "àlàáfíà"
+    assert service.calls == 2
+    assert batcher.stats()["batches"] == 2
+
+
+def test_micro_batcher_fails_waiters_on_short_results():
+    """A batch answered with too few results fails every waiter."""
+    async def translate_batch(words):
+        return [{"word": words[0]}]
+
+    async def run():
+        batcher = AIMicroBatcher(
+            translate_batch, max_batch_size=3, max_wait_seconds=0.01
+        )
+        return await asyncio.wait_for(asyncio.gather(
+            *(batcher.submit(w) for w in ("love", "peace", "hope")),
+            return_exceptions=True
+        ), timeout=1)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_parse_batch_response_falls_back_per_item():
+    """Missing or malformed array items get individual fallbacks."""
+    service = AITranslationService()
+    response = """Here you go:
+[
+  {"word": "Water", "translation": "omi", "part_of_speech": "noun",
+   "example": "I drink water → Mo mu omi"},
+  {"word": "fire"}
+]"""
+
+    results = service._parse_ai_response(response, ["water", "fire", "sun"])
+
+    assert results[0]["translation"] == "omi"
+    assert results[0]["source"] == "ai"
+    assert [r["source"] for r in results[1:]] == ["ai_fallback"] * 2
+    assert service._parse_ai_response("not json", ["a"])[0]["word"] == "a"
+
+
+def test_parse_batch_response_keeps_name_matches_out_of_fallback():
+    """Position never hands a word an item matched by another word."""
+    service = AITranslationService()
+    # The model answered in a different order and misspelt "sun"
+    response = """[
+  {"word": "fire", "translation": "iná"},
+  {"word": "son", "translation": "ọmọ"},
+  {"word": "water", "translation": "omi"}
+]"""
+
+    results = service._parse_ai_response(response, ["water", "sun", "fire"])
+
+    assert [r["translation"] for r in results] == ["omi", "ọmọ", "iná"]
+
+    response = """[
+  {"word": "sun", "translation": "oòrùn"},
+  {"word": "fire", "translation": "iná"}
+]"""
+
+    results = service._parse_ai_response(response, ["moon", "sun"])
+
+    # "moon" would get the item "sun" already claimed
+    assert [r["source"] for r in results] == ["ai_fallback", "ai"]
+    assert results[1]["translation"] == "oòrùn"
+
+
+def test_circuit_breaker_opens_and_fails_fast():
+    """Repeated failures open the breaker so later calls are rejected."""
+    service = AsyncMockAITranslationService(latency=0, failure_rate=1.0)
+    resilient = ResilientAIService(
+        service,
+        breaker=CircuitBreaker(min_calls=3, open_seconds=60),
+        max_attempts=3,
+        backoff=0
+    )
+
+    async def run():
+        with pytest.raises(Exception, match="Simulated AI failure"):
+            await resilient.translate_to_yoruba_async("love")
+        with pytest.raises(CircuitOpenError):
+            await resilient.translate_to_yoruba_async("love")
+
+    asyncio.run(run())
+    assert service.calls == 3
+    assert resilient.stats()["state"] == CircuitBreaker.OPEN
+    assert resilient.stats()["rejected"] == 1
+
+
+def test_half_open_probe_closes_breaker():
+    """After the cooldown a successful probe closes the breaker."""
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.before_call()
+    assert not breaker.allows_requests()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_deadline_bounds_slow_calls():
+    """A call slower than the deadline fails with a timeout."""
+    service = AsyncMockAITranslationService(latency=1.0)
+    resilient = ResilientAIService(service, deadline=0.05)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(resilient.translate_to_yoruba_async("love"))
+    assert resilient.stats()["timeouts"] == 1
+
+
+def test_hedged_request_wins_over_slow_primary():
+    """A hedge started after the delay returns before a slow primary."""
+    latencies = [1.0, 0.01]
+
+    class SlowThenFastService(AsyncMockAITranslationService):
+        async def translate_to_yoruba_async(self, english_text):
+            self.latency = latencies.pop(0)
+            return await super().translate_to_yoruba_async(english_text)
+
+    resilient = ResilientAIService(
+        SlowThenFastService(), deadline=0.5, hedge_delay=0.05
+    )
+
+    started = time.perf_counter()
+    result = asyncio.run(resilient.translate_to_yoruba_async("peace"))
+
+    assert result["translation"] == "àlàáfíà"
+    assert time.perf_counter() - started < 0.5
+    assert resilient.stats()["hedges"] == 1
+
+
+def test_enrichment_queue_runs_jobs_in_background():
+    """Queued words complete on the workers and share one job per word."""
+    service = AsyncMockAITranslationService(latency=0.05)
+
+    async def translate(word):
+        result = await service.translate_to_yoruba_async(word)
+        return {"yoruba_word": result["translation"]}, result["source"]
+
+    async def run():
+        queue = EnrichmentQueue(translate, workers=1, max_size=1)
+        queue.start()
+        job = await queue.submit("love", "love")
+        assert await queue.submit("love", "Love") is job
+        with pytest.raises(QueueFullError):
+            await queue.submit("hope", "hope")
+        await asyncio.sleep(0.2)
+        await queue.stop()
+        return await queue.get(job["job_id"])
+
+    job = asyncio.run(run())
+    assert job["status"] == EnrichmentQueue.DONE
+    assert job["translation"] == {"yoruba_word": "ifẹ́"}
+    assert service.calls == 1
+
+
+def test_enrichment_jobs_can_be_polled_on_another_replica():
+    """Job records live in the shared cache, not in the worker process."""
+    service = AsyncMockAITranslationService(latency=0.01)
+
+    async def translate(word):
+        result = await service.translate_to_yoruba_async(word)
+        return {"yoruba_word": result["translation"]}, result["source"]
+
+    async def run():
+        backend = RedisCacheBackend(fakeredis.FakeAsyncRedis())
+        worker, other = (
+            EnrichmentQueue(translate, jobs=SharedCache("ai-jobs", backend))
+            for _ in range(2)
+        )
+        worker.start()
+        job = await worker.submit("peace", "peace")
+        await asyncio.sleep(0.1)
+        await worker.stop()
+        return await other.get(job["job_id"]), await other.get("unknown")
+
+    job, unknown = asyncio.run(run())
+    assert job["status"] == EnrichmentQueue.DONE
+    assert job["translation"] == {"yoruba_word": "àlàáfíà"}
+    assert unknown is None
+
+
+def test_async_translation_keeps_the_sdk_error_type():
+    """Errors from the SDK reach the resilience layer unwrapped."""
+    class TimingOutCompletions:
+        async def create(self, **kwargs):
+            raise httpx.ReadTimeout("read timed out")
+
+    service = AITranslationService()
+    service.async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=TimingOutCompletions())
+    )
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(service.translate_to_yoruba_async("love"))
@@ -0,0 +1,123 @@
+"""
+Tests for the streaming bulk importer.
+"""
+
+import gzip
+import io
+
+from sqlalchemy import select
+
+from app.database import Translation
+from app.services.bulk_import import import_records, iter_records
+
+CSV_DATA = """english_word,yoruba_word,part_of_speech
+water,omi,noun
+fire,iná,noun
+,missing,noun
+water,omi tútù,noun
+"""
+NDJSON_DATA = '{"english_word": "fire", "yoruba_word": "iná"}\n'
+
+
+async def _rows(db):
+    return {
+        t.english_word: t.yoruba_word
+        for t in (await db.scalars(select(Translation))).all()
+    }
+
+
+def test_csv_import_inserts_updates_and_skips(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            stats = await import_records(
+                db, "translations",
+                iter_records(io.StringIO(CSV_DATA), "csv"),
+                chunk_size=2
+            )
+            return stats, await _rows(db)
+
+    stats, rows = run_db(scenario)
+    # The repeated "water" row lands in a later chunk and updates the first
+    assert stats == {"read": 4, "inserted": 2, "updated": 1, "skipped": 1}
+    assert rows == {"water": "omi tútù", "fire": "iná"}
+
+
+def test_ndjson_import_updates_existing_rows(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            db.add(Translation(english_word="fire", yoruba_word="ina"))
+            await db.commit()
+            stats = await import_records(
+                db, "translations",
+                iter_records(io.StringIO(NDJSON_DATA), "ndjson")
+            )
+            return stats, await _rows(db)
+
+    stats, rows = run_db(scenario)
+    assert stats == {"read": 1, "inserted": 0, "updated": 1, "skipped": 0}
+    assert rows == {"fire": "iná"}
+
+
+def test_import_matches_words_the_way_the_index_does(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            db.add(Translation(english_word="water", yoruba_word="omi"))
+            await db.commit()
+            data = (
+                "english_word,yoruba_word\n"
+                "Water,omi tútù\nFIRE,iná\nfire  ,iná gbígbóná\n"
+            )
+            stats = await import_records(
+                db, "translations", iter_records(io.StringIO(data), "csv")
+            )
+            return stats, await _rows(db)
+
+    stats, rows = run_db(scenario)
+    # "Water" updates "water", and "FIRE" and "fire" are one word
+    assert stats == {"read": 3, "inserted": 1, "updated": 1, "skipped": 0}
+    assert rows == {"Water": "omi tútù", "fire": "iná gbígbóná"}
+
+
+def test_import_route_serves_updated_rows(client, admin_headers):
+    client.post("/api/v1/translations", json={
+        "english_word": "importsun", "yoruba_word": "oorun"
+    })
+    # Cached before the import
+    assert client.get(
+        "/api/v1/translate?word=importsun"
+    ).json()["yoruba_word"] == "oorun"
+
+    csv_data = "english_word,yoruba_word\nimportsun,oòrùn\nimportmoon,oṣù\n"
+    response = client.post(
+        "/api/v1/import/translations",
+        files={"file": ("words.csv", csv_data.encode(), "text/csv")},
+        headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["updated"] == 1
+
+    for word, yoruba in (("importsun", "oòrùn"), ("importmoon", "oṣù")):
+        found = client.get(f"/api/v1/translate?word={word}")
+        assert found.status_code == 200
+        assert found.json()["yoruba_word"] == yoruba
+
+
+def test_import_route_reads_gzip_uploads(client, admin_headers):
+    ndjson = '{"english_word": "importstar", "yoruba_word": "ìràwọ̀"}\n'
+    response = client.post(
+        "/api/v1/import/translations",
+        files={"file": ("words.ndjson.gz", gzip.compress(ndjson.encode()))},
+        headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["format"] == "ndjson"
+    assert response.json()["inserted"] == 1
+
+
+def test_import_route_requires_the_api_key(client):
+    response = client.post(
+        "/api/v1/import/translations",
+        files={"file": ("words.csv", b"english_word,yoruba_word\n")},
+        headers={"X-API-Key": "wrong"}
+    )
+    assert response.status_code == 401
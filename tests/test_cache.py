@@ -0,0 +1,45 @@
+"""
+Tests for the in-memory LRU cache.
+"""
+
+from app.services import cache as cache_module
+from app.services.cache import MISS, LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISS
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_negative_entries_expire_sooner(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(ttl=60, negative_ttl=5)
+    cache.set("found", "ọmọ")
+    cache.set_negative("missing")
+
+    assert cache.get("missing") is None
+    now[0] += 10
+    assert cache.get("missing") is MISS
+    assert cache.get("found") == "ọmọ"
+
+    stats = cache.stats()
+    assert stats["negative_hits"] == 1
+    assert stats["expirations"] == 1
+
+
+def test_clear_negative_keeps_positive_entries():
+    cache = LRUCache()
+    cache.set("found", 1)
+    cache.set_negative("missing")
+    cache.clear_negative()
+
+    assert cache.get("found") == 1
+    assert cache.get("missing") is MISS
@@ -0,0 +1,107 @@
+"""
+Tests for ETag / Last-Modified validation of read endpoints.
+"""
+
+import asyncio
+from datetime import datetime
+
+from fastapi import Request, Response
+
+from app.services.http_cache import ConditionalGet, http_date
+from app.services.shared_cache import SharedCache
+
+STAMPS = [(1, datetime(2026, 3, 1, 8, 0, 0, 500)), (2, datetime(2026, 3, 2))]
+
+
+def _request(method: str = "GET", **headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": method,
+        "headers": [
+            (name.replace("_", "-").encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    })
+
+
+async def _validate(versioned_etags: bool):
+    validators = ConditionalGet(
+        "proverbs", SharedCache("validators"), versioned_etags=versioned_etags
+    )
+    steps = {}
+
+    # A first request gets validators and no 304
+    version, early = await validators.check(_request(), "page:1")
+    response = Response()
+    full = await validators.respond(
+        _request(), response, "page:1", version, STAMPS, 2
+    )
+    etag = response.headers["etag"]
+    steps["first"] = (early, full, dict(response.headers))
+
+    # The same ETag comes back: answered before any query
+    _, early = await validators.check(_request(if_none_match=etag), "page:1")
+    steps["early"] = early
+
+    # After a write the remembered validators are gone
+    await validators.invalidate()
+    version, early = await validators.check(
+        _request(if_none_match=etag), "page:1"
+    )
+    response = Response()
+    after_write = await validators.respond(
+        _request(if_none_match=etag), response, "page:1", version, STAMPS, 2
+    )
+    steps["after_write"] = (early, after_write, response.headers.get("etag"))
+
+    # A different page total means a different ETag
+    response = Response()
+    await validators.respond(
+        _request(), response, "page:1", version, STAMPS, 3
+    )
+    steps["changed"] = response.headers["etag"] != etag
+
+    since = http_date(datetime(2026, 3, 2))
+    _, early = await validators.check(
+        _request(if_modified_since=since), "page:1"
+    )
+    steps["since"] = early
+    steps["post"] = await validators.check(
+        _request("POST", if_none_match=etag), "page:1"
+    )
+    steps["stats"] = validators.stats()
+    return steps
+
+
+def test_validators_and_early_not_modified():
+    steps = asyncio.run(_validate(versioned_etags=False))
+
+    early, full, headers = steps["first"]
+    assert early is None and full is None
+    assert headers["etag"].startswith('W/"')
+    assert headers["last-modified"] == "Mon, 02 Mar 2026 00:00:00 GMT"
+    assert headers["cache-control"] == "no-cache"
+
+    assert steps["early"].status_code == 304
+    assert steps["early"].headers["etag"] == headers["etag"]
+
+    # Rows carry updated_at, so an unrelated write keeps the ETag valid;
+    # the check just costs a query again
+    early, after_write, etag = steps["after_write"]
+    assert early is None
+    assert after_write.status_code == 304
+    assert etag is None
+
+    assert steps["changed"]
+    assert steps["since"].status_code == 304
+    assert steps["post"] == (None, None)
+    assert steps["stats"]["early_not_modified"] == 2
+    assert steps["stats"]["not_modified"] == 3
+
+
+def test_versioned_etags_change_on_every_write():
+    steps = asyncio.run(_validate(versioned_etags=True))
+
+    early, after_write, etag = steps["after_write"]
+    assert early is None and after_write is None
+    assert etag != steps["first"][2]["etag"]
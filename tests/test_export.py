@@ -0,0 +1,45 @@
+"""
+Tests for the streaming NDJSON export.
+"""
+
+import gzip
+import json
+
+from app.database import Proverb
+from app.services.export import gzip_stream, iter_ndjson
+
+
+async def _add_proverbs(session_factory):
+    async with session_factory() as db:
+        db.add_all([
+            Proverb(yoruba_text=f"òwe {i}", english_translation=f"proverb {i}")
+            for i in range(5)
+        ])
+        await db.commit()
+
+
+def test_export_streams_rows_in_chunks(run_db):
+    async def scenario(engine, session_factory):
+        await _add_proverbs(session_factory)
+        return [
+            c async for c in iter_ndjson(engine, "proverbs", chunk_size=2)
+        ]
+
+    chunks = run_db(scenario)
+    assert len(chunks) == 3
+    rows = [json.loads(line) for line in b"".join(chunks).splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+    assert rows[0]["yoruba_text"] == "òwe 0"
+
+
+def test_gzip_export_matches_plain_export(run_db):
+    async def scenario(engine, session_factory):
+        await _add_proverbs(session_factory)
+        plain = b"".join([c async for c in iter_ndjson(engine, "proverbs")])
+        compressed = b"".join(
+            [c async for c in gzip_stream(iter_ndjson(engine, "proverbs"))]
+        )
+        return plain, compressed
+
+    plain, compressed = run_db(scenario)
+    assert gzip.decompress(compressed) == plain
@@ -0,0 +1,147 @@
+"""
+Tests for keyset pagination and cached counts.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.database import Proverb
+from app.services.pagination import (
+    cached_count,
+    decode_cursor,
+    encode_cursor,
+    invalidate_counts,
+    keyset_page
+)
+
+
+def test_cursor_round_trip():
+    token = encode_cursor({"id": 42, "page": 3})
+    assert "=" not in token
+    assert decode_cursor(token) == {"id": 42, "page": 3}
+
+
+@pytest.mark.parametrize("token", ["zzz", encode_cursor({"page": 2}), ""])
+def test_invalid_cursor_is_rejected(token):
+    with pytest.raises(ValueError):
+        decode_cursor(token)
+
+
+# (category, created_at minute) per proverb; ids follow list order
+PROVERBS = [
+    ("wisdom", 5), ("patience", 1), ("wisdom", 3), ("family", 3),
+    ("patience", 0), ("wisdom", 4), ("family", 2),
+]
+
+
+async def _add_proverbs(db, count=len(PROVERBS)):
+    db.add_all([
+        Proverb(
+            yoruba_text=f"òwe {i}",
+            english_translation=f"proverb {i}",
+            category=category,
+            created_at=datetime(2026, 3, 1, 8, minute)
+        )
+        for i, (category, minute) in enumerate(PROVERBS[:count])
+    ])
+    await db.commit()
+
+
+async def _walk(db, limit, **options):
+    """Follow cursors from the first page to the last."""
+    pages = []
+    cursor = None
+    while True:
+        rows, page, cursor = await keyset_page(
+            db, select(Proverb), Proverb.id, limit, cursor=cursor, **options
+        )
+        pages.append((page, [row.id for row in rows]))
+        if cursor is None:
+            return pages
+
+
+def _walk_proverbs(run_db, limit, count=len(PROVERBS), **options):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db, count)
+            return await _walk(db, limit, **options)
+
+    return run_db(scenario)
+
+
+def test_cursors_walk_every_row_once_in_id_order(run_db):
+    assert _walk_proverbs(run_db, 3) == [
+        (1, [1, 2, 3]), (2, [4, 5, 6]), (3, [7])
+    ]
+
+
+def test_full_last_page_has_no_next_cursor(run_db):
+    # limit + 1 rows are fetched, so an exact fit needs no empty page
+    assert _walk_proverbs(run_db, 3, count=6) == [
+        (1, [1, 2, 3]), (2, [4, 5, 6])
+    ]
+
+
+def test_cursors_walk_in_descending_order(run_db):
+    assert _walk_proverbs(run_db, 3, descending=True) == [
+        (1, [7, 6, 5]), (2, [4, 3, 2]), (3, [1])
+    ]
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_sort_column_ties_are_broken_by_id(run_db, descending):
+    pages = _walk_proverbs(
+        run_db, 2, descending=descending, sort_column=Proverb.category
+    )
+    expected = sorted(
+        range(1, len(PROVERBS) + 1),
+        key=lambda i: (PROVERBS[i - 1][0], i),
+        reverse=descending
+    )
+    assert [ids for _, ids in pages] == [
+        expected[i:i + 2] for i in range(0, len(expected), 2)
+    ]
+    assert [page for page, _ in pages] == [1, 2, 3, 4]
+
+
+def test_datetime_sort_column_round_trips_through_the_cursor(run_db):
+    pages = _walk_proverbs(
+        run_db, 3, descending=True, sort_column=Proverb.created_at
+    )
+    assert [ids for _, ids in pages] == [[1, 6, 4], [3, 7, 2], [5]]
+
+
+def test_skip_without_cursor_sets_the_page(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db)
+            rows, page, cursor = await keyset_page(
+                db, select(Proverb), Proverb.id, 3, skip=3
+            )
+            rest, next_page, _ = await keyset_page(
+                db, select(Proverb), Proverb.id, 3, cursor=cursor
+            )
+        return [r.id for r in rows], page, [r.id for r in rest], next_page
+
+    assert run_db(scenario) == ([4, 5, 6], 2, [7], 3)
+
+
+def test_cached_count_is_reused_until_invalidated(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db, 3)
+            query = select(Proverb)
+            first = await cached_count(db, "pagination-test", query)
+            await _add_proverbs(db, 2)
+            cached = await cached_count(db, "pagination-test", query)
+            invalidate_counts("pagination-test")
+            fresh = await cached_count(db, "pagination-test", query)
+            filtered = await cached_count(
+                db, "pagination-test",
+                query.where(Proverb.category == "wisdom"), key="wisdom"
+            )
+        return first, cached, fresh, filtered
+
+    assert run_db(scenario) == (3, 3, 5, 3)
@@ -0,0 +1,77 @@
+"""
+Tests for the random proverb id pool.
+"""
+
+import asyncio
+
+from app.database import Proverb
+from app.services.proverb_pool import ProverbPool
+
+
+async def _add_proverbs(db):
+    db.add_all([
+        Proverb(
+            yoruba_text=f"òwe {i}",
+            english_translation=f"proverb {i}",
+            category="wisdom" if i % 2 else "patience"
+        )
+        for i in range(10)
+    ])
+    await db.commit()
+
+
+def test_pool_picks_distinct_proverbs(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db)
+            return await ProverbPool().pick(db, count=20)
+
+    picked = run_db(scenario)
+    assert len(picked) == 10
+    assert len({p["id"] for p in picked}) == 10
+
+
+def test_pool_picks_by_category(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db)
+            return await ProverbPool().pick(db, count=3, category="wisdom")
+
+    wisdom = run_db(scenario)
+    assert len(wisdom) == 3
+    assert all(p["category"] == "wisdom" for p in wisdom)
+
+
+def test_pool_add_grows_the_pool(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db)
+            pool = ProverbPool()
+            await pool.pick(db, count=1)
+            proverb = Proverb(yoruba_text="tuntun", english_translation="new")
+            db.add(proverb)
+            await db.commit()
+            await pool.add(proverb)
+            return len(pool)
+
+    assert run_db(scenario) == 11
+
+
+def test_picks_use_the_old_pool_while_reloading(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            await _add_proverbs(db)
+            pool = ProverbPool()
+            await pool.load(db)
+
+            reload = asyncio.ensure_future(pool.load(db))
+            seen = []
+            while not reload.done():
+                seen.append(len(pool._ids))
+                await asyncio.sleep(0)
+            await reload
+        return seen, len(pool)
+
+    seen, size = run_db(scenario)
+    assert seen and all(count == 10 for count in seen)
+    assert size == 10
@@ -0,0 +1,58 @@
+"""
+Tests for full-text proverb search.
+"""
+
+from app.database import Proverb
+from app.services.proverb_search import ProverbSearch, highlight
+
+
+async def _installed_search(engine, db):
+    # Written before the index exists, so picked up by the rebuild
+    db.add(Proverb(
+        yoruba_text="Ọmọ́ ni ìyì ènìyàn",
+        english_translation="A child is a person's pride"
+    ))
+    await db.commit()
+
+    search = ProverbSearch()
+    backend = await search.install(engine)
+
+    # Written after, so indexed by the triggers
+    db.add(Proverb(yoruba_text="Ilé ọmọ", english_translation="home"))
+    await db.commit()
+    return search, backend
+
+
+def test_search_folds_diacritics_and_pages(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            search, backend = await _installed_search(engine, db)
+            hits, total, _, next_cursor = await search.search(
+                db, "omo", limit=1
+            )
+            rest, _, page, _ = await search.search(
+                db, "omo", cursor=next_cursor
+            )
+            return backend, hits, total, rest, page
+
+    backend, hits, total, rest, page = run_db(scenario)
+    assert backend == "fts5"
+    assert total == 2
+    assert page == 2
+    assert {hits[0]["id"], rest[0]["id"]} == {1, 2}
+
+
+def test_search_highlights_english_prefix_matches(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            search, _ = await _installed_search(engine, db)
+            return await search.search(db, "prid")
+
+    hits = run_db(scenario)[0]
+    assert hits[0]["highlights"]["english_translation"] == (
+        "A child is a person&#x27;s <b>pride</b>"
+    )
+
+
+def test_highlight_keeps_tone_marks():
+    assert highlight("Ọmọ́ dára", ["omo"]) == "<b>Ọmọ́</b> dára"
@@ -0,0 +1,73 @@
+"""
+Tests for diacritic-insensitive Yoruba reverse lookup.
+"""
+
+import unicodedata
+
+import pytest
+from sqlalchemy import insert, update
+
+from app.database import Translation
+from app.services.normalization import normalize_yoruba
+from app.services.reverse_lookup import (
+    backfill_yoruba_normalized,
+    reverse_lookup
+)
+
+RANKED_ROWS = [
+    {"english_word": "children", "yoruba_word": "ọmọọmọ"},
+    {"english_word": "child", "yoruba_word": "ọmọ"},
+    {"english_word": "orange", "yoruba_word": "ọsàn"},
+    {"english_word": "offspring", "yoruba_word": "ọmọ"},
+    {"english_word": "kids", "yoruba_word": "ọmọdé"},
+]
+
+
+def test_normalize_yoruba_folds_tone_marks_and_under_dots():
+    assert normalize_yoruba("Ọmọ́") == "omo"
+    assert normalize_yoruba(unicodedata.normalize("NFD", "Ẹ̀kọ́  ṣé")) == (
+        "eko se"
+    )
+
+
+def test_reverse_lookup_uses_backfilled_column(run_db):
+    async def scenario(engine, session_factory):
+        async with engine.begin() as conn:
+            await conn.execute(insert(Translation), [
+                {"english_word": "child", "yoruba_word": "ọmọ"},
+                {"english_word": "teach", "yoruba_word": "kọ́"},
+            ])
+            # Simulate a row written before the column existed
+            await conn.execute(
+                update(Translation)
+                .where(Translation.english_word == "teach")
+                .values(yoruba_normalized=None)
+            )
+        filled = await backfill_yoruba_normalized(engine)
+        async with session_factory() as db:
+            child = await reverse_lookup(db, "OMO")
+            teach = await reverse_lookup(db, "k")
+        return filled, child, teach
+
+    filled, child, teach = run_db(scenario)
+    assert filled == 1
+    assert [t.english_word for t in child] == ["child"]
+    assert [t.english_word for t in teach] == ["teach"]
+
+
+@pytest.mark.parametrize("limit, expected", [
+    (10, ["child", "offspring", "kids", "children"]),
+    (3, ["child", "offspring", "kids"]),
+    (1, ["child"]),
+])
+def test_reverse_lookup_ranks_exact_matches_before_prefixes(
+    run_db, limit, expected
+):
+    async def scenario(engine, session_factory):
+        async with engine.begin() as conn:
+            await conn.execute(insert(Translation), RANKED_ROWS)
+        async with session_factory() as db:
+            matches = await reverse_lookup(db, "omo", limit=limit)
+        return [t.english_word for t in matches]
+
+    assert run_db(scenario) == expected
@@ -0,0 +1,160 @@
+"""
+Tests for the shared cache, on the local backend and on a fake Redis.
+"""
+
+import asyncio
+from datetime import date, datetime
+
+import fakeredis
+import pytest
+
+from app.services.cache import MISS
+from app.services.shared_cache import (
+    LocalCacheBackend,
+    RedisCacheBackend,
+    SharedCache
+)
+
+
+def _backend(kind: str):
+    if kind == "redis":
+        return RedisCacheBackend(fakeredis.FakeAsyncRedis())
+    return LocalCacheBackend()
+
+
+class BrokenBackend(LocalCacheBackend):
+    async def get_many(self, keys):
+        raise ConnectionError("connection refused")
+
+
+async def _namespaces_and_invalidation(kind: str):
+    backend = _backend(kind)
+    # Two replicas of the same namespace, and another namespace
+    first = SharedCache("translations", backend, version_check_seconds=0)
+    second = SharedCache("translations", backend, version_check_seconds=0)
+    proverbs = SharedCache("proverbs", backend, version_check_seconds=0)
+
+    await first.set("omi", {"word": "water"})
+    await first.set_negative("xyz")
+    seen = (
+        await second.get("omi"),
+        await second.get("xyz"),
+        await proverbs.get("omi"),
+    )
+
+    await proverbs.set("omi", "proverb")
+    await first.invalidate()
+    after = (
+        await second.get("omi"),
+        await second.get("xyz"),
+        await proverbs.get("omi"),
+    )
+    return seen, after
+
+
+@pytest.mark.parametrize("kind", ["local", "redis"])
+def test_namespaced_entries_and_versioned_invalidation(kind):
+    seen, after = asyncio.run(_namespaces_and_invalidation(kind))
+
+    assert seen == ({"word": "water"}, None, MISS)
+    assert after == (MISS, MISS, "proverb")
+
+
+async def _stampede(kind: str):
+    backend = _backend(kind)
+    replicas = [SharedCache("translations", backend) for _ in range(2)]
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "omi"
+
+    results = await asyncio.gather(*(
+        replica.get_or_load("water", load)
+        for replica in replicas
+        for _ in range(10)
+    ))
+    return calls, results, replicas[1].stats()
+
+
+@pytest.mark.parametrize("kind", ["local", "redis"])
+def test_concurrent_misses_load_once_across_replicas(kind):
+    calls, results, stats = asyncio.run(_stampede(kind))
+
+    assert calls == 1
+    assert results == ["omi"] * 20
+    assert stats["lock_waits"] == 1
+
+
+async def _early_refresh():
+    cache = SharedCache(
+        "translations", _backend("redis"), ttl=60, early_refresh=1.0
+    )
+    await cache.set("water", "old")
+    loads = []
+
+    async def load():
+        loads.append(1)
+        return "new"
+
+    stale = await cache.get_or_load("water", load)
+    tracked = len(cache._refresh_tasks)
+    await asyncio.sleep(0.05)
+    return (
+        stale, await cache.get("water"), len(loads),
+        tracked, len(cache._refresh_tasks)
+    )
+
+
+def test_entries_near_expiry_are_refreshed_in_the_background():
+    stale, fresh, loads, tracked, left = asyncio.run(_early_refresh())
+
+    assert (stale, fresh, loads) == ("old", "new", 1)
+    # The refresh task is referenced until it finishes
+    assert (tracked, left) == (1, 0)
+
+
+async def _redis_round_trip(value):
+    backend = RedisCacheBackend(fakeredis.FakeAsyncRedis())
+    cache = SharedCache("translations", backend)
+    await cache.set("water", value)
+    raw = await backend._redis.get("yoruba:translations:0:water")
+    return raw, await cache.get("water"), cache.stats()["errors"]
+
+
+def test_redis_entries_are_json():
+    value = (
+        {"id": 1, "created_at": datetime(2026, 3, 1, 8, 30), "tags": [1]},
+        "database",
+        b"{}",
+        date(2026, 3, 1),
+    )
+    raw, cached, errors = asyncio.run(_redis_round_trip(value))
+
+    assert raw.startswith(b'{"__tuple__":')
+    assert cached == value
+    assert errors == 0
+
+
+def test_redis_rejects_values_json_cannot_hold():
+    _, cached, errors = asyncio.run(_redis_round_trip({1, 2}))
+
+    assert cached is MISS
+    assert errors == 1
+
+
+async def _broken_backend():
+    cache = SharedCache("translations", BrokenBackend())
+
+    async def load():
+        return "omi"
+
+    return await cache.get("water"), await cache.get_or_load("water", load), (
+        cache.stats()["errors"]
+    )
+
+
+def test_backend_errors_degrade_to_misses():
+    assert asyncio.run(_broken_backend()) == (MISS, "omi", 2)
@@ -0,0 +1,80 @@
+"""
+Tests for document-scale tone marking.
+"""
+
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.services import tone_lexicon
+from app.services.tone_document import (
+    ToneMarkingPool,
+    iter_sentence_chunks,
+    split_point
+)
+from app.services.tone_lexicon import ToneLexicon, set_tone_lexicon
+from app.services.tone_service import add_tone_marks
+
+DOCUMENT = "Omo mi ti lo si oja. Baba re ko je ounje!\n" * 500
+
+
+async def _byte_stream(data: bytes, size: int = 1000):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def test_split_point_prefers_sentence_ends():
+    text = "omo mi ti lo. baba re ko je ounje oja"
+    assert split_point(text, 20) == len("omo mi ti lo. ")
+    assert split_point("omo mi", 20) == 0
+
+
+async def _mark_document():
+    # Odd sizes split multi-byte characters across reads
+    stream = _byte_stream(DOCUMENT.encode("utf-8"), size=997)
+    chunks = iter_sentence_chunks(stream, target=500)
+    pool = ToneMarkingPool(workers=0)
+    results = [r async for r in pool.mark_stream(chunks, "lexicon")]
+    return results, pool.stats()
+
+
+def test_document_chunks_are_marked_in_order():
+    results, stats = asyncio.run(_mark_document())
+
+    assert "".join(results) == add_tone_marks(DOCUMENT)
+    assert len(results) == stats["chunks"] > 1
+    assert all(r[-1].isspace() for r in results[:-1])
+
+
+async def _mark_in_processes():
+    pool = ToneMarkingPool(workers=1)
+    try:
+        set_tone_lexicon(ToneLexicon({"ile": "ilé"}, "first"))
+        first = await pool.mark("ile omo", "lexicon")
+        # A new lexicon retires the processes started with the old one
+        set_tone_lexicon(ToneLexicon({"omo": "ọmọ"}, "second"))
+        second = await pool.mark("ile omo", "lexicon")
+        restarts = pool.restarts
+
+        # A process dying breaks the pool; the next chunk gets a new one
+        with pytest.raises(BrokenProcessPool):
+            await pool._run(os._exit, 1)
+        recovered = await pool.mark("ile omo", "lexicon")
+        return first, second, restarts, recovered, pool.stats()
+    finally:
+        pool.shutdown()
+
+
+def test_pool_processes_follow_the_lexicon_and_recover(monkeypatch):
+    monkeypatch.setattr(tone_lexicon, "_current", None)
+    first, second, restarts, recovered, stats = asyncio.run(
+        _mark_in_processes()
+    )
+
+    assert first == "ilé omo"
+    assert second == "ile ọmọ"
+    assert restarts == 1
+    assert recovered == "ile ọmọ"
+    assert stats["restarts"] == 2
@@ -0,0 +1,118 @@
+"""
+Tests for the content-addressed tone marking history.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, text
+
+from app.database import ToneMarking
+from app.services.pagination import keyset_page
+from app.services.tone_history import (
+    compact_tone_history,
+    upgrade_tone_history,
+    write_tone_markings
+)
+
+START = datetime(2026, 1, 1)
+
+
+def _row(text: str, minutes: int, marked: str = None):
+    return {
+        "original_text": text,
+        "tone_marked_text": marked or text.upper(),
+        "created_at": START + timedelta(minutes=minutes),
+    }
+
+
+async def _history(engine):
+    async with engine.connect() as conn:
+        rows = (await conn.execute(
+            select(
+                ToneMarking.original_text,
+                ToneMarking.tone_marked_text,
+                ToneMarking.hit_count,
+                ToneMarking.last_seen_at
+            ).order_by(ToneMarking.original_text)
+        )).all()
+    return [tuple(row) for row in rows]
+
+
+async def _write_history(session_factory):
+    async with session_factory() as db:
+        await write_tone_markings(
+            db, [_row("omo", 0), _row("baba", 1), _row("omo", 2)]
+        )
+        await write_tone_markings(db, [_row("omo", 5, "ọmọ"), _row("ile", 3)])
+        await db.commit()
+
+
+def test_history_keeps_one_row_per_input(run_db):
+    async def scenario(engine, session_factory):
+        await _write_history(session_factory)
+        return await _history(engine)
+
+    assert run_db(scenario) == [
+        ("baba", "BABA", 1, START + timedelta(minutes=1)),
+        ("ile", "ILE", 1, START + timedelta(minutes=3)),
+        ("omo", "ọmọ", 3, START + timedelta(minutes=5)),
+    ]
+
+
+def test_history_pages_by_recency(run_db):
+    async def scenario(engine, session_factory):
+        await _write_history(session_factory)
+        pages = []
+        cursor = None
+        async with session_factory() as db:
+            while True:
+                rows, _, cursor = await keyset_page(
+                    db, select(ToneMarking), ToneMarking.id, 2,
+                    cursor=cursor, descending=True,
+                    sort_column=ToneMarking.last_seen_at
+                )
+                pages.append([row.original_text for row in rows])
+                if not cursor:
+                    return pages
+
+    assert run_db(scenario) == [["omo", "ile"], ["baba"]]
+
+
+def test_compaction_keeps_the_most_recent_rows(run_db):
+    async def scenario(engine, session_factory):
+        await _write_history(session_factory)
+        deleted = await compact_tone_history(
+            engine, retention_days=0, max_rows=2
+        )
+        return deleted, await _history(engine)
+
+    deleted, compacted = run_db(scenario)
+    assert deleted == 1
+    assert [row[0] for row in compacted] == ["ile", "omo"]
+
+
+def test_upgrade_folds_legacy_duplicate_rows(run_db):
+    async def scenario(engine, session_factory):
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "CREATE TABLE tone_markings (id INTEGER PRIMARY KEY, "
+                "original_text TEXT NOT NULL, "
+                "tone_marked_text TEXT NOT NULL, created_at DATETIME)"
+            ))
+            for i, word in enumerate(["omo", "baba", "omo", "omo", "baba"]):
+                await conn.execute(
+                    text("INSERT INTO tone_markings (original_text, "
+                         "tone_marked_text, created_at) VALUES (:t, :m, :c)"),
+                    {"t": word, "m": word.upper(),
+                     "c": str(START + timedelta(minutes=i))}
+                )
+        # Small chunks so duplicates span chunks
+        removed = await upgrade_tone_history(engine, chunk_size=2)
+        return removed, await _history(engine)
+
+    removed, history = run_db(scenario, create_tables=False)
+    assert removed == 3
+    assert [(r[0], r[2], r[3]) for r in history] == [
+        ("baba", 2, START + timedelta(minutes=4)),
+        ("omo", 3, START + timedelta(minutes=3)),
+    ]
@@ -0,0 +1,91 @@
+"""
+Tests for the data-driven tone lexicon.
+"""
+
+import asyncio
+import io
+from collections import Counter
+
+from app.services import tone_lexicon
+from app.services.tone_lexicon import (
+    build_lexicon,
+    iter_lexicon_file,
+    reload_tone_lexicon
+)
+
+LEXICON_FILE = """# comment
+oko\tọkọ
+ọkọ̀
+ọkọ̀
+àwọn ọmọ
+
+bad key\tx
+"""
+
+
+def test_lexicon_file_derives_keys_and_prefers_frequent_forms():
+    counts = Counter(iter_lexicon_file(io.StringIO(LEXICON_FILE)))
+    lexicon = build_lexicon(counts, "test")
+
+    assert dict(lexicon.items()) == {
+        "oko": "ọkọ̀", "awon": "àwọn", "omo": "ọmọ"
+    }
+    assert lexicon.mark("Awon oko, omo!") == "àwọn ọkọ̀, ọmọ!"
+
+
+def test_lexicon_is_capped_to_most_frequent_keys():
+    counts = Counter({("a", "à"): 5, ("b", "bá"): 1, ("d", "dá"): 3})
+    lexicon = build_lexicon(counts, "test", max_entries=2)
+
+    assert sorted(dict(lexicon.items())) == ["a", "d"]
+    assert lexicon.version != build_lexicon(counts, "test").version
+
+
+def _reset_lexicon(monkeypatch):
+    for name in ("_current", "_fingerprint", "_active_source", "_reload_lock"):
+        monkeypatch.setattr(tone_lexicon, name, None)
+
+
+def test_refresh_keeps_the_source_of_the_last_reload(tmp_path, monkeypatch):
+    _reset_lexicon(monkeypatch)
+    path = tmp_path / "lexicon.tsv"
+    path.write_text("ile\tilé\n", encoding="utf-8")
+
+    async def scenario():
+        chosen = await reload_tone_lexicon(source="file", path=str(path))
+        unchanged = await reload_tone_lexicon(force=False)
+        path.write_text("ile\tilé\nomo\tọmọ\n", encoding="utf-8")
+        refreshed = await reload_tone_lexicon(force=False)
+        return chosen, unchanged, refreshed
+
+    chosen, unchanged, refreshed = asyncio.run(scenario())
+    assert chosen.source == f"file:{path}"
+    assert unchanged is chosen
+    # The periodic refresh re-read the chosen file, not the configured one
+    assert refreshed.source == f"file:{path}"
+    assert dict(refreshed.items()) == {"ile": "ilé", "omo": "ọmọ"}
+
+
+def test_concurrent_reloads_rebuild_once(tmp_path, monkeypatch):
+    _reset_lexicon(monkeypatch)
+    path = tmp_path / "lexicon.tsv"
+    path.write_text("ile\tilé\n", encoding="utf-8")
+    builds = []
+    load = tone_lexicon.load_lexicon_file
+
+    def counting_load(*args):
+        builds.append(args)
+        return load(*args)
+
+    monkeypatch.setattr(tone_lexicon, "load_lexicon_file", counting_load)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            reload_tone_lexicon(source="file", path=str(path))
+            for _ in range(5)
+        ))
+
+    lexicons = asyncio.run(scenario())
+    # Callers that queued behind the first reload reuse its result
+    assert len(builds) == 1
+    assert all(lexicon is lexicons[0] for lexicon in lexicons)
@@ -0,0 +1,100 @@
+"""
+Tests for the tone marking routes.
+"""
+
+import pytest
+
+from app.services import tone_service
+from app.services.tone_model import ToneModel
+
+CORPUS = [
+    "mo ra ọkọ̀ tuntun",
+    "ọkọ rẹ̀ wà ní oko",
+] * 3
+
+
+@pytest.fixture
+def ngram_model(monkeypatch):
+    model = ToneModel.train(CORPUS)
+    monkeypatch.setattr(tone_service, "_tone_model", model)
+    return model
+
+
+@pytest.fixture
+def no_ngram_model(monkeypatch):
+    monkeypatch.setattr(tone_service, "_tone_model", None)
+
+
+def test_tone_mark_uses_the_requested_engine(client, ngram_model):
+    response = client.post("/api/v1/tone-mark", json={
+        "text": "mo ra oko tuntun", "engine": "ngram", "budget_ms": 500
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["engine"] == "ngram"
+    assert data["tone_marked_text"] == "mo ra ọkọ̀ tuntun"
+
+
+@pytest.mark.parametrize("body", [
+    {"text": "omo", "engine": "braille"},
+    {"text": "omo", "engine": "ngram", "budget_ms": 0},
+])
+def test_tone_mark_rejects_bad_engine_options(
+    client, ngram_model, body
+):
+    assert client.post("/api/v1/tone-mark", json=body).status_code == 400
+
+
+def test_tone_mark_without_a_model_is_unavailable(client, no_ngram_model):
+    response = client.post(
+        "/api/v1/tone-mark", json={"text": "omo", "engine": "ngram"}
+    )
+    assert response.status_code == 503
+
+
+def test_batch_without_a_model_is_unavailable(client, no_ngram_model):
+    response = client.post(
+        "/api/v1/tone-mark/batch", json={"texts": ["omo"], "engine": "ngram"}
+    )
+    assert response.status_code == 503
+
+
+def test_engines_report_availability(client, no_ngram_model):
+    response = client.get("/api/v1/tone-mark/engines")
+    assert response.status_code == 200
+    engines = {engine["name"]: engine for engine in response.json()}
+    assert engines["lexicon"]["available"]
+    assert engines["lexicon"]["version"]
+    assert not engines["ngram"]["available"]
+    assert engines["ngram"]["version"] is None
+
+
+def test_batch_with_a_versionless_engine_is_unavailable(
+    client, monkeypatch
+):
+    # The engine check passed, then the model went away
+    monkeypatch.setattr(
+        "app.routes.tone_marking.engine_version", lambda engine: None
+    )
+    response = client.post("/api/v1/tone-mark/batch", json={"texts": ["omo"]})
+    assert response.status_code == 503
+
+
+def test_lexicon_reload_requires_the_api_key(client, admin_headers):
+    reload_url = "/api/v1/tone-mark/lexicon/reload?source=file"
+    assert client.post(reload_url).status_code == 401
+
+    response = client.post(reload_url, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["version"]
+
+
+def test_admin_routes_are_closed_without_a_configured_key(
+    client, monkeypatch
+):
+    monkeypatch.setattr("app.auth.settings.api_key", None)
+    response = client.post(
+        "/api/v1/tone-mark/lexicon/reload",
+        headers={"X-API-Key": ""}
+    )
+    assert response.status_code == 403
@@ -0,0 +1,48 @@
+"""
+Tests for the n-gram tone restoration model.
+"""
+
+import time
+
+from app.services.tone_model import ToneModel
+
+CORPUS = [
+    "ọkọ̀ mi dé",
+    "mo ra ọkọ̀ tuntun",
+    "ọkọ mi lọ sí oko",
+    "ọkọ rẹ̀ wà ní oko",
+    "wọ́n ń ṣiṣẹ́ ní oko",
+    "wọ́n ń ṣiṣẹ́ ní oko",
+] * 3
+
+
+def test_restore_uses_context_to_pick_homographs(tmp_path):
+    path = str(tmp_path / "tone_model.bin")
+    ToneModel.train(CORPUS).save(path)
+    model = ToneModel.load(path)
+
+    assert model.restore("mo ra oko tuntun") == "mo ra ọkọ̀ tuntun"
+    assert model.restore("Oko re wa ni oko.") == "Ọkọ rẹ̀ wà ní oko."
+    assert model.restore("xyz, Abc") == "xyz, Abc"
+    assert model.version
+
+
+def test_restore_falls_back_to_most_frequent_form_after_deadline():
+    model = ToneModel.train(CORPUS)
+
+    expired = time.perf_counter() - 1
+    assert model.restore("mo ra oko", deadline=expired) == "mo ra oko"
+
+
+def test_restore_reports_whether_it_finished_in_time():
+    model = ToneModel.train(CORPUS)
+
+    expired = time.perf_counter() - 1
+    assert model.restore_with_status("mo ra oko") == ("mo ra ọkọ̀", True)
+    assert model.restore_with_status("mo ra oko", deadline=expired) == (
+        "mo ra oko", False
+    )
+    # Nothing to decode, so nothing was cut short
+    assert model.restore_with_status("xyz", deadline=expired) == (
+        "xyz", True
+    )
@@ -0,0 +1,69 @@
+"""
+Tests for the tone marking service.
+"""
+
+import asyncio
+import random
+import re
+
+from app.services.tone_lexicon import (
+    DEFAULT_LEXICON_PATH,
+    load_lexicon_file
+)
+from app.services.tone_service import (
+    add_tone_marks,
+    cache_tone_marks,
+    cached_tone_marks
+)
+
+TONE_PATTERNS = dict(load_lexicon_file(DEFAULT_LEXICON_PATH).items())
+
+
+def _per_pattern(text: str) -> str:
+    """Reference: one case-insensitive re.sub per lexicon word."""
+    for pattern, replacement in TONE_PATTERNS.items():
+        text = re.sub(
+            r'\b' + re.escape(pattern) + r'\b',
+            replacement,
+            text,
+            flags=re.IGNORECASE
+        )
+    return text
+
+
+def test_add_tone_marks():
+    assert add_tone_marks("Omo mi ti lo") == "ọmọ mi tí lo"
+    assert add_tone_marks("BABA, MAMA!") == "bàbá, màmá!"
+    assert add_tone_marks("omoomo ko_ se") == "omoomo ko_ ṣe"
+    assert add_tone_marks("") == ""
+
+
+def test_single_pass_matches_per_pattern_output():
+    rng = random.Random(0)
+    alphabet = "omabrewntiskjOMABKſK ọ́-_,.\n1"
+    for _ in range(2000):
+        text = "".join(
+            rng.choice(alphabet) for _ in range(rng.randint(0, 30))
+        )
+        assert add_tone_marks(text) == _per_pattern(text)
+
+
+async def _cache_round_trip():
+    texts = ["omo mi", "baba", "omo mi", "baba"]
+    first = await cached_tone_marks(texts, "lexicon", "v1")
+
+    await cache_tone_marks(
+        first[1], ["ọmọ mi", "bàbá"], "lexicon", "v1"
+    )
+    second = await cached_tone_marks(texts + ["ile"], "lexicon", "v1")
+    # A new lexicon version never sees the old results
+    other_version = await cached_tone_marks(texts, "lexicon", "v2")
+    return first, second, other_version
+
+
+def test_cached_tone_marks_dedupes_and_keys_by_version():
+    first, second, other_version = asyncio.run(_cache_round_trip())
+
+    assert first == ({}, ["omo mi", "baba"])
+    assert second == ({"omo mi": "ọmọ mi", "baba": "bàbá"}, ["ile"])
+    assert other_version[0] == {}
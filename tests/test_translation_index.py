@@ -0,0 +1,112 @@
+"""
+Tests for the in-memory translation lookup index.
+"""
+
+import asyncio
+
+from app.database import Translation
+from app.services.translation_index import TranslationIndex
+
+
+def _translation(id, english_word, yoruba_word):
+    return Translation(
+        id=id,
+        english_word=english_word,
+        yoruba_word=yoruba_word,
+        part_of_speech="noun"
+    )
+
+
+def _index():
+    index = TranslationIndex()
+    index.add(_translation(1, "thank you", "Ẹ ṣeun"))
+    index.add(_translation(2, "water", "omi"))
+    index.add(_translation(3, "Love", "ifẹ́"))
+    index.add(_translation(4, "waterfall", "omi ṣíṣàn"))
+    return index
+
+
+def test_exact_match_is_case_and_space_insensitive():
+    index = _index()
+    assert index.lookup("  LOVE ")["yoruba_word"] == "ifẹ́"
+    assert index.lookup("thank   you")["id"] == 1
+
+
+def test_exact_match_wins_over_prefix():
+    assert _index().lookup("water")["id"] == 2
+
+
+def test_prefix_then_substring_fallback():
+    index = _index()
+    assert index.lookup("waterf")["id"] == 4
+    assert index.lookup("ank")["id"] == 1
+    assert index.lookup("xyz") is None
+
+
+def test_duplicate_words_keep_first_row():
+    index = _index()
+    index.add(_translation(5, "water", "omi tuntun"))
+    assert index.lookup("water")["id"] == 2
+    assert len(index) == 4
+
+
+def test_substring_lookup_sees_new_rows():
+    index = _index()
+    assert index.lookup("ship") is None
+    index.add(_translation(6, "friendship", "ọ̀rẹ́"))
+    assert index.lookup("ship")["id"] == 6
+
+
+def test_load_and_refresh_keep_keys_sorted(run_db):
+    async def scenario(engine, session_factory):
+        index = TranslationIndex()
+        async with session_factory() as db:
+            db.add_all([
+                Translation(english_word=word, yoruba_word=word.upper())
+                for word in ("water", "child", "house", "Water", "bread")
+            ])
+            await db.commit()
+            loaded = await index.load(db, batch_size=2)
+
+            db.add_all([
+                Translation(english_word=word, yoruba_word=word.upper())
+                for word in ("apple", "waterfall", "house", "zebra")
+            ])
+            await db.commit()
+            refreshed = await index.refresh(db, batch_size=3)
+        return index, loaded, refreshed
+
+    index, loaded, refreshed = run_db(scenario)
+    assert (loaded, refreshed) == (5, 4)
+    assert index._sorted_keys == [
+        "apple", "bread", "child", "house", "water", "waterfall", "zebra"
+    ]
+    # Duplicates keep the oldest row
+    assert index.get("water")["yoruba_word"] == "WATER"
+    assert index.get("house")["id"] == 3
+    assert index.lookup("waterf")["yoruba_word"] == "WATERFALL"
+    assert index.lookup("ebr")["yoruba_word"] == "ZEBRA"
+
+
+def test_lookups_see_the_old_index_while_reloading(run_db):
+    async def scenario(engine, session_factory):
+        index = TranslationIndex()
+        async with session_factory() as db:
+            db.add_all([
+                Translation(english_word=f"word {i}", yoruba_word=f"ọ̀rọ̀ {i}")
+                for i in range(20)
+            ])
+            await db.commit()
+            await index.load(db)
+
+            reload = asyncio.ensure_future(index.load(db, batch_size=2))
+            seen = []
+            while not reload.done():
+                seen.append(index.lookup("word 19") is not None)
+                await asyncio.sleep(0)
+            await reload
+        return seen, len(index)
+
+    seen, size = run_db(scenario)
+    assert seen and all(seen)
+    assert size == 20
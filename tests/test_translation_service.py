@@ -0,0 +1,84 @@
+"""
+Tests for the translation lookup chain's caches.
+"""
+
+import asyncio
+from datetime import datetime
+
+from app.database import Translation
+from app.services.cache import MISS
+from app.services.translation_index import TranslationIndex
+from app.services.translation_service import (
+    lookup_translations,
+    remember_translation,
+    translation_cache,
+    translation_index,
+    translation_misses
+)
+
+
+def _translation(id, english_word, yoruba_word):
+    now = datetime(2026, 3, 1)
+    return Translation(
+        id=id,
+        english_word=english_word,
+        yoruba_word=yoruba_word,
+        created_at=now,
+        updated_at=now
+    )
+
+
+def test_new_translation_keeps_cached_words():
+    async def scenario():
+        await translation_cache.set(
+            "cached-word", ({"id": 1}, "database")
+        )
+        await translation_misses.set("new-wo", None)
+        await remember_translation(
+            _translation(2, "new-word", "ọ̀rọ̀ tuntun")
+        )
+        return (
+            await translation_cache.get("cached-word"),
+            await translation_cache.get("new-word"),
+            await translation_misses.get("new-wo")
+        )
+
+    cached, added, missed = asyncio.run(scenario())
+    assert cached == ({"id": 1}, "database")
+    assert added[0]["yoruba_word"] == "ọ̀rọ̀ tuntun"
+    # The miss may now match the new word by prefix
+    assert missed is MISS
+
+
+def test_batch_lookup_before_the_index_matches_like_the_index(
+    run_db, monkeypatch
+):
+    monkeypatch.setattr(translation_index, "loaded", False)
+    words = ["matchsun", "matchwater", "wood", "matchmoon"]
+
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            db.add_all([
+                Translation(english_word=english, yoruba_word=yoruba)
+                for english, yoruba in (
+                    ("matchwaterfall", "ìṣàn omi"),
+                    ("matchsunflower", "òdòdó oòrùn"),
+                    ("MatchSun", "oòrùn"),
+                    ("matchfirewood", "igi iná"),
+                )
+            ])
+            await db.commit()
+            found = await lookup_translations(words, db)
+            index = TranslationIndex()
+            await index.load(db)
+        return found, index
+
+    found, index = run_db(scenario)
+    assert {
+        key: entry["yoruba_word"] for key, (entry, _) in found.items()
+    } == {"matchsun": "oòrùn", "matchwater": "ìṣàn omi", "wood": "igi iná"}
+    # The loaded index picks the same rows
+    assert {
+        word: index.lookup(word)["id"] for word in words
+        if index.lookup(word)
+    } == {key: entry["id"] for key, (entry, _) in found.items()}
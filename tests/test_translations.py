@@ -0,0 +1,106 @@
+"""
+Tests for the batch translation route.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.routes import translations
+from app.services.resilience import DeadlineExceededError
+
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    for english, yoruba in (("batchwater", "omi"), ("batchfire", "iná")):
+        response = client.post("/api/v1/translations", json={
+            "english_word": english, "yoruba_word": yoruba
+        })
+        assert response.status_code == 200
+
+
+@pytest.fixture
+def fake_ai(monkeypatch):
+    calls = []
+
+    async def translate_with_ai(word):
+        calls.append(word)
+        if word == "batchflaky":
+            raise RuntimeError("model overloaded")
+        now = datetime(2026, 3, 1)
+        entry = {
+            "id": None,
+            "english_word": word,
+            "yoruba_word": f"{word}-yo",
+            "part_of_speech": None,
+            "example_sentence": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        return entry, "ai_fallback"
+
+    monkeypatch.setattr(translations, "is_ai_available", lambda: True)
+    monkeypatch.setattr(translations, "translate_with_ai", translate_with_ai)
+    return calls
+
+
+def _batch(client, words, use_ai=False):
+    response = client.post(
+        "/api/v1/translate/batch", json={"words": words, "use_ai": use_ai}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_batch_returns_one_result_per_word_in_order(client, seeded):
+    data = _batch(client, ["batchfire", "batchnothing", "BatchWater"])
+
+    assert [item["word"] for item in data["results"]] == [
+        "batchfire", "batchnothing", "BatchWater"
+    ]
+    assert [item["source"] for item in data["results"]] == [
+        "database", "not_found", "database"
+    ]
+    assert data["results"][0]["translation"]["yoruba_word"] == "iná"
+    assert data["results"][1]["translation"] is None
+    assert data["results"][2]["translation"]["yoruba_word"] == "omi"
+    assert (data["total"], data["found"]) == (3, 2)
+
+
+def test_batch_resolves_repeated_words_once(client, seeded, fake_ai):
+    data = _batch(
+        client,
+        ["batchwater", " BATCHWATER ", "batchnew", "BatchNew"],
+        use_ai=True
+    )
+
+    # Repeats share the first spelling's AI call
+    assert fake_ai == ["batchnew"]
+    assert [item["source"] for item in data["results"]] == [
+        "database", "database", "ai_fallback", "ai_fallback"
+    ]
+    assert data["results"][3]["translation"]["yoruba_word"] == "batchnew-yo"
+    assert (data["total"], data["found"]) == (4, 4)
+
+
+def test_batch_reports_ai_errors_per_word(client, seeded, fake_ai):
+    data = _batch(client, ["batchflaky", "batchfire"], use_ai=True)
+
+    flaky, fire = data["results"]
+    assert flaky["source"] == "error"
+    assert flaky["translation"] is None
+    assert flaky["detail"] == "AI translation failed: model overloaded"
+    assert fire["source"] == "database"
+    assert data["found"] == 1
+
+
+def test_ai_deadline_is_a_gateway_timeout(client, monkeypatch):
+    async def translate_with_ai(word):
+        raise DeadlineExceededError("AI translation exceeded its deadline")
+
+    monkeypatch.setattr(translations, "is_ai_available", lambda: True)
+    monkeypatch.setattr(translations, "translate_with_ai", translate_with_ai)
+
+    response = client.get("/api/v1/translate?word=slowword&use_ai=true")
+    assert response.status_code == 504
+    assert "deadline" in response.json()["detail"]
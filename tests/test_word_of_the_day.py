@@ -0,0 +1,99 @@
+"""
+Tests for the word of the day.
+"""
+
+import json
+from datetime import datetime
+
+from app.database import Translation
+from app.services.http_cache import etag_matches, strong_etag
+from app.services.shared_cache import LocalCacheBackend, SharedCache
+from app.services.word_of_the_day import (
+    WordOfTheDay,
+    seconds_until_midnight
+)
+
+WORDS = [
+    ("water", "omi"),
+    ("child", "ọmọ"),
+    ("house", "ilé"),
+    ("father", "bàbá"),
+    ("mother", "ìyá"),
+]
+
+
+async def _add_words(session_factory):
+    async with session_factory() as db:
+        db.add_all([
+            Translation(english_word=english, yoruba_word=yoruba)
+            for english, yoruba in WORDS
+        ])
+        await db.commit()
+
+
+def _replica(backend) -> WordOfTheDay:
+    return WordOfTheDay(SharedCache("wotd", backend, ttl=None))
+
+
+def test_empty_table_has_no_word(run_db):
+    async def scenario(engine, session_factory):
+        async with session_factory() as db:
+            return await _replica(LocalCacheBackend()).get(
+                db, datetime(2026, 3, 1, 8)
+            )
+
+    assert run_db(scenario) is None
+
+
+def test_word_changes_across_days(run_db):
+    async def scenario(engine, session_factory):
+        await _add_words(session_factory)
+        replica = _replica(LocalCacheBackend())
+        async with session_factory() as db:
+            return [
+                await replica.get(db, datetime(2026, 3, d, 8))
+                for d in range(1, 15)
+            ]
+
+    picks = run_db(scenario)
+    words = {json.loads(body)["word"] for body, _ in picks}
+    assert len(words) > 1
+    assert words <= {yoruba for _, yoruba in WORDS}
+
+    body, etag = picks[-1]
+    assert etag == strong_etag(body)
+    entry = json.loads(body)
+    assert set(entry) == {"word", "translation", "part_of_speech", "example"}
+    assert entry["part_of_speech"] == ""
+
+
+def test_word_is_memoized_for_the_day_across_replicas(run_db):
+    async def scenario(engine, session_factory):
+        await _add_words(session_factory)
+        backend = LocalCacheBackend()
+        replica_a, replica_b = _replica(backend), _replica(backend)
+        async with session_factory() as db:
+            first = await replica_a.get(db, datetime(2026, 3, 14, 8))
+            again = await replica_a.get(db, datetime(2026, 3, 14, 23, 59))
+            shared = await replica_b.get(db, datetime(2026, 3, 14, 1))
+        return first, again, shared, replica_a.picks, replica_b.picks
+
+    first, again, shared, picks_a, picks_b = run_db(scenario)
+    assert again == first
+    assert shared == first
+    assert (picks_a, picks_b) == (1, 0)
+
+
+def test_seconds_until_midnight():
+    assert seconds_until_midnight(datetime(2026, 3, 1, 0, 0)) == 86400
+    assert seconds_until_midnight(datetime(2026, 3, 1, 23, 0)) == 3600
+    assert seconds_until_midnight(datetime(2026, 3, 1, 23, 59, 59, 500)) == 1
+
+
+def test_etag_matches():
+    etag = strong_etag(b"{}")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
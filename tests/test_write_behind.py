@@ -0,0 +1,80 @@
+"""
+Tests for the write-behind history buffer.
+"""
+
+import asyncio
+
+from sqlalchemy import select
+
+from app.database import ToneMarking
+from app.services.write_behind import WriteBehindBuffer
+
+
+def _buffer(session_factory) -> WriteBehindBuffer:
+    return WriteBehindBuffer(
+        ToneMarking,
+        max_size=4,
+        batch_size=2,
+        flush_interval=60,
+        session_factory=session_factory
+    )
+
+
+def _rows(count: int):
+    return (
+        {"original_text": f"omo {i}", "tone_marked_text": f"ọmọ {i}"}
+        for i in range(count)
+    )
+
+
+async def _stored(session_factory):
+    async with session_factory() as db:
+        return (await db.scalars(
+            select(ToneMarking).order_by(ToneMarking.id)
+        )).all()
+
+
+def test_full_batch_flushes_before_the_interval(run_db):
+    async def scenario(engine, session_factory):
+        buffer = _buffer(session_factory)
+        buffer.start()
+        buffer.add_many(_rows(2))
+        # A full batch wakes the flush task without waiting for the interval
+        for _ in range(100):
+            if buffer.written:
+                break
+            await asyncio.sleep(0.01)
+        written = buffer.written
+        await buffer.stop()
+        return written
+
+    assert run_db(scenario) == 2
+
+
+def test_stop_drains_the_buffer(run_db):
+    async def scenario(engine, session_factory):
+        buffer = _buffer(session_factory)
+        buffer.start()
+        buffer.add_many(_rows(3))
+        await buffer.stop()
+        return buffer, await _stored(session_factory)
+
+    buffer, rows = run_db(scenario)
+    assert [r.original_text for r in rows] == [f"omo {i}" for i in range(3)]
+    assert all(r.created_at for r in rows)
+    assert buffer.stats()["written"] == 3
+    assert len(buffer) == 0
+
+
+def test_overflow_is_dropped(run_db):
+    async def scenario(engine, session_factory):
+        buffer = _buffer(session_factory)
+        buffer.start()
+        added = buffer.add_many(_rows(5))
+        await buffer.stop()
+        return added, buffer, await _stored(session_factory)
+
+    added, buffer, rows = run_db(scenario)
+    assert added == 4
+    assert buffer.stats()["dropped"] == 1
+    assert [r.original_text for r in rows] == [f"omo {i}" for i in range(4)]